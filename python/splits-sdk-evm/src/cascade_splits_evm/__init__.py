@@ -1,15 +1,3 @@
-# Suppress websockets deprecation warning from web3.py (ethereum/web3.py#3530)
-# web3.py unconditionally imports LegacyWebSocketProvider even for HTTP-only usage.
-# This will be fixed in web3.py v8. Remove this filter after upgrading.
-import warnings
-
-warnings.filterwarnings(
-    "ignore",
-    message="websockets.legacy is deprecated",
-    category=DeprecationWarning,
-    module=r"websockets\.legacy",
-)
-
 """
 Cascade Splits EVM SDK
 
@@ -36,6 +24,11 @@ Usage (async - recommended):
 
     asyncio.run(main())
 
+    # With a websocket endpoint, receipts are awaited per block (newHeads)
+    # instead of polled:
+    async with AsyncCascadeSplitsClient(rpc_url="wss://...", private_key="0x...") as client:
+        ...
+
 Usage (sync):
     from cascade_splits_evm import CascadeSplitsClient, Recipient
 
@@ -62,8 +55,10 @@ Low-level async functions:
     result = await ensure_split(w3, account, factory_address, params)
 """
 
-# Async helpers (for use with AsyncWeb3)
-from . import async_helpers
+import warnings
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from ._exceptions import (
     CascadeSplitsError,
     ChainNotSupportedError,
@@ -78,16 +73,14 @@ from ._version import __version__
 # ABIs (for advanced usage)
 from .abi import SPLIT_CONFIG_IMPL_ABI, SPLIT_FACTORY_ABI
 
-# Async client (recommended)
-from .async_client import AsyncCascadeSplitsClient
-
-# Sync client (for simple scripts)
-from .client import CascadeSplitsClient
-
 # Constants
 from .constants import (
     MAX_RECIPIENTS,
     MIN_RECIPIENTS,
+    MULTICALL_BATCH_SIZE,
+    MULTICALL_BATCH_WINDOW,
+    RECEIPT_POLL_LATENCY,
+    RECEIPT_TIMEOUT,
     SPLIT_FACTORY_ADDRESSES,
     SUPPORTED_CHAIN_IDS,
     USDC_ADDRESSES,
@@ -96,24 +89,8 @@ from .constants import (
     is_supported_chain,
 )
 
-# Standalone async operations
-from .ensure import ensure_split
-from .execute import execute_split
-
-# Sync helpers (for use with sync Web3)
-from .helpers import (
-    get_default_token,
-    get_pending_amount,
-    get_split_balance,
-    get_split_config,
-    get_total_unclaimed,
-    has_pending_funds,
-    is_cascade_split,
-    predict_split_address,
-    preview_execution,
-    to_evm_recipient,
-    to_evm_recipients,
-)
+# Memoized split checks
+from .split_cache import SplitCache
 
 # Types
 from .types import (
@@ -130,21 +107,135 @@ from .types import (
     Recipient,
     SkippedReason,
     SplitConfig,
+    SplitSnapshot,
 )
 
+# Everything that needs web3 / eth_account / aiohttp is imported on first use
+# (PEP 562), so importing the package for constants and types stays cheap.
+# name -> submodule it lives in (the submodule itself for async_helpers)
+_LAZY_IMPORTS: dict[str, str] = {
+    # Async client (recommended)
+    "AsyncCascadeSplitsClient": "async_client",
+    "create_http_session": "async_client",
+    # Sync client (for simple scripts)
+    "CascadeSplitsClient": "client",
+    "create_requests_session": "client",
+    # Standalone async operations
+    "ensure_split": "ensure",
+    "execute_split": "execute",
+    # Cached EIP-1559 fees
+    "FeeCache": "fees",
+    "AsyncFeeCache": "fees",
+    # Concurrent eth_calls batched into Multicall3
+    "MulticallBatcher": "multicall_batcher",
+    # Local nonce tracking
+    "NonceManager": "nonce",
+    "AsyncNonceManager": "nonce",
+    # Multi-endpoint providers
+    "FailoverHTTPProvider": "providers",
+    "AsyncFailoverHTTPProvider": "providers",
+    # Sync helpers (for use with sync Web3)
+    "compute_optimistic_gas": "helpers",
+    "compute_split_address": "helpers",
+    "get_default_token": "helpers",
+    "get_pending_amount": "helpers",
+    "get_split_balance": "helpers",
+    "get_split_config": "helpers",
+    "get_split_snapshot": "helpers",
+    "get_split_snapshots": "helpers",
+    "get_total_unclaimed": "helpers",
+    "has_pending_funds": "helpers",
+    "is_cascade_split": "helpers",
+    "poll_receipt": "helpers",
+    "predict_split_address": "helpers",
+    "preview_execution": "helpers",
+    "to_evm_recipient": "helpers",
+    "to_evm_recipients": "helpers",
+    # Async helpers (for use with AsyncWeb3)
+    "async_helpers": "async_helpers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Suppress websockets deprecation warning from web3.py (ethereum/web3.py#3530)
+    # web3.py unconditionally imports LegacyWebSocketProvider even for HTTP-only usage.
+    # The warning fires once, when web3 is first imported, so the filter is scoped to
+    # that import instead of staying installed process-wide. Remove after upgrading to v8.
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="websockets.legacy is deprecated", category=DeprecationWarning)
+        module = import_module(f".{module_name}", __name__)
+
+    value = module if name == module_name else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from . import async_helpers
+    from .async_client import AsyncCascadeSplitsClient, create_http_session
+    from .client import CascadeSplitsClient, create_requests_session
+    from .ensure import ensure_split
+    from .execute import execute_split
+    from .fees import AsyncFeeCache, FeeCache
+    from .helpers import (
+        compute_optimistic_gas,
+        compute_split_address,
+        get_default_token,
+        get_pending_amount,
+        get_split_balance,
+        get_split_config,
+        get_split_snapshot,
+        get_split_snapshots,
+        get_total_unclaimed,
+        has_pending_funds,
+        is_cascade_split,
+        poll_receipt,
+        predict_split_address,
+        preview_execution,
+        to_evm_recipient,
+        to_evm_recipients,
+    )
+    from .multicall_batcher import MulticallBatcher
+    from .nonce import AsyncNonceManager, NonceManager
+    from .providers import AsyncFailoverHTTPProvider, FailoverHTTPProvider
+
 __all__ = [
     # Version
     "__version__",
     # Clients
     "AsyncCascadeSplitsClient",
     "CascadeSplitsClient",
+    "create_http_session",
+    "create_requests_session",
     # Standalone operations
     "ensure_split",
     "execute_split",
+    # Providers
+    "FailoverHTTPProvider",
+    "AsyncFailoverHTTPProvider",
+    # Nonce tracking
+    "NonceManager",
+    "AsyncNonceManager",
+    # Fee caching
+    "FeeCache",
+    "AsyncFeeCache",
+    # Split check caching
+    "SplitCache",
+    # Read batching
+    "MulticallBatcher",
     # Types
     "Recipient",
     "EvmRecipient",
     "SplitConfig",
+    "SplitSnapshot",
     "EnsureParams",
     "EnsureResult",
     "ExecuteOptions",
@@ -161,6 +252,10 @@ __all__ = [
     "SUPPORTED_CHAIN_IDS",
     "MIN_RECIPIENTS",
     "MAX_RECIPIENTS",
+    "RECEIPT_TIMEOUT",
+    "RECEIPT_POLL_LATENCY",
+    "MULTICALL_BATCH_WINDOW",
+    "MULTICALL_BATCH_SIZE",
     "get_split_factory_address",
     "get_usdc_address",
     "is_supported_chain",
@@ -170,11 +265,16 @@ __all__ = [
     "is_cascade_split",
     "get_split_balance",
     "get_split_config",
+    "get_split_snapshot",
+    "get_split_snapshots",
     "has_pending_funds",
     "get_pending_amount",
     "get_total_unclaimed",
     "preview_execution",
+    "poll_receipt",
     "predict_split_address",
+    "compute_split_address",
+    "compute_optimistic_gas",
     "get_default_token",
     # ABIs
     "SPLIT_FACTORY_ABI",
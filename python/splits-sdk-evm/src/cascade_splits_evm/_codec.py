@@ -0,0 +1,89 @@
+"""ABI codec, address checksumming and JSON decoding used by the SDK's raw call paths.
+
+Set CASCADE_SPLITS_FAST_CODEC=1 to use the compiled drop-ins from the
+`performance` extra (faster-eth-abi, faster-eth-utils). Falls back to
+eth-abi / eth-utils when the variable is unset or the packages are missing.
+
+JSON-RPC requests and responses are encoded / decoded with orjson whenever it
+is installed (also part of the `performance` extra). orjson reads integers
+beyond 64 bits as floats, so payloads that may hold one (and requests that do)
+go through the stdlib json module instead, keeping the results identical.
+"""
+
+import json
+import os
+import re
+from collections.abc import Mapping
+from typing import Any
+
+from eth_abi import decode as abi_decode
+from eth_abi import encode as abi_encode
+from eth_utils import to_checksum_address
+
+FAST_CODEC_ENV = "CASCADE_SPLITS_FAST_CODEC"
+FAST_CODEC = False
+
+if os.environ.get(FAST_CODEC_ENV) == "1":
+    try:
+        from faster_eth_abi import decode as abi_decode  # type: ignore[no-redef]
+        from faster_eth_abi import encode as abi_encode  # type: ignore[no-redef]
+        from faster_eth_utils import to_checksum_address  # type: ignore[no-redef]
+
+        FAST_CODEC = True
+    except ImportError:
+        pass
+
+try:
+    import orjson
+
+    FAST_JSON = True
+except ImportError:
+    FAST_JSON = False
+
+# A number token of 19+ digits: possibly beyond 64 bits, which orjson would round to a float.
+# Digit runs inside hex strings never follow ":", "," or "[" directly, so they don't match.
+_BIG_INT = re.compile(r"(?:^|[:,\[])\s*-?\d{19}")
+_BIG_INT_BYTES = re.compile(_BIG_INT.pattern.encode())
+
+
+def json_decode(raw: bytes | str) -> Any:
+    """Decode a JSON-RPC response body."""
+    if FAST_JSON:
+        big_int = _BIG_INT.search(raw) if isinstance(raw, str) else _BIG_INT_BYTES.search(raw)
+        if big_int is None:
+            return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the non-JSON types web3 puts in request params (as Web3JsonEncoder does)."""
+    if isinstance(obj, (bytes, bytearray)):
+        return "0x" + obj.hex()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(by_alias=True)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_encode(obj: Any) -> bytes:
+    """Encode a JSON-RPC request body."""
+    if FAST_JSON:
+        try:
+            return orjson.dumps(obj, default=_json_default)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which only the stdlib encoder handles
+            pass
+    return json.dumps(obj, default=_json_default, separators=(",", ":")).encode()
+
+
+__all__ = [
+    "FAST_CODEC",
+    "FAST_CODEC_ENV",
+    "FAST_JSON",
+    "abi_decode",
+    "abi_encode",
+    "json_decode",
+    "json_encode",
+    "to_checksum_address",
+]
@@ -2,6 +2,7 @@
 Contract ABIs for Cascade Splits EVM contracts.
 
 Derived from contracts/src/SplitFactory.sol and contracts/src/SplitConfigImpl.sol.
+Multicall3 ABI is the subset of https://github.com/mds1/multicall3 used for read batching.
 """
 
 # SplitFactory ABI
@@ -295,3 +296,46 @@ ERC20_ABI = [
         "stateMutability": "view",
     },
 ]
+
+# Multicall3 ABI (minimal for batching view calls)
+MULTICALL3_ABI = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            }
+        ],
+        "stateMutability": "payable",
+    },
+]
+
+# Functions by name (resolved once instead of scanning the ABI lists per call)
+FACTORY_ABI_BY_NAME = {fn["name"]: fn for fn in SPLIT_FACTORY_ABI if fn["type"] == "function"}
+SPLIT_CONFIG_ABI_BY_NAME = {fn["name"]: fn for fn in SPLIT_CONFIG_IMPL_ABI if fn["type"] == "function"}
+
+# Event topic0 hashes (keccak of the event signature), precomputed so receipt
+# log scans are a bytes comparison and importing this module stays keccak-free
+EVENT_TOPICS = {
+    "SplitConfigCreated": bytes.fromhex("8e448b86f45f15c6c7ad452579c6a301455252f0760e419c9809780c72b0e04f"),
+    "SplitExecuted": bytes.fromhex("c356eb5d2ff4831654c13affe916edb329b5146c30eb257b66fd928a2c59f2a6"),
+    "TransferFailed": bytes.fromhex("e95a45fef44357651d038b0c1a33619661d62274fa63e9d98f7d42a5934537d7"),
+    "UnclaimedCleared": bytes.fromhex("5fd5bece51218118653f12f149e29ca57611ccfc7bb0e067e386b0a79d0b9b7b"),
+}
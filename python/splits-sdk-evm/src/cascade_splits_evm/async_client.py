@@ -1,10 +1,21 @@
 """Async high-level client for Cascade Splits EVM SDK."""
 
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from typing import Any
+
+from aiohttp import ClientSession, TCPConnector
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from web3 import AsyncWeb3
+from web3.providers.persistent import WebSocketProvider
+from web3.providers.rpc import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
 
+from ._codec import json_decode, json_encode
 from ._exceptions import ChainNotSupportedError
+from .async_helpers import _read_current_implementation
 from .async_helpers import (
     get_pending_amount as _get_pending_amount,
 )
@@ -14,6 +25,12 @@ from .async_helpers import (
 from .async_helpers import (
     get_split_config as _get_split_config,
 )
+from .async_helpers import (
+    get_split_snapshot as _get_split_snapshot,
+)
+from .async_helpers import (
+    get_split_snapshots as _get_split_snapshots,
+)
 from .async_helpers import (
     get_total_unclaimed as _get_total_unclaimed,
 )
@@ -23,18 +40,30 @@ from .async_helpers import (
 from .async_helpers import (
     is_cascade_split as _is_cascade_split,
 )
-from .async_helpers import (
-    predict_split_address as _predict_split_address,
-)
 from .async_helpers import (
     preview_execution as _preview_execution,
 )
-from .async_helpers import (
-    to_evm_recipients,
+from .constants import (
+    RECEIPT_POLL_LATENCY,
+    get_split_factory_address,
+    get_usdc_address,
+    is_supported_chain,
 )
-from .constants import get_split_factory_address, get_usdc_address, is_supported_chain
 from .ensure import ensure_split as _ensure_split
 from .execute import execute_split as _execute_split
+from .fees import AsyncFeeCache
+from .helpers import (
+    _cached_split_address,
+    _compute_split_address,
+    _recipient_tuples,
+    _record_ensured,
+    _to_checksum_address,
+    normalize_unique_id,
+)
+from .multicall_batcher import MulticallBatcher
+from .nonce import AsyncNonceManager
+from .providers import AsyncFailoverHTTPProvider
+from .split_cache import SplitCache
 from .types import (
     EnsureParams,
     EnsureResult,
@@ -44,8 +73,103 @@ from .types import (
     GasOptions,
     Recipient,
     SplitConfig,
+    SplitSnapshot,
 )
 
+# HTTP connection pool for the async provider (keep-alive, DNS caching)
+HTTP_POOL_LIMIT = 50
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 60
+
+# Default number of in-flight operations for bulk methods
+DEFAULT_BULK_CONCURRENCY = 10
+
+
+def create_http_session(limit: int = HTTP_POOL_LIMIT, limit_per_host: int = 0) -> ClientSession:
+    """
+    Create a pooled keep-alive session (must be called inside the event loop).
+
+    Pass the same session to several AsyncCascadeSplitsClient instances to share
+    one connection pool between them; the caller closes it when done.
+
+    Args:
+        limit: Maximum number of simultaneous connections
+        limit_per_host: Maximum simultaneous connections to one endpoint (0 for no
+            cap), so a slow failover endpoint can't hold the whole shared pool
+    """
+    connector = TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+    )
+    return ClientSession(connector=connector, raise_for_status=True)
+
+
+class _PooledAsyncHTTPProvider(AsyncHTTPProvider):
+    """
+    AsyncHTTPProvider that reuses connections across requests.
+
+    web3's default session force-closes every connection, paying a TCP/TLS
+    handshake per RPC. Sessions are bound to an event loop, so the pooled
+    session is created lazily on first request in each loop, unless a shared
+    (caller-owned) session is given.
+    """
+
+    # Requests and responses go through orjson when available
+    encode_rpc_dict = staticmethod(json_encode)
+    decode_rpc_response = staticmethod(json_decode)
+
+    def __init__(self, endpoint_uri: str, session: ClientSession | None = None, **kwargs: Any) -> None:
+        super().__init__(endpoint_uri, **kwargs)
+        self._shared_session = session
+        self._pooled_loop: asyncio.AbstractEventLoop | None = None
+
+    async def _ensure_pooled_session(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._pooled_loop is loop:
+            return
+        if self._shared_session is not None:
+            await self.cache_async_session(self._shared_session)
+        else:
+            session = create_http_session()
+            if await self.cache_async_session(session) is not session:
+                # A session was already cached for this loop
+                await session.close()
+        self._pooled_loop = loop
+
+    async def _make_request(self, method: RPCEndpoint, request_data: bytes) -> bytes:
+        await self._ensure_pooled_session()
+        return await super()._make_request(method, request_data)
+
+    async def make_batch_request(
+        self, batch_requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        await self._ensure_pooled_session()
+        return await super().make_batch_request(batch_requests)
+
+    async def disconnect(self) -> None:
+        if self._shared_session is not None:
+            # The shared session belongs to the caller: forget it without closing
+            self._request_session_manager.session_cache.clear()
+        else:
+            await super().disconnect()
+        self._pooled_loop = None
+
+
+class _WebSocketProvider(WebSocketProvider):
+    """
+    WebSocketProvider that encodes requests and parses responses with orjson when available.
+
+    One persistent connection; web3's single listener task routes responses
+    by request id, so concurrent reads (e.g. asyncio.gather) are safe.
+    """
+
+    encode_rpc_dict = staticmethod(json_encode)
+
+    async def socket_recv(self) -> RPCResponse:
+        return json_decode(await self._ws.recv())
+
 
 class AsyncCascadeSplitsClient:
     """
@@ -77,19 +201,34 @@ class AsyncCascadeSplitsClient:
 
     def __init__(
         self,
-        rpc_url: str,
+        rpc_url: str | Sequence[str],
         private_key: str,
         chain_id: int = 8453,
         factory_address: str | None = None,
+        signing_executor: Executor | None = None,
+        session: ClientSession | None = None,
+        poll_latency: float = RECEIPT_POLL_LATENCY,
+        batch_rpcs: bool = False,
     ) -> None:
         """
         Initialize the async Cascade Splits client.
 
         Args:
-            rpc_url: RPC endpoint URL
+            rpc_url: RPC endpoint URL (http(s):// or ws(s)://; websocket endpoints
+                must be connected via `async with` or `connect()`), or several HTTP URLs
+                (primary first) to spread reads across and fail over between
             private_key: Private key for signing transactions
             chain_id: Chain ID (8453 for Base mainnet, 84532 for Base Sepolia)
             factory_address: Custom factory address (uses default if not provided)
+            signing_executor: Executor to sign transactions in (e.g. a ProcessPoolExecutor
+                for bulk sends); signs on the event loop if not provided. Owned by the caller.
+            session: aiohttp session for HTTP endpoints, e.g. from create_http_session(), to
+                share one connection pool across clients; each client pools its own if not
+                provided. Owned by the caller (close() leaves it open).
+            poll_latency: Seconds between receipt polls on HTTP endpoints (lower it on
+                fast L2s; websocket endpoints wait for new blocks instead)
+            batch_rpcs: Send concurrent split reads (including execute pre-checks) as
+                one Multicall3 call per MULTICALL_BATCH_WINDOW; adds up to that much latency
 
         Raises:
             ChainNotSupportedError: If chain_id is not supported
@@ -97,22 +236,56 @@ class AsyncCascadeSplitsClient:
         if not is_supported_chain(chain_id):
             raise ChainNotSupportedError(chain_id)
 
-        self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+        # Websocket endpoints also let receipts be awaited via newHeads instead of polling
+        if not isinstance(rpc_url, str):
+            # Failover replaces per-endpoint retries
+            endpoints = [
+                _PooledAsyncHTTPProvider(url, session=session, exception_retry_configuration=None) for url in rpc_url
+            ]
+            self.w3 = AsyncWeb3(AsyncFailoverHTTPProvider(endpoints))
+        elif rpc_url.startswith(("ws://", "wss://")):
+            self.w3 = AsyncWeb3(_WebSocketProvider(rpc_url))
+        else:
+            self.w3 = AsyncWeb3(_PooledAsyncHTTPProvider(rpc_url, session=session))
         self.account: LocalAccount = Account.from_key(private_key)
         self.chain_id = chain_id
+        self._poll_latency = poll_latency
+
+        # Nonces are tracked locally after the first send
+        self._nonces = AsyncNonceManager(self.w3, self.account.address)
+        # EIP-1559 fees come from one cached fee_history call
+        self._fees = AsyncFeeCache(self.w3)
+        # Known splits skip the is_cascade_split RPC on later executions
+        self._splits = SplitCache()
+        self._signing_executor = signing_executor
+        # Concurrent reads share one aggregate3 (opt-in: each read waits for the batch window)
+        self._batcher = MulticallBatcher(self.w3) if batch_rpcs else None
 
         # Get factory address
-        self.factory_address = AsyncWeb3.to_checksum_address(factory_address or get_split_factory_address(chain_id))
+        self.factory_address = (
+            _to_checksum_address(factory_address) if factory_address else get_split_factory_address(chain_id)
+        )
+
+        # Factory's currentImplementation, read once on first use so split addresses can be
+        # computed locally (not taken from constants: the factory can upgrade its implementation)
+        self._implementation: str | None = None
 
         # Default token (USDC)
-        self.default_token = AsyncWeb3.to_checksum_address(get_usdc_address(chain_id))
+        self.default_token = get_usdc_address(chain_id)
+
+    async def connect(self) -> None:
+        """Open the websocket connection (no-op for HTTP endpoints)."""
+        provider = self.w3.provider
+        if isinstance(provider, WebSocketProvider) and not await provider.is_connected():
+            await provider.connect()
 
     async def close(self) -> None:
-        """Close the underlying HTTP session."""
+        """Close the underlying HTTP session or websocket connection."""
         await self.w3.provider.disconnect()
 
     async def __aenter__(self) -> "AsyncCascadeSplitsClient":
-        """Enter async context manager."""
+        """Enter async context manager (connects websocket endpoints)."""
+        await self.connect()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -124,6 +297,10 @@ class AsyncCascadeSplitsClient:
         """Get the wallet address."""
         return self.account.address
 
+    async def reset_nonce(self) -> None:
+        """Resync the local nonce with the chain (e.g. after sending from this wallet elsewhere)."""
+        await self._nonces.reset()
+
     async def ensure_split(
         self,
         unique_id: bytes,
@@ -131,21 +308,27 @@ class AsyncCascadeSplitsClient:
         authority: str | None = None,
         token: str | None = None,
         gas: GasOptions | None = None,
+        await_receipt: bool = True,
     ) -> EnsureResult:
         """
         Create a split if it doesn't exist (idempotent).
 
         Args:
-            unique_id: Unique identifier for this split (32 bytes)
+            unique_id: Unique identifier for this split (up to 32 bytes, zero-padded)
             recipients: List of recipients with shares (must sum to 100)
             authority: Authority address (defaults to wallet address)
             token: Token address (defaults to USDC)
             gas: Gas options (estimation, EIP-1559 fees)
+            await_receipt: Wait for the creation to be mined (False returns PENDING once sent)
 
         Returns:
-            EnsureResult with status CREATED, NO_CHANGE, or FAILED
+            EnsureResult with status CREATED, NO_CHANGE, PENDING, or FAILED
         """
-        return await _ensure_split(
+        known = await self._known_split(unique_id, recipients, authority, token)
+        if known is not None:
+            return known
+
+        result = await _ensure_split(
             self.w3,
             self.account,
             self.factory_address,
@@ -155,14 +338,90 @@ class AsyncCascadeSplitsClient:
                 authority=authority,
                 token=token,
                 gas=gas,
+                await_receipt=await_receipt,
             ),
+            nonces=self._nonces,
+            signing_executor=self._signing_executor,
+            fees=self._fees,
+            chain_id=self.chain_id,
+            poll_latency=self._poll_latency,
         )
+        return _record_ensured(self._splits, result)
+
+    async def _split_implementation(self) -> str:
+        """The factory's currentImplementation, read over RPC on first use."""
+        if self._implementation is None:
+            self._implementation = await _read_current_implementation(self.w3, self.factory_address)
+        return self._implementation
+
+    async def _known_split(
+        self,
+        unique_id: bytes,
+        recipients: list[Recipient],
+        authority: str | None,
+        token: str | None,
+    ) -> EnsureResult | None:
+        """NO_CHANGE, without a further RPC, for a split this client has already seen deployed."""
+        if not self._splits:
+            # Nothing seen deployed yet: skip the implementation read
+            return None
+        try:
+            implementation = await self._split_implementation()
+        except Exception:
+            # The ensure itself will surface the RPC failure
+            return None
+        split = _cached_split_address(
+            self._splits,
+            self.factory_address,
+            implementation,
+            authority or self.account.address,
+            token or self.default_token,
+            unique_id,
+            recipients,
+        )
+        return None if split is None else EnsureResult(status="NO_CHANGE", split=split)
+
+    async def ensure_splits(
+        self,
+        items: Sequence[EnsureParams],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[EnsureResult]:
+        """
+        Ensure many splits concurrently.
+
+        Validation, existence checks and receipt waits overlap across items,
+        with at most `concurrency` operations in flight. Nonces are assigned
+        locally, so the concurrent sends do not collide.
+
+        Args:
+            items: EnsureParams for each split
+            concurrency: Maximum number of concurrent ensure operations
+
+        Returns:
+            EnsureResult for each item, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def ensure_one(params: EnsureParams) -> EnsureResult:
+            async with semaphore:
+                return await self.ensure_split(
+                    params.unique_id,
+                    params.recipients,
+                    params.authority,
+                    params.token,
+                    params.gas,
+                    params.await_receipt,
+                )
+
+        return list(await asyncio.gather(*(ensure_one(params) for params in items)))
 
     async def execute_split(
         self,
         split_address: str,
         min_balance: int | None = None,
         gas: GasOptions | None = None,
+        await_receipt: bool = True,
+        return_preview: bool = False,
     ) -> ExecuteResult:
         """
         Execute split distribution (permissionless).
@@ -173,40 +432,112 @@ class AsyncCascadeSplitsClient:
             split_address: Address of the split to execute
             min_balance: Minimum balance required (skip if below)
             gas: Gas options (estimation, EIP-1559 fees)
+            await_receipt: Wait for the execution to be mined (False returns PENDING once sent)
+            return_preview: Read previewExecution in the pre-check round-trip and set result.preview
+
+        Returns:
+            ExecuteResult with status EXECUTED, SKIPPED, PENDING, or FAILED
+        """
+        options = ExecuteOptions(
+            min_balance=min_balance, gas=gas, await_receipt=await_receipt, return_preview=return_preview
+        )
+        return await _execute_split(
+            self.w3,
+            self.account,
+            split_address,
+            options,
+            nonces=self._nonces,
+            signing_executor=self._signing_executor,
+            fees=self._fees,
+            splits=self._splits,
+            chain_id=self.chain_id,
+            poll_latency=self._poll_latency,
+            batcher=self._batcher,
+        )
+
+    async def execute_splits(
+        self,
+        split_addresses: Sequence[str],
+        min_balance: int | None = None,
+        gas: GasOptions | None = None,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        await_receipt: bool = True,
+    ) -> list[ExecuteResult]:
+        """
+        Execute many splits concurrently.
+
+        Pre-checks, sends and receipt waits overlap across splits, with at most
+        `concurrency` operations in flight. Nonces are assigned locally, so the
+        concurrent sends do not collide.
+
+        Args:
+            split_addresses: Addresses of the splits to execute
+            min_balance: Minimum balance required for each split (skip if below)
+            gas: Gas options (estimation, EIP-1559 fees) for every transaction
+            concurrency: Maximum number of concurrent execute operations
+            await_receipt: Wait for each execution to be mined (False returns PENDING once sent)
 
         Returns:
-            ExecuteResult with status EXECUTED, SKIPPED, or FAILED
+            ExecuteResult for each split, in input order
         """
-        options = ExecuteOptions(min_balance=min_balance, gas=gas)
-        return await _execute_split(self.w3, self.account, split_address, options)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def execute_one(split_address: str) -> ExecuteResult:
+            async with semaphore:
+                return await self.execute_split(split_address, min_balance, gas, await_receipt)
+
+        return list(await asyncio.gather(*(execute_one(address) for address in split_addresses)))
 
     async def is_cascade_split(self, address: str) -> bool:
-        """Check if an address is a valid Cascade split."""
-        return await _is_cascade_split(self.w3, address)
+        """Check if an address is a valid Cascade split (memoized per client)."""
+        return await _is_cascade_split(self.w3, address, cache=self._splits, batcher=self._batcher)
 
     async def get_split_balance(self, split_address: str) -> int:
         """Get the token balance of a split (in smallest unit)."""
-        return await _get_split_balance(self.w3, split_address)
+        return await _get_split_balance(self.w3, split_address, self._batcher)
 
     async def get_split_config(self, split_address: str) -> SplitConfig | None:
-        """Get the configuration of a split."""
-        return await _get_split_config(self.w3, split_address)
+        """Get the configuration of a split (memoized per client; configs are immutable)."""
+        return await _get_split_config(self.w3, split_address, cache=self._splits, batcher=self._batcher)
 
     async def has_pending_funds(self, split_address: str) -> bool:
         """Check if a split has pending funds to distribute."""
-        return await _has_pending_funds(self.w3, split_address)
+        return await _has_pending_funds(self.w3, split_address, self._batcher)
 
     async def get_pending_amount(self, split_address: str) -> int:
         """Get the pending amount to be distributed."""
-        return await _get_pending_amount(self.w3, split_address)
+        return await _get_pending_amount(self.w3, split_address, self._batcher)
 
     async def get_total_unclaimed(self, split_address: str) -> int:
         """Get the total unclaimed amount (failed transfers)."""
-        return await _get_total_unclaimed(self.w3, split_address)
+        return await _get_total_unclaimed(self.w3, split_address, self._batcher)
 
     async def preview_execution(self, split_address: str) -> ExecutionPreview:
         """Preview what would happen if the split is executed."""
-        return await _preview_execution(self.w3, split_address)
+        return await _preview_execution(self.w3, split_address, self._batcher)
+
+    async def get_split_snapshot(self, split_address: str) -> SplitSnapshot:
+        """Get a split's config, balance, pending amounts and preview in one round-trip."""
+        snapshot = await _get_split_snapshot(self.w3, split_address)
+        self._remember_snapshot(split_address, snapshot)
+        return snapshot
+
+    async def get_split_snapshots(self, split_addresses: Sequence[str]) -> list[SplitSnapshot]:
+        """Get the snapshots of many splits in one round-trip, in the order given."""
+        snapshots = await _get_split_snapshots(self.w3, split_addresses)
+        for split_address, snapshot in zip(split_addresses, snapshots, strict=True):
+            self._remember_snapshot(split_address, snapshot)
+        return snapshots
+
+    def _remember_snapshot(self, split_address: str, snapshot: SplitSnapshot) -> None:
+        """Record what a snapshot showed about a split in the split cache."""
+        if snapshot.is_split is None:
+            # The split check failed: nothing is known
+            return
+        if snapshot.config is not None:
+            self._splits.set_config(split_address, snapshot.config)
+        else:
+            self._splits.set(split_address, snapshot.is_split)
 
     async def predict_split_address(
         self,
@@ -219,30 +550,28 @@ class AsyncCascadeSplitsClient:
         Predict the address of a split before creation.
 
         Args:
-            unique_id: Unique identifier (32 bytes)
+            unique_id: Unique identifier (up to 32 bytes, zero-padded)
             recipients: List of recipients with shares
             authority: Authority address (defaults to wallet)
             token: Token address (defaults to USDC)
 
         Returns:
             Predicted split address
-        """
-        authority = AsyncWeb3.to_checksum_address(authority or self.account.address)
-        token = AsyncWeb3.to_checksum_address(token or self.default_token)
 
-        # Pad unique_id
-        if len(unique_id) < 32:
-            unique_id = unique_id.ljust(32, b"\x00")
-        elif len(unique_id) > 32:
-            unique_id = unique_id[:32]
+        Raises:
+            ValueError: If unique_id is longer than 32 bytes or shares don't sum to 100
+        """
+        authority = _to_checksum_address(authority) if authority else self.account.address
+        token = _to_checksum_address(token) if token else self.default_token
 
-        evm_recipients = to_evm_recipients(recipients)
+        unique_id = normalize_unique_id(unique_id)
+        recipient_tuples = _recipient_tuples(recipients)
 
-        return await _predict_split_address(
-            self.w3,
+        return _compute_split_address(
             self.factory_address,
+            await self._split_implementation(),
             authority,
             token,
             unique_id,
-            evm_recipients,
+            recipient_tuples,
         )
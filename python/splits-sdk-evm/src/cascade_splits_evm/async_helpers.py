@@ -1,210 +1,458 @@
 """Async helper functions for Cascade Splits EVM SDK."""
 
-from typing import cast
-
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import Executor
+from typing import Any, cast
+from weakref import WeakKeyDictionary
+
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
 from eth_typing import ChecksumAddress
+from hexbytes import HexBytes
 from web3 import AsyncWeb3
-from web3.contract.async_contract import AsyncContractFunction
-
-from .abi import SPLIT_CONFIG_IMPL_ABI, SPLIT_FACTORY_ABI
-from .constants import get_usdc_address
-from .types import EvmRecipient, ExecutionPreview, GasOptions, Recipient, SplitConfig
-
-# Type alias for transaction params
-TxParams = dict[str, int | str]
-
-# Default gas limits for operations
-DEFAULT_GAS_CREATE = 300_000
-DEFAULT_GAS_EXECUTE = 600_000
-DEFAULT_PRIORITY_FEE = 1_000_000_000  # 1 gwei
-
-
-def to_evm_recipient(recipient: Recipient) -> EvmRecipient:
+from web3.contract.async_contract import AsyncContract, AsyncContractFunction
+from web3.exceptions import TransactionNotFound
+from web3.providers.persistent import PersistentConnectionProvider
+from web3.types import TxReceipt
+
+from ._codec import abi_decode
+from .constants import MULTICALL3_ADDRESS, RECEIPT_POLL_LATENCY, RECEIPT_TIMEOUT
+from .fees import AsyncFeeCache
+from .helpers import (
+    _CONFIG_VIEWS,
+    _FACTORY_CALLS,
+    _SNAPSHOT_VIEWS,
+    _SPLIT_VIEWS,
+    ContractKind,
+    _buffered_gas,
+    _contract_cache,
+    _decode_current_implementation,
+    _decode_multicall,
+    _decode_predicted_address,
+    _decode_view_multicall,
+    _decode_view_responses,
+    _encoded_transaction,
+    _multicall_data,
+    _optimistic_gas_limit,
+    _predict_split_address_call,
+    _snapshot_from_responses,
+    _snapshot_requests,
+    _snapshots_from_values,
+    _snapshots_multicall_data,
+    _to_checksum_address,
+    _to_execution_preview,
+    _to_split_config,
+    _view_multicall_data,
+    _view_requests,
+)
+
+# Recipient conversion, gas defaults and the default token are sync and shared;
+# re-exported for the async API
+from .helpers import DEFAULT_GAS_CREATE as DEFAULT_GAS_CREATE
+from .helpers import DEFAULT_GAS_EXECUTE as DEFAULT_GAS_EXECUTE
+from .helpers import DEFAULT_PRIORITY_FEE as DEFAULT_PRIORITY_FEE
+from .helpers import TxParams as TxParams
+from .helpers import get_default_token as get_default_token
+from .helpers import to_evm_recipient as to_evm_recipient
+from .helpers import to_evm_recipients as to_evm_recipients
+from .multicall_batcher import MulticallBatcher
+from .nonce import AsyncNonceManager, is_nonce_error
+from .split_cache import SplitCache
+from .types import EvmRecipient, ExecutionPreview, GasOptions, SplitConfig, SplitSnapshot
+
+# eth_chainId results per provider; a connection's chain never changes
+_CHAIN_IDS: "WeakKeyDictionary[Any, int]" = WeakKeyDictionary()
+
+
+def _contract(w3: AsyncWeb3, address: str, kind: ContractKind = "split") -> AsyncContract:
     """
-    Convert a Recipient (share 1-100) to EvmRecipient (basis points).
+    Get a bound async contract instance, built once per (w3, address, kind).
 
-    The protocol takes 1% fee, so percentageBps = share * 99.
+    Building a contract re-parses its ABI, so instances are reused across calls.
     """
-    return EvmRecipient(
-        addr=recipient.address,
-        percentage_bps=recipient.share * 99,
-    )
+    return _contract_cache(w3).contract(w3, _to_checksum_address(address), kind)
 
 
-def to_evm_recipients(recipients: list[Recipient]) -> list[EvmRecipient]:
-    """
-    Convert a list of Recipients to EvmRecipients.
+def _contract_class(w3: AsyncWeb3, kind: ContractKind) -> type[AsyncContract]:
+    """Get the unbound async contract class for an ABI, parsed once per (w3, kind)."""
+    return _contract_cache(w3).contract_class(w3, kind)
 
-    Raises:
-        ValueError: If shares don't sum to 100
-    """
-    total = sum(r.share for r in recipients)
-    if total != 100:
-        raise ValueError(f"Recipient shares must sum to 100, got {total}")
 
-    return [to_evm_recipient(r) for r in recipients]
+async def _chain_id(w3: AsyncWeb3) -> int:
+    """Get the provider's chain ID, read with eth_chainId once per provider."""
+    chain_id = _CHAIN_IDS.get(w3.provider)
+    if chain_id is None:
+        chain_id = _CHAIN_IDS[w3.provider] = await w3.eth.chain_id
+    return chain_id
 
 
-def get_default_token(chain_id: int) -> str:
-    """Get the default token (USDC) address for a chain."""
-    return get_usdc_address(chain_id)
+async def _gather_all(*reads: Awaitable[Any]) -> list[Any]:
+    """Await reads concurrently; raise the first one's error (in argument order) once all have finished."""
+    results = await asyncio.gather(*reads, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
 
 
 async def build_tx_params(
     w3: AsyncWeb3,
-    sender: ChecksumAddress | str,
+    sender: ChecksumAddress,
     chain_id: int,
     default_gas: int,
     gas_options: GasOptions | None = None,
     contract_call: AsyncContractFunction | None = None,
+    nonce: int | None = None,
+    fees: AsyncFeeCache | None = None,
 ) -> TxParams:
     """
     Build transaction parameters with gas options.
 
     Handles:
-    - Gas estimation (with 20% buffer) when estimate_gas=True
+    - Gas estimation (with 20% buffer) when estimate_gas=True: precomputed for
+      createSplitConfig / executeSplit, eth_estimateGas otherwise
     - EIP-1559 type 2 transactions when max_fee_per_gas is set
-    - Fallback to legacy transactions otherwise
+    - Cached fee_history fees from an AsyncFeeCache otherwise
+    - Fallback to web3's fee lookup when neither is given
+
+    The nonce, gas estimate and fees that need fetching are read concurrently.
 
     Args:
         w3: AsyncWeb3 instance
-        sender: Sender address
+        sender: Sender address (checksummed, e.g. account.address)
         chain_id: Chain ID
         default_gas: Default gas limit if not estimating
         gas_options: Optional gas configuration
         contract_call: Contract function call for estimation (required if estimate_gas=True)
+        nonce: Nonce to use (fetched from the chain if not provided)
+        fees: Fee cache supplying EIP-1559 fees when none are set in gas_options
 
     Returns:
         Transaction parameters dict
     """
-    nonce = await w3.eth.get_transaction_count(cast(ChecksumAddress, sender))
+    opts = gas_options or GasOptions()
+
+    # Decide what must be read from the node before fetching anything
+    gas_limit = opts.gas_limit
+    if gas_limit is None:
+        if opts.estimate_gas and contract_call is not None:
+            gas_limit = _optimistic_gas_limit(opts, contract_call)
+        else:
+            gas_limit = default_gas
+    fetch_fees = opts.max_fee_per_gas is None and fees is not None
+
+    # Nonce, gas estimate and fees are independent reads: fetch them concurrently
+    reads: list[Awaitable[Any]] = []
+    if nonce is None:
+        reads.append(w3.eth.get_transaction_count(sender))
+    if gas_limit is None:
+        reads.append(cast(AsyncContractFunction, contract_call).estimate_gas({"from": sender}))
+    if fetch_fees:
+        reads.append(cast(AsyncFeeCache, fees).fees())
+    results = iter(await asyncio.gather(*reads) if len(reads) > 1 else [await read for read in reads])
+
+    if nonce is None:
+        nonce = next(results)
+    if gas_limit is None:
+        gas_limit = _buffered_gas(next(results), opts)
 
     tx_params: TxParams = {
         "from": sender,
         "nonce": nonce,
         "chainId": chain_id,
+        "gas": gas_limit,
     }
 
-    opts = gas_options or GasOptions()
-
-    # Determine gas limit
-    if opts.gas_limit is not None:
-        tx_params["gas"] = opts.gas_limit
-    elif opts.estimate_gas and contract_call is not None:
-        estimated = await contract_call.estimate_gas({"from": sender})
-        tx_params["gas"] = int(estimated * 1.2)  # 20% buffer
-    else:
-        tx_params["gas"] = default_gas
-
-    # EIP-1559 or legacy
+    # EIP-1559: explicit fees, else cached fee_history estimates
     if opts.max_fee_per_gas is not None:
         tx_params["type"] = "0x2"
         tx_params["maxFeePerGas"] = opts.max_fee_per_gas
         tx_params["maxPriorityFeePerGas"] = (
             opts.max_priority_fee_per_gas if opts.max_priority_fee_per_gas is not None else DEFAULT_PRIORITY_FEE
         )
+    elif fetch_fees:
+        max_fee, priority_fee = next(results)
+        tx_params["type"] = "0x2"
+        tx_params["maxFeePerGas"] = max_fee
+        tx_params["maxPriorityFeePerGas"] = priority_fee
 
     return tx_params
 
 
-async def is_cascade_split(w3: AsyncWeb3, address: str) -> bool:
-    """Check if an address is a valid Cascade split."""
-    try:
-        contract = w3.eth.contract(
-            address=AsyncWeb3.to_checksum_address(address),
-            abi=SPLIT_CONFIG_IMPL_ABI,
+def sign_raw_transaction(tx: TxParams, private_key: bytes) -> bytes:
+    """
+    Sign a transaction and return the raw bytes to broadcast.
+
+    A plain module-level function so it can be shipped to a process pool.
+    """
+    return bytes(Account.sign_transaction(tx, private_key).raw_transaction)
+
+
+async def send_transaction(
+    w3: AsyncWeb3,
+    account: LocalAccount,
+    chain_id: int,
+    contract_call: AsyncContractFunction,
+    default_gas: int,
+    gas_options: GasOptions | None = None,
+    nonces: AsyncNonceManager | None = None,
+    signing_executor: Executor | None = None,
+    fees: AsyncFeeCache | None = None,
+    nonce: int | None = None,
+) -> HexBytes:
+    """
+    Build, sign and send a contract transaction.
+
+    With an AsyncNonceManager the nonce comes from the local counter; if the node
+    reports it as already used, the counter is resynced and the send retried once.
+    Without one, the given nonce is used (fetched from the chain if not provided).
+    With an AsyncFeeCache, EIP-1559 fees come from the cache instead of per-send lookups.
+
+    ECDSA signing is CPU-bound and blocks the event loop. With a signing_executor
+    (e.g. a ProcessPoolExecutor) it runs there instead, overlapping with other
+    tasks' RPC waits.
+
+    Returns:
+        Transaction hash
+    """
+
+    async def sign_and_send(nonce: int | None) -> HexBytes:
+        tx_params = await build_tx_params(
+            w3,
+            account.address,
+            chain_id,
+            default_gas,
+            gas_options=gas_options,
+            contract_call=contract_call,
+            nonce=nonce,
+            fees=fees,
         )
-        return await contract.functions.isCascadeSplitConfig().call()
+        tx = _encoded_transaction(contract_call, tx_params) or await contract_call.build_transaction(tx_params)
+        if signing_executor is None:
+            raw_transaction = account.sign_transaction(tx).raw_transaction
+        else:
+            loop = asyncio.get_running_loop()
+            raw_transaction = await loop.run_in_executor(signing_executor, sign_raw_transaction, tx, account.key)
+        return await w3.eth.send_raw_transaction(raw_transaction)
+
+    if nonces is None:
+        return await sign_and_send(nonce)
+
+    for attempt in range(2):
+        try:
+            return await sign_and_send(await nonces.next_nonce())
+        except Exception as e:
+            # The reserved nonce was not consumed, resync before the next send
+            await nonces.reset()
+            if attempt > 0 or not is_nonce_error(e):
+                raise
+    raise AssertionError("unreachable")
+
+
+async def wait_for_receipt(w3: AsyncWeb3, tx_hash: HexBytes, poll_latency: float = RECEIPT_POLL_LATENCY) -> TxReceipt:
+    """
+    Wait for a transaction receipt.
+
+    On persistent (websocket) providers the receipt is only fetched when a new
+    block arrives via a newHeads subscription. HTTP providers poll every
+    poll_latency seconds.
+
+    Raises:
+        TimeoutError: If no receipt within RECEIPT_TIMEOUT seconds
+    """
+    if not isinstance(w3.provider, PersistentConnectionProvider):
+        return await w3.eth.wait_for_transaction_receipt(tx_hash, timeout=RECEIPT_TIMEOUT, poll_latency=poll_latency)
+
+    async def get_receipt() -> TxReceipt | None:
+        try:
+            return await w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+
+    async with asyncio.timeout(RECEIPT_TIMEOUT):
+        subscription_id = await w3.eth.subscribe("newHeads")
+        try:
+            # May already be mined before the subscription was set up
+            receipt = await get_receipt()
+            if receipt is not None:
+                return receipt
+            async for _ in w3.socket.process_subscriptions():
+                receipt = await get_receipt()
+                if receipt is not None:
+                    return receipt
+        finally:
+            await w3.eth.unsubscribe(subscription_id)
+    raise TimeoutError(f"Transaction {tx_hash.hex()} not mined")
+
+
+async def poll_receipt(w3: AsyncWeb3, tx_hash: HexBytes | str) -> TxReceipt | None:
+    """
+    Check once for a transaction receipt, without waiting.
+
+    Completes a send made with await_receipt=False: returns None while the
+    transaction is still pending.
+    """
+    try:
+        return await w3.eth.get_transaction_receipt(tx_hash)
+    except TransactionNotFound:
+        return None
+
+
+def _eth_call(w3: AsyncWeb3, batcher: MulticallBatcher | None) -> Callable[[Any], Awaitable[bytes]]:
+    """eth_call directly, or through a MulticallBatcher's next aggregate3."""
+    return w3.eth.call if batcher is None else batcher.call
+
+
+async def _call_split_view(
+    w3: AsyncWeb3, split_address: str, name: str, batcher: MulticallBatcher | None = None
+) -> Any:
+    """Call a zero-argument SplitConfigImpl view with pre-encoded calldata (see helpers._call_split_view)."""
+    selector, output_types = _SPLIT_VIEWS[name]
+    raw = await _eth_call(w3, batcher)({"to": _to_checksum_address(split_address), "data": selector})
+    values = abi_decode(output_types, raw)
+    return values[0] if len(values) == 1 else values
+
+
+async def _read_current_implementation(w3: AsyncWeb3, factory_address: str) -> str:
+    """Read SplitFactory.currentImplementation with pre-encoded calldata."""
+    call = {"to": _to_checksum_address(factory_address), "data": _FACTORY_CALLS["currentImplementation"][0]}
+    return _decode_current_implementation(await w3.eth.call(call))
+
+
+async def multicall(w3: AsyncWeb3, calls: Sequence[AsyncContractFunction]) -> list[Any]:
+    """
+    Batch view calls into a single Multicall3 aggregate3 eth_call.
+
+    Async counterpart of helpers.multicall: failed or undecodable results are
+    None and single-value outputs are unwrapped.
+    """
+    raw = await w3.eth.call({"to": MULTICALL3_ADDRESS, "data": _multicall_data(calls)})
+    return _decode_multicall(calls, raw)
+
+
+async def _read_split_views(
+    w3: AsyncWeb3, split_address: str, names: Sequence[str], batcher: MulticallBatcher | None = None
+) -> list[Any]:
+    """
+    Read zero-argument split views in one pre-encoded Multicall3 eth_call (see helpers._read_split_views).
+
+    With a batcher, that aggregate3 is itself one sub-call of the batcher's next aggregate3.
+    """
+    call = {"to": MULTICALL3_ADDRESS, "data": _view_multicall_data(split_address, names)}
+    raw = await _eth_call(w3, batcher)(call)
+    if not raw:
+        # No code at MULTICALL3_ADDRESS: one JSON-RPC batch of direct eth_calls
+        responses = await w3.provider.make_batch_request(_view_requests(split_address, names))
+        return _decode_view_responses(names, responses)
+    return _decode_view_multicall(names, raw)
+
+
+async def is_cascade_split(
+    w3: AsyncWeb3, address: str, cache: SplitCache | None = None, batcher: MulticallBatcher | None = None
+) -> bool:
+    """Check if an address is a valid Cascade split (answered from cache when possible)."""
+    if cache is not None:
+        cached = cache.get(address)
+        if cached is not None:
+            return cached
+    try:
+        result = bool(await _call_split_view(w3, address, "isCascadeSplitConfig", batcher))
     except Exception:
+        # A failed read is not cached as "not a split"
         return False
+    if cache is not None:
+        cache.set(address, result)
+    return result
 
 
-async def get_split_balance(w3: AsyncWeb3, split_address: str) -> int:
+async def get_split_balance(w3: AsyncWeb3, split_address: str, batcher: MulticallBatcher | None = None) -> int:
     """
     Get the token balance of a split.
 
     Returns:
         Balance in token's smallest unit (e.g., 6 decimals for USDC)
     """
-    contract = w3.eth.contract(
-        address=AsyncWeb3.to_checksum_address(split_address),
-        abi=SPLIT_CONFIG_IMPL_ABI,
-    )
-    return await contract.functions.getBalance().call()
+    return await _call_split_view(w3, split_address, "getBalance", batcher)
 
 
-async def has_pending_funds(w3: AsyncWeb3, split_address: str) -> bool:
+async def has_pending_funds(w3: AsyncWeb3, split_address: str, batcher: MulticallBatcher | None = None) -> bool:
     """Check if a split has pending funds to distribute."""
-    contract = w3.eth.contract(
-        address=AsyncWeb3.to_checksum_address(split_address),
-        abi=SPLIT_CONFIG_IMPL_ABI,
-    )
-    return await contract.functions.hasPendingFunds().call()
+    return await _call_split_view(w3, split_address, "hasPendingFunds", batcher)
 
 
-async def get_pending_amount(w3: AsyncWeb3, split_address: str) -> int:
+async def get_pending_amount(w3: AsyncWeb3, split_address: str, batcher: MulticallBatcher | None = None) -> int:
     """Get the pending amount to be distributed."""
-    contract = w3.eth.contract(
-        address=AsyncWeb3.to_checksum_address(split_address),
-        abi=SPLIT_CONFIG_IMPL_ABI,
-    )
-    return await contract.functions.pendingAmount().call()
+    return await _call_split_view(w3, split_address, "pendingAmount", batcher)
 
 
-async def get_total_unclaimed(w3: AsyncWeb3, split_address: str) -> int:
+async def get_total_unclaimed(w3: AsyncWeb3, split_address: str, batcher: MulticallBatcher | None = None) -> int:
     """Get the total unclaimed amount (failed transfers)."""
-    contract = w3.eth.contract(
-        address=AsyncWeb3.to_checksum_address(split_address),
-        abi=SPLIT_CONFIG_IMPL_ABI,
-    )
-    return await contract.functions.totalUnclaimed().call()
+    return await _call_split_view(w3, split_address, "totalUnclaimed", batcher)
 
 
-async def get_split_config(w3: AsyncWeb3, split_address: str) -> SplitConfig | None:
-    """Get the configuration of a split. Returns None if not a valid split."""
+async def get_split_config(
+    w3: AsyncWeb3, split_address: str, cache: SplitCache | None = None, batcher: MulticallBatcher | None = None
+) -> SplitConfig | None:
+    """Get the configuration of a split. Returns None if not a valid split (answered from cache when possible)."""
+    if cache is not None:
+        config = cache.get_config(split_address)
+        if config is not None or cache.get(split_address) is False:
+            return config
     try:
-        contract = w3.eth.contract(
-            address=AsyncWeb3.to_checksum_address(split_address),
-            abi=SPLIT_CONFIG_IMPL_ABI,
+        # One Multicall3 eth_call: all fields are read from the same block
+        is_valid, authority, token, unique_id, raw_recipients = await _read_split_views(
+            w3, split_address, _CONFIG_VIEWS, batcher
         )
-
-        is_valid = await contract.functions.isCascadeSplitConfig().call()
+        if is_valid is None:
+            # The check itself failed: unknown, so nothing is cached
+            return None
         if not is_valid:
+            if cache is not None:
+                cache.set(split_address, False)
             return None
-
-        authority = await contract.functions.authority().call()
-        token = await contract.functions.token().call()
-        unique_id = await contract.functions.uniqueId().call()
-        raw_recipients = await contract.functions.getRecipients().call()
-
-        recipients = [EvmRecipient(addr=r[0], percentage_bps=r[1]) for r in raw_recipients]
-
-        return SplitConfig(
-            authority=authority,
-            token=token,
-            unique_id=unique_id,
-            recipients=recipients,
-        )
+        config = _to_split_config(authority, token, unique_id, raw_recipients)
     except Exception:
         return None
+    if cache is not None:
+        cache.set_config(split_address, config)
+    return config
 
 
-async def preview_execution(w3: AsyncWeb3, split_address: str) -> ExecutionPreview:
+async def preview_execution(
+    w3: AsyncWeb3, split_address: str, batcher: MulticallBatcher | None = None
+) -> ExecutionPreview:
     """Preview what would happen if the split is executed."""
-    contract = w3.eth.contract(
-        address=AsyncWeb3.to_checksum_address(split_address),
-        abi=SPLIT_CONFIG_IMPL_ABI,
-    )
+    return _to_execution_preview(await _call_split_view(w3, split_address, "previewExecution", batcher))
 
-    result = await contract.functions.previewExecution().call()
 
-    return ExecutionPreview(
-        recipient_amounts=list(result[0]),
-        protocol_fee=result[1],
-        available=result[2],
-        pending_recipient_amounts=list(result[3]),
-        pending_protocol_amount=result[4],
-    )
+async def get_split_snapshot(w3: AsyncWeb3, split_address: str) -> SplitSnapshot:
+    """
+    Read a split's config, balance, pending amounts and execution preview at once.
+
+    All views are sent as one JSON-RPC batch of eth_calls (one HTTP round-trip).
+    """
+    responses = await w3.provider.make_batch_request(_snapshot_requests(split_address))
+    return _snapshot_from_responses(responses)
+
+
+async def get_split_snapshots(w3: AsyncWeb3, split_addresses: Sequence[str]) -> list[SplitSnapshot]:
+    """
+    Read the snapshots of many splits at once, in the order given.
+
+    Every view of every split is one sub-call of a single Multicall3 aggregate3
+    eth_call (see helpers.get_split_snapshots).
+    """
+    if not split_addresses:
+        return []
+    names = _SNAPSHOT_VIEWS * len(split_addresses)
+    raw = await w3.eth.call({"to": MULTICALL3_ADDRESS, "data": _snapshots_multicall_data(split_addresses)})
+    if not raw:
+        # No code at MULTICALL3_ADDRESS: one JSON-RPC batch of direct eth_calls
+        requests = [request for split in split_addresses for request in _snapshot_requests(split)]
+        responses = await w3.provider.make_batch_request(requests)
+        return _snapshots_from_values(_decode_view_responses(names, responses))
+    return _snapshots_from_values(_decode_view_multicall(names, raw))
 
 
 async def predict_split_address(
@@ -214,6 +462,7 @@ async def predict_split_address(
     token: str,
     unique_id: bytes,
     recipients: list[EvmRecipient],
+    batcher: MulticallBatcher | None = None,
 ) -> str:
     """
     Predict the deterministic address of a split before creation.
@@ -225,20 +474,10 @@ async def predict_split_address(
         token: The token address (e.g., USDC)
         unique_id: Unique identifier (32 bytes)
         recipients: List of EvmRecipients with percentage_bps
+        batcher: Optional MulticallBatcher to send the read with other concurrent reads
 
     Returns:
         Predicted split address
     """
-    factory = w3.eth.contract(
-        address=AsyncWeb3.to_checksum_address(factory_address),
-        abi=SPLIT_FACTORY_ABI,
-    )
-
-    recipient_tuples = [(r.addr, r.percentage_bps) for r in recipients]
-
-    return await factory.functions.predictSplitAddress(
-        AsyncWeb3.to_checksum_address(authority),
-        AsyncWeb3.to_checksum_address(token),
-        unique_id,
-        recipient_tuples,
-    ).call()
+    call = _predict_split_address_call(factory_address, authority, token, unique_id, recipients)
+    return _decode_predicted_address(await _eth_call(w3, batcher)(call))
@@ -1,26 +1,53 @@
 """High-level client for Cascade Splits EVM SDK."""
 
-from typing import TypeVar
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Any, cast
 
+import requests
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
-from web3 import Web3
-from web3.exceptions import ContractLogicError, Web3Exception
-
+from hexbytes import HexBytes
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import HTTPProvider, Web3
+from web3.contract.contract import ContractFunction
+from web3.exceptions import ContractLogicError, Web3RPCError
+from web3.types import RPCEndpoint, RPCResponse
+
+from ._codec import abi_decode, json_decode, json_encode
 from ._exceptions import ChainNotSupportedError
-from .abi import SPLIT_CONFIG_IMPL_ABI, SPLIT_FACTORY_ABI
 from .constants import (
     MAX_RECIPIENTS,
     MIN_RECIPIENTS,
+    RECEIPT_POLL_LATENCY,
+    RECEIPT_TIMEOUT,
     get_split_factory_address,
     get_usdc_address,
     is_supported_chain,
 )
+from .fees import FeeCache
 from .helpers import (
     DEFAULT_GAS_CREATE,
     DEFAULT_GAS_EXECUTE,
+    _cached_split_address,
+    _compute_split_address,
+    _contract,
+    _created_split_address,
+    _encoded_transaction,
+    _factory_call_data,
+    _failure_result,
+    _pop_preflight_extras,
+    _preflight_views,
+    _read_current_implementation,
+    _read_split_views,
+    _recipient_tuples,
+    _record_ensured,
+    _to_checksum_address,
     build_tx_params,
-    to_evm_recipients,
+    existing_split_from_revert,
+    normalize_unique_id,
+    send_transaction,
 )
 from .helpers import (
     get_split_balance as _get_split_balance,
@@ -29,7 +56,10 @@ from .helpers import (
     get_split_config as _get_split_config,
 )
 from .helpers import (
-    has_pending_funds as _has_pending_funds,
+    get_split_snapshot as _get_split_snapshot,
+)
+from .helpers import (
+    get_split_snapshots as _get_split_snapshots,
 )
 from .helpers import (
     is_cascade_split as _is_cascade_split,
@@ -37,16 +67,71 @@ from .helpers import (
 from .helpers import (
     preview_execution as _preview_execution,
 )
+from .nonce import NonceManager
+from .providers import FailoverHTTPProvider
+from .split_cache import SplitCache
 from .types import (
+    EnsureParams,
     EnsureResult,
     ExecuteResult,
     ExecutionPreview,
     GasOptions,
     Recipient,
     SplitConfig,
+    SplitSnapshot,
 )
 
-_T = TypeVar("_T", EnsureResult, ExecuteResult)
+# Maximum calls per JSON-RPC batch (common provider limit)
+RPC_BATCH_SIZE = 20
+
+# HTTP connection pool for the sync provider (keep-alive, TLS session reuse)
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
+HTTP_CONNECT_RETRIES = 3
+
+
+def create_requests_session(pool_maxsize: int = HTTP_POOL_MAXSIZE) -> requests.Session:
+    """
+    Create a pooled keep-alive session for sync HTTP providers.
+
+    Pass it to several CascadeSplitsClient instances, or to
+    Web3(HTTPProvider(url, session=...)) for the sync helpers, so every RPC
+    reuses open TCP/TLS connections; the caller closes it when done.
+
+    Args:
+        pool_maxsize: Maximum open connections kept per endpoint (raise it for
+            many threads sharing the session)
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        # Only connection errors are retried: the request never reached the node
+        max_retries=Retry(total=HTTP_CONNECT_RETRIES, connect=HTTP_CONNECT_RETRIES, read=0, backoff_factor=0.1),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _simulation_failure(error: Exception) -> EnsureResult:
+    """Map a failed createSplitConfig simulation: NO_CHANGE if the split already exists."""
+    if isinstance(error, ContractLogicError):
+        existing = existing_split_from_revert(error)
+        if existing is not None:
+            return EnsureResult(status="NO_CHANGE", split=existing)
+    return _failure_result(error, EnsureResult)
+
+
+class _HTTPProvider(HTTPProvider):
+    """HTTPProvider that encodes requests and parses responses with orjson when available."""
+
+    decode_rpc_response = staticmethod(json_decode)
+
+    def encode_rpc_request(self, method: RPCEndpoint, params: Any) -> bytes:
+        return json_encode(
+            {"jsonrpc": "2.0", "method": method, "params": params or [], "id": next(self.request_counter)}
+        )
 
 
 class CascadeSplitsClient:
@@ -75,47 +160,106 @@ class CascadeSplitsClient:
 
     def __init__(
         self,
-        rpc_url: str,
+        rpc_url: str | Sequence[str],
         private_key: str,
         chain_id: int = 8453,
         factory_address: str | None = None,
+        batch_size: int = RPC_BATCH_SIZE,
+        poll_latency: float = RECEIPT_POLL_LATENCY,
+        session: requests.Session | None = None,
     ) -> None:
         """
         Initialize the Cascade Splits client.
 
         Args:
-            rpc_url: RPC endpoint URL
+            rpc_url: RPC endpoint URL, or several URLs (primary first) to spread reads
+                across and fail over between
             private_key: Private key for signing transactions
             chain_id: Chain ID (8453 for Base mainnet, 84532 for Base Sepolia)
             factory_address: Custom factory address (uses default if not provided)
+            batch_size: Maximum calls per JSON-RPC batch in ensure_splits (lower it
+                for nodes with a smaller batch cap)
+            poll_latency: Seconds between receipt polls (lower it on fast L2s)
+            session: HTTP session to share, e.g. from create_requests_session(), to
+                pool connections across clients (the caller closes it)
 
         Raises:
             ChainNotSupportedError: If chain_id is not supported
+            ValueError: If batch_size is less than 1
         """
         if not is_supported_chain(chain_id):
             raise ChainNotSupportedError(chain_id)
-
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self._batch_size = batch_size
+        self._poll_latency = poll_latency
+
+        # A shared session belongs to the caller; only a session made here is closed by close()
+        self._owns_session = session is None
+        self._session = create_requests_session() if session is None else session
+        if isinstance(rpc_url, str):
+            self.w3 = Web3(_HTTPProvider(rpc_url, session=self._session))
+        else:
+            # Failover replaces per-endpoint retries
+            endpoints = [
+                _HTTPProvider(url, session=self._session, exception_retry_configuration=None) for url in rpc_url
+            ]
+            self.w3 = Web3(FailoverHTTPProvider(endpoints))
         self.account: LocalAccount = Account.from_key(private_key)
         self.chain_id = chain_id
 
-        # Get factory address
-        self.factory_address = Web3.to_checksum_address(factory_address or get_split_factory_address(chain_id))
+        # Nonces are tracked locally after the first send
+        self._nonces = NonceManager(self.w3, self.account.address)
+        # EIP-1559 fees come from one cached fee_history call
+        self._fees = FeeCache(self.w3)
+        # Known splits skip the isCascadeSplitConfig check on later executions
+        self._splits = SplitCache()
 
-        # Initialize factory contract
-        self.factory = self.w3.eth.contract(
-            address=self.factory_address,
-            abi=SPLIT_FACTORY_ABI,
+        # Get factory address
+        self.factory_address = (
+            _to_checksum_address(factory_address) if factory_address else get_split_factory_address(chain_id)
         )
 
+        # Factory's currentImplementation, read once on first use so split addresses can be
+        # computed locally (not taken from constants: the factory can upgrade its implementation)
+        self._implementation: str | None = None
+
+        # Initialize factory contract (shared with the helpers' contract cache)
+        self.factory = _contract(self.w3, self.factory_address, "factory")
+
+        # Bind factory functions once instead of resolving them on every call
+        self._create_split_config = self.factory.get_function_by_name("createSplitConfig")
+
         # Default token (USDC)
-        self.default_token = Web3.to_checksum_address(get_usdc_address(chain_id))
+        self.default_token = get_usdc_address(chain_id)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session (unless it was passed in)."""
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "CascadeSplitsClient":
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager and close session."""
+        self.close()
 
     @property
     def address(self) -> str:
         """Get the wallet address."""
         return self.account.address
 
+    def reset_nonce(self) -> None:
+        """Resync the local nonce with the chain (e.g. after sending from this wallet elsewhere)."""
+        self._nonces.reset()
+
     def ensure_split(
         self,
         unique_id: bytes,
@@ -123,115 +267,311 @@ class CascadeSplitsClient:
         authority: str | None = None,
         token: str | None = None,
         gas: GasOptions | None = None,
+        await_receipt: bool = True,
     ) -> EnsureResult:
         """
         Create a split if it doesn't exist (idempotent).
 
         Args:
-            unique_id: Unique identifier for this split (32 bytes)
+            unique_id: Unique identifier for this split (up to 32 bytes, zero-padded)
             recipients: List of recipients with shares (must sum to 100)
             authority: Authority address (defaults to wallet address)
             token: Token address (defaults to USDC)
             gas: Gas options (estimation, EIP-1559 fees)
+            await_receipt: Wait for the creation to be mined (False returns PENDING once sent)
 
         Returns:
-            EnsureResult with status CREATED, NO_CHANGE, or FAILED
+            EnsureResult with status CREATED, NO_CHANGE, PENDING, or FAILED
         """
-        # Resolve defaults
-        authority = Web3.to_checksum_address(authority or self.account.address)
-        token = Web3.to_checksum_address(token or self.default_token)
-
-        # Pad/truncate unique_id to 32 bytes
-        if len(unique_id) < 32:
-            unique_id = unique_id.ljust(32, b"\x00")
-        elif len(unique_id) > 32:
-            unique_id = unique_id[:32]
+        known = self._known_split(unique_id, recipients, authority, token)
+        if known is not None:
+            return known
 
-        # Validate recipient count
-        recipient_count = len(recipients)
-        if not (MIN_RECIPIENTS <= recipient_count <= MAX_RECIPIENTS):
-            msg = f"Recipients: expected {MIN_RECIPIENTS}-{MAX_RECIPIENTS}, got {recipient_count}"
-            return EnsureResult(status="FAILED", reason="transaction_failed", message=msg)
+        prepared = self._prepare_create(unique_id, recipients, authority, token)
+        if isinstance(prepared, EnsureResult):
+            return _record_ensured(self._splits, prepared)
+        contract_call, predicted = prepared
 
-        # Convert recipients
         try:
-            evm_recipients = to_evm_recipients(recipients)
-        except ValueError as e:
-            return EnsureResult(
-                status="FAILED",
-                reason="transaction_failed",
-                message=str(e),
-            )
-
-        # Validate total (should be 9900 bps = 99%)
-        total_bps = sum(r.percentage_bps for r in evm_recipients)
-        if total_bps != 9900:
-            return EnsureResult(
-                status="FAILED",
-                reason="transaction_failed",
-                message=f"Recipients must sum to 9900 bps (99%), got {total_bps}",
-            )
-
-        try:
-            # Predict address
-            recipient_tuples = [(r.addr, r.percentage_bps) for r in evm_recipients]
-            predicted = self.factory.functions.predictSplitAddress(
-                authority,
-                token,
-                unique_id,
-                recipient_tuples,
-            ).call()
-
-            # Check if already deployed
-            code = self.w3.eth.get_code(predicted)
-            if code and len(code) > 0:
-                return EnsureResult(status="NO_CHANGE", split=predicted)
-
-            # Build transaction with gas options
-            contract_call = self.factory.functions.createSplitConfig(authority, token, unique_id, recipient_tuples)
-            tx_params = build_tx_params(
+            # Build, sign and send with gas options
+            tx_hash = send_transaction(
                 self.w3,
-                self.account.address,
+                self.account,
                 self.chain_id,
+                contract_call,
                 DEFAULT_GAS_CREATE,
                 gas_options=gas,
-                contract_call=contract_call,
+                nonces=self._nonces,
+                fees=self._fees,
             )
-            tx = contract_call.build_transaction(tx_params)
 
-            # Sign and send
-            signed = self.account.sign_transaction(tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+            if not await_receipt:
+                return EnsureResult(status="PENDING", split=predicted, signature=tx_hash.hex())
 
             # Wait for confirmation
-            self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = self.w3.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=RECEIPT_TIMEOUT, poll_latency=self._poll_latency
+            )
 
-            return EnsureResult(
+            result = EnsureResult(
                 status="CREATED",
-                split=predicted,
+                split=_created_split_address(receipt, predicted),
                 signature=tx_hash.hex(),
             )
+            return _record_ensured(self._splits, result)
+        except Exception as e:
+            return _failure_result(e, EnsureResult)
 
-        except ContractLogicError as e:
-            return EnsureResult(
-                status="FAILED",
-                reason="transaction_reverted",
-                message=str(e),
-            )
-        except Web3Exception as e:
-            return self._handle_web3_error(e, EnsureResult)
+    def ensure_splits(self, items: Sequence[EnsureParams]) -> list[EnsureResult]:
+        """
+        Ensure many splits, pipelining the creations.
+
+        Items are validated, then their creations simulated batch_size at a
+        time in JSON-RPC batches. Splits that need creating are signed with
+        consecutive local nonces and sent back-to-back; receipts are only
+        waited for once everything is sent, so N creations take about one
+        block instead of N. A rejected send fails only its item, and the items
+        after it are signed with the resynced nonce. Items with
+        await_receipt=False come back PENDING without a wait.
+
+        Args:
+            items: EnsureParams for each split
+
+        Returns:
+            EnsureResult for each item, in input order
+        """
+        results: list[EnsureResult | None] = [None] * len(items)
+        built: list[tuple[int, ContractFunction, GasOptions | None]] = []
+        for index, params in enumerate(items):
+            known = self._known_split(params.unique_id, params.recipients, params.authority, params.token)
+            if known is not None:
+                results[index] = known
+                continue
+            contract_call = self._build_create(params.unique_id, params.recipients, params.authority, params.token)
+            if isinstance(contract_call, EnsureResult):
+                results[index] = contract_call
+            else:
+                built.append((index, contract_call, params.gas))
+
+        to_create: list[tuple[int, ContractFunction, str, GasOptions | None]] = []
+        for start in range(0, len(built), self._batch_size):
+            chunk = built[start : start + self._batch_size]
+            try:
+                outcomes = self._simulate_batch([contract_call for _, contract_call, _ in chunk])
+            except Exception as e:
+                outcomes = [e] * len(chunk)
+            for (index, contract_call, gas), outcome in zip(chunk, outcomes, strict=True):
+                if isinstance(outcome, Exception):
+                    results[index] = _simulation_failure(outcome)
+                else:
+                    to_create.append((index, contract_call, outcome, gas))
+
+        # Each creation is signed just before its send, so a rejected send leaves nothing queued
+        # behind its unused nonce: the next item is signed after the resync instead
+        sent: list[tuple[int, str, HexBytes]] = []
+        for index, contract_call, predicted, gas in to_create:
+            try:
+                raw = self._sign_create(contract_call, gas)
+            except Exception as e:
+                results[index] = _failure_result(e, EnsureResult)
+                continue
+            try:
+                tx_hash = self.w3.eth.send_raw_transaction(raw)
+            except Exception as e:
+                results[index] = _failure_result(e, EnsureResult)
+                # The rejected transaction did not use its nonce
+                self._nonces.reset()
+                continue
+            sent.append((index, predicted, tx_hash))
+
+        # Nonces are consecutive, so after the first receipt the rest are usually mined
+        for index, predicted, tx_hash in sent:
+            if not items[index].await_receipt:
+                results[index] = EnsureResult(status="PENDING", split=predicted, signature=tx_hash.hex())
+                continue
+            try:
+                receipt = self.w3.eth.wait_for_transaction_receipt(
+                    tx_hash, timeout=RECEIPT_TIMEOUT, poll_latency=self._poll_latency
+                )
+                results[index] = EnsureResult(
+                    status="CREATED",
+                    split=_created_split_address(receipt, predicted),
+                    signature=tx_hash.hex(),
+                )
+            except Exception as e:
+                results[index] = _failure_result(e, EnsureResult)
+
+        return [_record_ensured(self._splits, result) for result in cast(list[EnsureResult], results)]
+
+    def _split_implementation(self) -> str:
+        """The factory's currentImplementation, read over RPC on first use."""
+        if self._implementation is None:
+            self._implementation = _read_current_implementation(self.w3, self.factory_address)
+        return self._implementation
+
+    def _known_split(
+        self,
+        unique_id: bytes,
+        recipients: list[Recipient],
+        authority: str | None,
+        token: str | None,
+    ) -> EnsureResult | None:
+        """NO_CHANGE, without a further RPC, for a split this client has already seen deployed."""
+        if not self._splits:
+            # Nothing seen deployed yet: skip the implementation read
+            return None
+        try:
+            implementation = self._split_implementation()
+        except Exception:
+            # The ensure itself will surface the RPC failure
+            return None
+        split = _cached_split_address(
+            self._splits,
+            self.factory_address,
+            implementation,
+            authority or self.account.address,
+            token or self.default_token,
+            unique_id,
+            recipients,
+        )
+        return None if split is None else EnsureResult(status="NO_CHANGE", split=split)
+
+    def _prepare_create(
+        self,
+        unique_id: bytes,
+        recipients: list[Recipient],
+        authority: str | None,
+        token: str | None,
+    ) -> EnsureResult | tuple[ContractFunction, str]:
+        """
+        Validate a split and simulate its creation.
+
+        Returns:
+            The createSplitConfig call and predicted address, or the final
+            EnsureResult (NO_CHANGE or FAILED) when nothing should be sent
+        """
+        contract_call = self._build_create(unique_id, recipients, authority, token)
+        if isinstance(contract_call, EnsureResult):
+            return contract_call
+
+        # Simulate creation: returns the split address, or reverts with
+        # SplitAlreadyExists(split) if already deployed (one round-trip)
+        try:
+            predicted = contract_call.call({"from": self.account.address})
         except Exception as e:
+            return _simulation_failure(e)
+
+        return contract_call, predicted
+
+    def _build_create(
+        self,
+        unique_id: bytes,
+        recipients: list[Recipient],
+        authority: str | None,
+        token: str | None,
+    ) -> EnsureResult | ContractFunction:
+        """Validate a split and build its createSplitConfig call (FAILED result if invalid)."""
+        # Resolve defaults
+        authority = _to_checksum_address(authority) if authority else self.account.address
+        token = _to_checksum_address(token) if token else self.default_token
+
+        # Pad unique_id to 32 bytes
+        try:
+            unique_id = normalize_unique_id(unique_id)
+        except ValueError as e:
+            return EnsureResult(status="FAILED", reason="transaction_failed", message=str(e))
+
+        # Validate recipient count
+        recipient_count = len(recipients)
+        if not (MIN_RECIPIENTS <= recipient_count <= MAX_RECIPIENTS):
+            msg = f"Recipients: expected {MIN_RECIPIENTS}-{MAX_RECIPIENTS}, got {recipient_count}"
+            return EnsureResult(status="FAILED", reason="transaction_failed", message=msg)
+
+        # Convert recipients
+        try:
+            recipient_tuples = _recipient_tuples(recipients)
+        except ValueError as e:
             return EnsureResult(
                 status="FAILED",
                 reason="transaction_failed",
                 message=str(e),
             )
 
+        try:
+            return self._create_split_config(authority, token, unique_id, recipient_tuples)
+        except Exception as e:
+            return _failure_result(e, EnsureResult)
+
+    def _simulate_batch(self, contract_calls: list[ContractFunction]) -> list[str | Exception]:
+        """
+        Simulate createSplitConfig calls in one JSON-RPC batch of eth_calls.
+
+        Returns:
+            The predicted split address for each call, or the error it raised
+            (ContractLogicError for reverts)
+        """
+        responses = self._batch_request(
+            [
+                (
+                    RPCEndpoint("eth_call"),
+                    [
+                        {
+                            "from": self.account.address,
+                            "to": self.factory_address,
+                            "data": HexBytes(_factory_call_data("createSplitConfig", contract_call.args)).to_0x_hex(),
+                        },
+                        "latest",
+                    ],
+                )
+                for contract_call in contract_calls
+            ]
+        )
+        outcomes: list[str | Exception] = []
+        for response in responses:
+            error = response.get("error")
+            if error is None:
+                (address,) = abi_decode(["address"], HexBytes(response["result"]))
+                outcomes.append(_to_checksum_address(address))
+            elif "data" in error or "revert" in str(error.get("message", "")):
+                outcomes.append(ContractLogicError(str(error.get("message")), data=error.get("data")))
+            else:
+                outcomes.append(Web3RPCError(str(error.get("message"))))
+        return outcomes
+
+    def _sign_create(self, contract_call: ContractFunction, gas: GasOptions | None) -> bytes:
+        """Build and sign a createSplitConfig transaction, reserving the next local nonce."""
+        tx_params = build_tx_params(
+            self.w3,
+            self.account.address,
+            self.chain_id,
+            DEFAULT_GAS_CREATE,
+            gas_options=gas,
+            contract_call=contract_call,
+            nonce=0,
+            fees=self._fees,
+        )
+        tx = _encoded_transaction(contract_call, tx_params) or contract_call.build_transaction(tx_params)
+        # Reserved last so a failed build doesn't leave a nonce gap
+        tx["nonce"] = self._nonces.next_nonce()
+        return bytes(self.account.sign_transaction(tx).raw_transaction)
+
+    def _batch_request(self, requests: list[tuple[RPCEndpoint, Any]]) -> list[RPCResponse]:
+        """Send requests in one JSON-RPC batch; one response per request, in order."""
+        if not requests:
+            return []
+        responses = self.w3.provider.make_batch_request(requests)
+        if not isinstance(responses, list):
+            # The node rejected the whole batch
+            return [responses] * len(requests)
+        return responses
+
     def execute_split(
         self,
         split_address: str,
         min_balance: int | None = None,
         gas: GasOptions | None = None,
+        await_receipt: bool = True,
+        return_preview: bool = False,
     ) -> ExecuteResult:
         """
         Execute split distribution (permissionless).
@@ -242,85 +582,130 @@ class CascadeSplitsClient:
             split_address: Address of the split to execute
             min_balance: Minimum balance required (skip if below)
             gas: Gas options (estimation, EIP-1559 fees)
+            await_receipt: Wait for the execution to be mined (False returns PENDING once sent)
+            return_preview: Read previewExecution in the pre-check round-trip and set result.preview
 
         Returns:
-            ExecuteResult with status EXECUTED, SKIPPED, or FAILED
+            ExecuteResult with status EXECUTED, SKIPPED, PENDING, or FAILED
         """
-        split_address = Web3.to_checksum_address(split_address)
+        split_address = _to_checksum_address(split_address)
 
         try:
-            # Check if valid split
-            if not _is_cascade_split(self.w3, split_address):
+            # Known non-splits are skipped without an RPC
+            is_valid = self._splits.get(split_address)
+            if is_valid is False:
                 return ExecuteResult(status="SKIPPED", reason="not_a_split")
 
-            # Check balance threshold
-            if min_balance is not None:
-                balance = _get_split_balance(self.w3, split_address)
-                if balance < min_balance:
-                    return ExecuteResult(status="SKIPPED", reason="below_threshold")
+            # Pre-flight checks (and the preview, if asked for) in a single round-trip;
+            # failed sub-calls come back as None
+            reads = _read_split_views(self.w3, split_address, _preflight_views(bool(is_valid), return_preview))
+            preview, executable = _pop_preflight_extras(reads, return_preview)
+            *checked, balance, pending = reads
 
-            # Check pending funds
-            if not _has_pending_funds(self.w3, split_address):
-                return ExecuteResult(status="SKIPPED", reason="no_pending_funds")
+            # Check if valid split
+            if checked:
+                if checked[0] is None:
+                    # The split check failed: unknown, not "not a split", so don't skip or cache it
+                    return ExecuteResult(
+                        status="FAILED",
+                        reason="transaction_failed",
+                        message="split check read failed",
+                        preview=preview,
+                    )
+                is_valid = bool(checked[0])
+                self._splits.set(split_address, is_valid)
+                if not is_valid:
+                    return ExecuteResult(status="SKIPPED", reason="not_a_split")
+
+            # A failed balance or pending-funds read is not a "no": fail rather than skip
+            if balance is None or pending is None:
+                return ExecuteResult(
+                    status="FAILED",
+                    reason="transaction_failed",
+                    message="pre-flight read failed",
+                    preview=preview,
+                )
 
-            # Create contract instance
-            split_contract = self.w3.eth.contract(
-                address=split_address,
-                abi=SPLIT_CONFIG_IMPL_ABI,
-            )
+            # Check balance threshold
+            if min_balance is not None and balance < min_balance:
+                return ExecuteResult(status="SKIPPED", reason="below_threshold", preview=preview)
 
-            # Build transaction with gas options
-            contract_call = split_contract.functions.executeSplit()
-            tx_params = build_tx_params(
+            # Check pending funds
+            if not pending:
+                return ExecuteResult(status="SKIPPED", reason="no_pending_funds", preview=preview)
+
+            # executeSplit was simulated in the same round-trip: don't send a transaction that would revert
+            if not executable:
+                return ExecuteResult(
+                    status="FAILED",
+                    reason="transaction_reverted",
+                    message="executeSplit reverted in simulation",
+                    preview=preview,
+                )
+
+            # Build, sign and send with gas options
+            contract_call = _contract(self.w3, split_address).functions.executeSplit()
+            tx_hash = send_transaction(
                 self.w3,
-                self.account.address,
+                self.account,
                 self.chain_id,
+                contract_call,
                 DEFAULT_GAS_EXECUTE,
                 gas_options=gas,
-                contract_call=contract_call,
+                nonces=self._nonces,
+                fees=self._fees,
             )
-            tx = contract_call.build_transaction(tx_params)
 
-            # Sign and send
-            signed = self.account.sign_transaction(tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+            if not await_receipt:
+                return ExecuteResult(status="PENDING", signature=tx_hash.hex(), preview=preview)
 
             # Wait for confirmation
-            self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=RECEIPT_TIMEOUT, poll_latency=self._poll_latency)
 
-            return ExecuteResult(status="EXECUTED", signature=tx_hash.hex())
+            return ExecuteResult(status="EXECUTED", signature=tx_hash.hex(), preview=preview)
 
-        except ContractLogicError as e:
-            return ExecuteResult(
-                status="FAILED",
-                reason="transaction_reverted",
-                message=str(e),
-            )
-        except Web3Exception as e:
-            return self._handle_web3_error(e, ExecuteResult)
         except Exception as e:
-            return ExecuteResult(
-                status="FAILED",
-                reason="transaction_failed",
-                message=str(e),
-            )
+            return _failure_result(e, ExecuteResult)
 
     def is_cascade_split(self, address: str) -> bool:
-        """Check if an address is a valid Cascade split."""
-        return _is_cascade_split(self.w3, address)
+        """Check if an address is a valid Cascade split (memoized per client)."""
+        return _is_cascade_split(self.w3, address, cache=self._splits)
 
     def get_split_balance(self, split_address: str) -> int:
         """Get the token balance of a split (in smallest unit)."""
         return _get_split_balance(self.w3, split_address)
 
     def get_split_config(self, split_address: str) -> SplitConfig | None:
-        """Get the configuration of a split. Returns None if not a valid split."""
-        return _get_split_config(self.w3, split_address)
+        """Get the configuration of a split. Returns None if not a valid split (memoized per client)."""
+        return _get_split_config(self.w3, split_address, cache=self._splits)
 
     def preview_execution(self, split_address: str) -> ExecutionPreview:
         """Preview what would happen if the split is executed."""
         return _preview_execution(self.w3, split_address)
 
+    def get_split_snapshot(self, split_address: str) -> SplitSnapshot:
+        """Get a split's config, balance, pending amounts and preview in one round-trip."""
+        snapshot = _get_split_snapshot(self.w3, split_address)
+        self._remember_snapshot(split_address, snapshot)
+        return snapshot
+
+    def get_split_snapshots(self, split_addresses: Sequence[str]) -> list[SplitSnapshot]:
+        """Get the snapshots of many splits in one round-trip, in the order given."""
+        snapshots = _get_split_snapshots(self.w3, split_addresses)
+        for split_address, snapshot in zip(split_addresses, snapshots, strict=True):
+            self._remember_snapshot(split_address, snapshot)
+        return snapshots
+
+    def _remember_snapshot(self, split_address: str, snapshot: SplitSnapshot) -> None:
+        """Record what a snapshot showed about a split in the split cache."""
+        if snapshot.is_split is None:
+            # The split check failed: nothing is known
+            return
+        if snapshot.config is not None:
+            self._splits.set_config(split_address, snapshot.config)
+        else:
+            self._splits.set(split_address, snapshot.is_split)
+
     def predict_split_address(
         self,
         unique_id: bytes,
@@ -332,54 +717,28 @@ class CascadeSplitsClient:
         Predict the address of a split before creation.
 
         Args:
-            unique_id: Unique identifier (32 bytes)
+            unique_id: Unique identifier (up to 32 bytes, zero-padded)
             recipients: List of recipients with shares
             authority: Authority address (defaults to wallet)
             token: Token address (defaults to USDC)
 
         Returns:
             Predicted split address
-        """
-        authority = Web3.to_checksum_address(authority or self.account.address)
-        token = Web3.to_checksum_address(token or self.default_token)
 
-        # Pad unique_id
-        if len(unique_id) < 32:
-            unique_id = unique_id.ljust(32, b"\x00")
-        elif len(unique_id) > 32:
-            unique_id = unique_id[:32]
+        Raises:
+            ValueError: If unique_id is longer than 32 bytes or shares don't sum to 100
+        """
+        authority = _to_checksum_address(authority) if authority else self.account.address
+        token = _to_checksum_address(token) if token else self.default_token
 
-        evm_recipients = to_evm_recipients(recipients)
-        recipient_tuples = [(r.addr, r.percentage_bps) for r in evm_recipients]
+        unique_id = normalize_unique_id(unique_id)
+        recipient_tuples = _recipient_tuples(recipients)
 
-        return self.factory.functions.predictSplitAddress(
+        return _compute_split_address(
+            self.factory_address,
+            self._split_implementation(),
             authority,
             token,
             unique_id,
             recipient_tuples,
-        ).call()
-
-    @staticmethod
-    def _handle_web3_error(e: Web3Exception, result_class: type[_T]) -> _T:
-        """Map Web3Exception to appropriate result type."""
-        message = str(e).lower()
-
-        if "rejected" in message or "denied" in message:
-            return result_class(
-                status="FAILED",
-                reason="wallet_rejected",
-                message="Transaction rejected",
-            )
-
-        if "gas" in message or "insufficient" in message:
-            return result_class(
-                status="FAILED",
-                reason="insufficient_gas",
-                message=str(e),
-            )
-
-        return result_class(
-            status="FAILED",
-            reason="transaction_failed",
-            message=str(e),
         )
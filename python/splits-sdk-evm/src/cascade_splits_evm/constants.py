@@ -1,38 +1,69 @@
-"""Contract addresses and chain constants for Cascade Splits EVM SDK."""
+"""Contract addresses and chain constants for Cascade Splits EVM SDK.
+
+Addresses are stored EIP-55 checksummed, so lookups need no keccak at runtime.
+Address maps are read-only views, so they cannot be changed by accident.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from eth_typing import ChecksumAddress
 
 from ._exceptions import ChainNotSupportedError
 
 # Deployed SplitFactory contract addresses per chain.
 # Deterministic addresses (same on ALL EVM chains via CREATE2).
-SPLIT_FACTORY_ADDRESSES: dict[int, str] = {
-    8453: "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7",  # Base mainnet
-    84532: "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7",  # Base Sepolia
-}
+SPLIT_FACTORY_ADDRESSES: Mapping[int, ChecksumAddress] = MappingProxyType(
+    {
+        8453: ChecksumAddress("0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"),  # Base mainnet
+        84532: ChecksumAddress("0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"),  # Base Sepolia
+    }
+)
 
 # USDC contract addresses per chain.
-USDC_ADDRESSES: dict[int, str] = {
-    8453: "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # Base mainnet
-    84532: "0x036CbD53842c5426634e7929541eC2318f3dCF7e",  # Base Sepolia
-}
+USDC_ADDRESSES: Mapping[int, ChecksumAddress] = MappingProxyType(
+    {
+        8453: ChecksumAddress("0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"),  # Base mainnet
+        84532: ChecksumAddress("0x036CbD53842c5426634e7929541eC2318f3dCF7e"),  # Base Sepolia
+    }
+)
+
+# Multicall3 contract address (same on all EVM chains, including Base and Base Sepolia).
+MULTICALL3_ADDRESS = ChecksumAddress("0xcA11bde05977b3631167028862bE2a173976CA11")
 
 # Supported chain IDs
-SUPPORTED_CHAIN_IDS: list[int] = [8453, 84532]
+SUPPORTED_CHAIN_IDS: frozenset[int] = frozenset(SPLIT_FACTORY_ADDRESSES)
+
+# Transaction receipt waiting (Base produces a block every ~2s)
+RECEIPT_TIMEOUT = 120  # seconds
+RECEIPT_POLL_LATENCY = 0.25  # seconds between polls on HTTP providers
+
+# EIP-1559 fee estimates are reused for about one Ethereum slot
+FEE_CACHE_TTL = 12  # seconds
+
+# MulticallBatcher: concurrent eth_calls gathered for up to this long, or this many, per aggregate3
+MULTICALL_BATCH_WINDOW = 0.02  # seconds
+MULTICALL_BATCH_SIZE = 50
+
+# is_cascade_split memo: splits are immutable, non-splits may be deployed later
+SPLIT_CACHE_MAX_SIZE = 10_000
+SPLIT_CACHE_NEGATIVE_TTL = 60  # seconds
 
 # Recipient limits (enforced by contract)
 MIN_RECIPIENTS = 1
 MAX_RECIPIENTS = 20
 
 
-def get_split_factory_address(chain_id: int) -> str:
-    """Get the SplitFactory address for a given chain ID."""
+def get_split_factory_address(chain_id: int) -> ChecksumAddress:
+    """Get the (checksummed) SplitFactory address for a given chain ID."""
     address = SPLIT_FACTORY_ADDRESSES.get(chain_id)
     if not address:
         raise ChainNotSupportedError(chain_id)
     return address
 
 
-def get_usdc_address(chain_id: int) -> str:
-    """Get the USDC address for a given chain ID."""
+def get_usdc_address(chain_id: int) -> ChecksumAddress:
+    """Get the (checksummed) USDC address for a given chain ID."""
     address = USDC_ADDRESSES.get(chain_id)
     if not address:
         raise ChainNotSupportedError(chain_id)
@@ -41,4 +72,4 @@ def get_usdc_address(chain_id: int) -> str:
 
 def is_supported_chain(chain_id: int) -> bool:
     """Check if a chain is supported."""
-    return chain_id in SPLIT_FACTORY_ADDRESSES
+    return chain_id in SUPPORTED_CHAIN_IDS
@@ -1,17 +1,31 @@
 """Standalone ensure_split operation for Cascade Splits."""
 
+from concurrent.futures import Executor
+
 from eth_account.signers.local import LocalAccount
 from web3 import AsyncWeb3
-from web3.exceptions import ContractLogicError, Web3Exception
+from web3.exceptions import ContractLogicError
 
-from .abi import SPLIT_FACTORY_ABI
 from .async_helpers import (
     DEFAULT_GAS_CREATE,
-    build_tx_params,
+    _chain_id,
+    _contract,
+    _gather_all,
     get_default_token,
-    to_evm_recipients,
+    send_transaction,
+    wait_for_receipt,
+)
+from .constants import MAX_RECIPIENTS, MIN_RECIPIENTS, RECEIPT_POLL_LATENCY
+from .fees import AsyncFeeCache
+from .helpers import (
+    _created_split_address,
+    _failure_result,
+    _recipient_tuples,
+    _to_checksum_address,
+    existing_split_from_revert,
+    normalize_unique_id,
 )
-from .constants import MAX_RECIPIENTS, MIN_RECIPIENTS
+from .nonce import AsyncNonceManager
 from .types import EnsureParams, EnsureResult
 
 
@@ -20,12 +34,18 @@ async def ensure_split(
     account: LocalAccount,
     factory_address: str,
     params: EnsureParams,
+    nonces: AsyncNonceManager | None = None,
+    signing_executor: Executor | None = None,
+    fees: AsyncFeeCache | None = None,
+    chain_id: int | None = None,
+    poll_latency: float = RECEIPT_POLL_LATENCY,
 ) -> EnsureResult:
     """
     Idempotent split creation.
 
     - If split doesn't exist: creates it and returns CREATED
     - If split exists with same params: returns NO_CHANGE
+    - If params.await_receipt is False: returns PENDING once the creation is sent
     - If creation fails: returns FAILED with details
 
     Note: Unlike Solana, EVM splits are immutable (cannot update recipients).
@@ -35,9 +55,14 @@ async def ensure_split(
         account: Account to sign the transaction
         factory_address: The split factory contract address
         params: EnsureParams with unique_id, recipients, optional authority/token
+        nonces: Optional shared nonce tracker (required for concurrent sends from one account)
+        signing_executor: Optional executor to sign in, off the event loop
+        fees: Optional shared EIP-1559 fee cache (saves fee lookups per send)
+        chain_id: Optional known chain ID (saves an eth_chainId call per operation)
+        poll_latency: Seconds between receipt polls on HTTP providers
 
     Returns:
-        EnsureResult with status CREATED, NO_CHANGE, or FAILED
+        EnsureResult with status CREATED, NO_CHANGE, PENDING, or FAILED
 
     Example:
         >>> from web3 import AsyncWeb3
@@ -56,19 +81,19 @@ async def ensure_split(
         ...     ]
         ... ))
     """
-    factory_address = AsyncWeb3.to_checksum_address(factory_address)
-    chain_id = await w3.eth.chain_id
+    factory_address = _to_checksum_address(factory_address)
+    if chain_id is None:
+        chain_id = await _chain_id(w3)
 
     # Resolve defaults
-    authority = AsyncWeb3.to_checksum_address(params.authority or account.address)
-    token = AsyncWeb3.to_checksum_address(params.token or get_default_token(chain_id))
+    authority = _to_checksum_address(params.authority) if params.authority else account.address
+    token = _to_checksum_address(params.token) if params.token else get_default_token(chain_id)
 
-    # Pad/truncate unique_id to 32 bytes
-    unique_id = params.unique_id
-    if len(unique_id) < 32:
-        unique_id = unique_id.ljust(32, b"\x00")
-    elif len(unique_id) > 32:
-        unique_id = unique_id[:32]
+    # Pad unique_id to 32 bytes
+    try:
+        unique_id = normalize_unique_id(params.unique_id)
+    except ValueError as e:
+        return EnsureResult(status="FAILED", reason="transaction_failed", message=str(e))
 
     # Validate recipient count
     recipient_count = len(params.recipients)
@@ -78,7 +103,7 @@ async def ensure_split(
 
     # Convert recipients
     try:
-        evm_recipients = to_evm_recipients(params.recipients)
+        recipient_tuples = _recipient_tuples(params.recipients)
     except ValueError as e:
         return EnsureResult(
             status="FAILED",
@@ -86,86 +111,51 @@ async def ensure_split(
             message=str(e),
         )
 
-    # Validate total (should be 9900 bps = 99%)
-    total_bps = sum(r.percentage_bps for r in evm_recipients)
-    if total_bps != 9900:
-        return EnsureResult(
-            status="FAILED",
-            reason="transaction_failed",
-            message=f"Recipients must sum to 9900 bps (99%), got {total_bps}",
-        )
-
     try:
-        factory = w3.eth.contract(address=factory_address, abi=SPLIT_FACTORY_ABI)
-        recipient_tuples = [(r.addr, r.percentage_bps) for r in evm_recipients]
-
-        # Predict address
-        predicted = await factory.functions.predictSplitAddress(
-            authority,
-            token,
-            unique_id,
-            recipient_tuples,
-        ).call()
-
-        # Check if already deployed
-        code = await w3.eth.get_code(predicted)
-        if code and len(code) > 0:
-            return EnsureResult(status="NO_CHANGE", split=predicted)
-
-        # Build transaction with gas options
+        factory = _contract(w3, factory_address, "factory")
         contract_call = factory.functions.createSplitConfig(authority, token, unique_id, recipient_tuples)
-        tx_params = await build_tx_params(
+
+        # Simulate creation: returns the split address, or reverts with
+        # SplitAlreadyExists(split) if already deployed (one round-trip).
+        # Without a nonce tracker the nonce is read in the same round-trip.
+        simulation = contract_call.call({"from": account.address})
+        nonce = None
+        try:
+            if nonces is None:
+                predicted, nonce = await _gather_all(simulation, w3.eth.get_transaction_count(account.address))
+            else:
+                predicted = await simulation
+        except ContractLogicError as e:
+            existing = existing_split_from_revert(e)
+            if existing is None:
+                raise
+            return EnsureResult(status="NO_CHANGE", split=existing)
+
+        # Build, sign and send with gas options
+        tx_hash = await send_transaction(
             w3,
-            account.address,
+            account,
             chain_id,
+            contract_call,
             DEFAULT_GAS_CREATE,
             gas_options=params.gas,
-            contract_call=contract_call,
+            nonces=nonces,
+            signing_executor=signing_executor,
+            fees=fees,
+            nonce=nonce,
         )
-        tx = await contract_call.build_transaction(tx_params)
 
-        # Sign and send
-        signed = account.sign_transaction(tx)
-        tx_hash = await w3.eth.send_raw_transaction(signed.raw_transaction)
+        if not params.await_receipt:
+            return EnsureResult(status="PENDING", split=predicted, signature=tx_hash.hex())
 
         # Wait for confirmation
-        await w3.eth.wait_for_transaction_receipt(tx_hash)
+        receipt = await wait_for_receipt(w3, tx_hash, poll_latency)
 
         return EnsureResult(
             status="CREATED",
-            split=predicted,
+            split=_created_split_address(receipt, predicted),
             signature=tx_hash.hex(),
         )
 
-    except ContractLogicError as e:
-        return EnsureResult(
-            status="FAILED",
-            reason="transaction_reverted",
-            message=str(e),
-        )
-    except Web3Exception as e:
-        message = str(e).lower()
-        if "rejected" in message or "denied" in message:
-            return EnsureResult(
-                status="FAILED",
-                reason="wallet_rejected",
-                message="Transaction rejected",
-            )
-        if "gas" in message or "insufficient" in message:
-            return EnsureResult(
-                status="FAILED",
-                reason="insufficient_gas",
-                message=str(e),
-            )
-        return EnsureResult(
-            status="FAILED",
-            reason="transaction_failed",
-            message=str(e),
-        )
     except Exception as e:
-        # Unexpected errors (network issues, etc.)
-        return EnsureResult(
-            status="FAILED",
-            reason="transaction_failed",
-            message=str(e),
-        )
+        return _failure_result(e, EnsureResult)
@@ -1,17 +1,25 @@
 """Standalone execute_split operation for Cascade Splits."""
 
+from concurrent.futures import Executor
+
 from eth_account.signers.local import LocalAccount
 from web3 import AsyncWeb3
-from web3.exceptions import ContractLogicError, Web3Exception
 
-from .abi import SPLIT_CONFIG_IMPL_ABI
 from .async_helpers import (
     DEFAULT_GAS_EXECUTE,
-    build_tx_params,
-    get_split_balance,
-    has_pending_funds,
-    is_cascade_split,
+    _chain_id,
+    _contract,
+    _gather_all,
+    _read_split_views,
+    send_transaction,
+    wait_for_receipt,
 )
+from .constants import RECEIPT_POLL_LATENCY
+from .fees import AsyncFeeCache
+from .helpers import _failure_result, _pop_preflight_extras, _preflight_views, _to_checksum_address
+from .multicall_batcher import MulticallBatcher
+from .nonce import AsyncNonceManager
+from .split_cache import SplitCache
 from .types import ExecuteOptions, ExecuteResult
 
 
@@ -20,6 +28,13 @@ async def execute_split(
     account: LocalAccount,
     split_address: str,
     options: ExecuteOptions | None = None,
+    nonces: AsyncNonceManager | None = None,
+    signing_executor: Executor | None = None,
+    fees: AsyncFeeCache | None = None,
+    splits: SplitCache | None = None,
+    chain_id: int | None = None,
+    poll_latency: float = RECEIPT_POLL_LATENCY,
+    batcher: MulticallBatcher | None = None,
 ) -> ExecuteResult:
     """
     Execute split distribution.
@@ -28,6 +43,7 @@ async def execute_split(
     - If balance is below threshold: returns SKIPPED
     - If no pending funds: returns SKIPPED
     - On success: returns EXECUTED with transaction hash
+    - If options.await_receipt is False: returns PENDING with the hash once sent
     - On failure: returns FAILED with details
 
     This is a permissionless operation - anyone can call it.
@@ -36,10 +52,17 @@ async def execute_split(
         w3: AsyncWeb3 instance connected to the chain
         account: Account to sign the transaction
         split_address: Address of the split to execute
-        options: Optional ExecuteOptions with min_balance threshold
+        options: Optional ExecuteOptions (min_balance threshold, gas, await_receipt, return_preview)
+        nonces: Optional shared nonce tracker (required for concurrent sends from one account)
+        signing_executor: Optional executor to sign in, off the event loop
+        fees: Optional shared EIP-1559 fee cache (saves fee lookups per send)
+        splits: Optional is_cascade_split cache (saves the split check on repeat executions)
+        chain_id: Optional known chain ID (saves an eth_chainId call per operation)
+        poll_latency: Seconds between receipt polls on HTTP providers
+        batcher: Optional MulticallBatcher to send the pre-checks with other concurrent reads
 
     Returns:
-        ExecuteResult with status EXECUTED, SKIPPED, or FAILED
+        ExecuteResult with status EXECUTED, SKIPPED, PENDING, or FAILED
 
     Example:
         >>> from web3 import AsyncWeb3
@@ -54,81 +77,97 @@ async def execute_split(
         ...     ExecuteOptions(min_balance=1_000_000)  # 1 USDC minimum
         ... )
     """
-    split_address = AsyncWeb3.to_checksum_address(split_address)
-    chain_id = await w3.eth.chain_id
+    split_address = _to_checksum_address(split_address)
 
     try:
-        # Check if valid split
-        if not await is_cascade_split(w3, split_address):
+        # Known non-splits are skipped without an RPC
+        is_valid = splits.get(split_address) if splits is not None else None
+        if is_valid is False:
             return ExecuteResult(status="SKIPPED", reason="not_a_split")
 
+        # Pre-flight checks (and the preview, if asked for) in a single round-trip;
+        # failed sub-calls come back as None
+        min_balance = options.min_balance if options else None
+        return_preview = options.return_preview if options else False
+        reads = await _read_split_views(w3, split_address, _preflight_views(bool(is_valid), return_preview), batcher)
+        preview, executable = _pop_preflight_extras(reads, return_preview)
+        *checked, balance, pending = reads
+
+        # Check if valid split
+        if checked:
+            if checked[0] is None:
+                # The split check failed: unknown, not "not a split", so don't skip or cache it
+                return ExecuteResult(
+                    status="FAILED",
+                    reason="transaction_failed",
+                    message="split check read failed",
+                    preview=preview,
+                )
+            is_valid = bool(checked[0])
+            if splits is not None:
+                splits.set(split_address, is_valid)
+            if not is_valid:
+                return ExecuteResult(status="SKIPPED", reason="not_a_split")
+
+        # A failed balance or pending-funds read is not a "no": fail rather than skip
+        if balance is None or pending is None:
+            return ExecuteResult(
+                status="FAILED",
+                reason="transaction_failed",
+                message="pre-flight read failed",
+                preview=preview,
+            )
+
         # Check balance threshold
-        if options and options.min_balance is not None:
-            balance = await get_split_balance(w3, split_address)
-            if balance < options.min_balance:
-                return ExecuteResult(status="SKIPPED", reason="below_threshold")
+        if min_balance is not None and balance < min_balance:
+            return ExecuteResult(status="SKIPPED", reason="below_threshold", preview=preview)
 
         # Check pending funds
-        if not await has_pending_funds(w3, split_address):
-            return ExecuteResult(status="SKIPPED", reason="no_pending_funds")
+        if not pending:
+            return ExecuteResult(status="SKIPPED", reason="no_pending_funds", preview=preview)
+
+        # executeSplit was simulated in the same round-trip: don't send a transaction that would revert
+        if not executable:
+            return ExecuteResult(
+                status="FAILED",
+                reason="transaction_reverted",
+                message="executeSplit reverted in simulation",
+                preview=preview,
+            )
+
+        # Read what the send still needs (chain ID, nonce without a tracker) in one round-trip
+        nonce = None
+        if chain_id is None and nonces is None:
+            chain_id, nonce = await _gather_all(_chain_id(w3), w3.eth.get_transaction_count(account.address))
+        elif chain_id is None:
+            chain_id = await _chain_id(w3)
 
         # Create contract instance
-        split_contract = w3.eth.contract(
-            address=split_address,
-            abi=SPLIT_CONFIG_IMPL_ABI,
-        )
+        split_contract = _contract(w3, split_address)
 
-        # Build transaction with gas options
+        # Build, sign and send with gas options
         contract_call = split_contract.functions.executeSplit()
         gas_opts = options.gas if options else None
-        tx_params = await build_tx_params(
+        tx_hash = await send_transaction(
             w3,
-            account.address,
+            account,
             chain_id,
+            contract_call,
             DEFAULT_GAS_EXECUTE,
             gas_options=gas_opts,
-            contract_call=contract_call,
+            nonces=nonces,
+            signing_executor=signing_executor,
+            fees=fees,
+            nonce=nonce,
         )
-        tx = await contract_call.build_transaction(tx_params)
 
-        # Sign and send
-        signed = account.sign_transaction(tx)
-        tx_hash = await w3.eth.send_raw_transaction(signed.raw_transaction)
+        if options is not None and not options.await_receipt:
+            return ExecuteResult(status="PENDING", signature=tx_hash.hex(), preview=preview)
 
         # Wait for confirmation
-        await w3.eth.wait_for_transaction_receipt(tx_hash)
+        await wait_for_receipt(w3, tx_hash, poll_latency)
 
-        return ExecuteResult(status="EXECUTED", signature=tx_hash.hex())
+        return ExecuteResult(status="EXECUTED", signature=tx_hash.hex(), preview=preview)
 
-    except ContractLogicError as e:
-        return ExecuteResult(
-            status="FAILED",
-            reason="transaction_reverted",
-            message=str(e),
-        )
-    except Web3Exception as e:
-        message = str(e).lower()
-        if "rejected" in message or "denied" in message:
-            return ExecuteResult(
-                status="FAILED",
-                reason="wallet_rejected",
-                message="Transaction rejected",
-            )
-        if "gas" in message or "insufficient" in message:
-            return ExecuteResult(
-                status="FAILED",
-                reason="insufficient_gas",
-                message=str(e),
-            )
-        return ExecuteResult(
-            status="FAILED",
-            reason="transaction_failed",
-            message=str(e),
-        )
     except Exception as e:
-        # Unexpected errors (network issues, etc.)
-        return ExecuteResult(
-            status="FAILED",
-            reason="transaction_failed",
-            message=str(e),
-        )
+        return _failure_result(e, ExecuteResult)
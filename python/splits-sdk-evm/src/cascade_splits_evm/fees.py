@@ -0,0 +1,81 @@
+"""Cached EIP-1559 fee estimates for Cascade Splits EVM SDK."""
+
+import asyncio
+import threading
+import time
+
+from web3 import AsyncWeb3, Web3
+from web3.types import FeeHistory
+
+from .constants import FEE_CACHE_TTL
+
+# eth_feeHistory window: recent blocks and the reward percentile used as the tip
+FEE_HISTORY_BLOCKS = 5
+FEE_HISTORY_PERCENTILE = 50
+
+
+def fees_from_history(history: FeeHistory) -> tuple[int, int]:
+    """
+    Derive (max_fee_per_gas, max_priority_fee_per_gas) from an eth_feeHistory result.
+
+    The tip is the median of the per-block 50th percentile rewards. The max fee
+    allows the next block's base fee to double (as web3's own default does), so
+    a cached estimate stays valid for several blocks; only the actual base fee
+    plus tip is paid.
+    """
+    # The last entry is the base fee of the next (pending) block
+    base_fee = history["baseFeePerGas"][-1]
+    rewards = sorted(block[0] for block in history.get("reward", []) if block)
+    priority_fee = _median(rewards)
+    return 2 * base_fee + priority_fee, priority_fee
+
+
+def _median(values: list[int]) -> int:
+    """Median of sorted wei amounts in integer math (0 if empty), exact at any size."""
+    if not values:
+        return 0
+    mid = len(values) // 2
+    return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) // 2
+
+
+class FeeCache:
+    """
+    EIP-1559 fees from one eth_feeHistory call, reused for FEE_CACHE_TTL seconds.
+
+    Without explicit fees, build_transaction looks them up on every send
+    (eth_maxPriorityFeePerGas plus the latest block).
+    """
+
+    def __init__(self, w3: Web3) -> None:
+        self._w3 = w3
+        self._lock = threading.Lock()
+        self._fetched_at = 0.0
+        self._fees: tuple[int, int] | None = None
+
+    def fees(self) -> tuple[int, int]:
+        """Return (max_fee_per_gas, max_priority_fee_per_gas), refreshing when stale."""
+        with self._lock:
+            if self._fees is None or time.monotonic() - self._fetched_at > FEE_CACHE_TTL:
+                history = self._w3.eth.fee_history(FEE_HISTORY_BLOCKS, "latest", [FEE_HISTORY_PERCENTILE])
+                self._fees = fees_from_history(history)
+                self._fetched_at = time.monotonic()
+            return self._fees
+
+
+class AsyncFeeCache:
+    """Async version of FeeCache; concurrent sends share one refresh."""
+
+    def __init__(self, w3: AsyncWeb3) -> None:
+        self._w3 = w3
+        self._lock = asyncio.Lock()
+        self._fetched_at = 0.0
+        self._fees: tuple[int, int] | None = None
+
+    async def fees(self) -> tuple[int, int]:
+        """Return (max_fee_per_gas, max_priority_fee_per_gas), refreshing when stale."""
+        async with self._lock:
+            if self._fees is None or time.monotonic() - self._fetched_at > FEE_CACHE_TTL:
+                history = await self._w3.eth.fee_history(FEE_HISTORY_BLOCKS, "latest", [FEE_HISTORY_PERCENTILE])
+                self._fees = fees_from_history(history)
+                self._fetched_at = time.monotonic()
+            return self._fees
@@ -1,12 +1,52 @@
 """Helper functions for Cascade Splits EVM SDK."""
 
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any, Literal, TypeVar
+
+from eth_account.signers.local import LocalAccount
 from eth_typing import ChecksumAddress
+from eth_utils.abi import (
+    function_abi_to_4byte_selector,
+    function_signature_to_4byte_selector,
+    get_abi_input_types,
+    get_abi_output_types,
+)
+from hexbytes import HexBytes
 from web3 import Web3
-from web3.contract.contract import ContractFunction
-
-from .abi import SPLIT_CONFIG_IMPL_ABI, SPLIT_FACTORY_ABI
-from .constants import get_usdc_address
-from .types import EvmRecipient, ExecutionPreview, GasOptions, Recipient, SplitConfig
+from web3.contract.contract import Contract, ContractFunction
+from web3.exceptions import ContractLogicError, TransactionNotFound, Web3Exception, Web3RPCError
+from web3.types import RPCEndpoint, RPCResponse, TxReceipt
+
+from ._codec import abi_decode, abi_encode, to_checksum_address
+from .abi import (
+    EVENT_TOPICS,
+    FACTORY_ABI_BY_NAME,
+    MULTICALL3_ABI,
+    SPLIT_CONFIG_ABI_BY_NAME,
+    SPLIT_CONFIG_IMPL_ABI,
+    SPLIT_FACTORY_ABI,
+)
+from .constants import MAX_RECIPIENTS, MULTICALL3_ADDRESS, get_usdc_address
+from .fees import FeeCache
+from .nonce import NonceManager, is_nonce_error
+from .split_cache import SplitCache
+from .types import (
+    EnsureResult,
+    EvmRecipient,
+    ExecuteResult,
+    ExecutionPreview,
+    FailedReason,
+    GasOptions,
+    Recipient,
+    SplitConfig,
+    SplitSnapshot,
+)
+
+_T = TypeVar("_T", EnsureResult, ExecuteResult)
 
 # Type alias for transaction params
 TxParams = dict[str, int | str]
@@ -16,6 +56,151 @@ DEFAULT_GAS_CREATE = 300_000
 DEFAULT_GAS_EXECUTE = 600_000
 DEFAULT_PRIORITY_FEE = 1_000_000_000  # 1 gwei
 
+# Linear fit (rounded up) of the measured gas costs in docs/specification-evm.md
+CREATE_GAS_BASE = 73_000
+CREATE_GAS_PER_RECIPIENT = 10_200
+EXECUTE_GAS_BASE = 38_000
+EXECUTE_GAS_PER_RECIPIENT = 26_500
+
+# Upper bound for memoized addresses / contract instances
+CACHE_SIZE = 1024
+
+ContractKind = Literal["split", "factory", "multicall3"]
+
+_ABIS: dict[ContractKind, list[dict[str, Any]]] = {
+    "split": SPLIT_CONFIG_IMPL_ABI,
+    "factory": SPLIT_FACTORY_ABI,
+    "multicall3": MULTICALL3_ABI,
+}
+
+
+# SplitFactory.createSplitConfig reverts with SplitAlreadyExists(address predicted) on duplicates
+SPLIT_ALREADY_EXISTS_SELECTOR = function_signature_to_4byte_selector("SplitAlreadyExists(address)")
+
+# JSON-RPC error codes that identify the failure without scanning the message
+# (EIP-1193 4001: user rejected the request; geth 3: execution reverted)
+_ERROR_CODE_REASONS: dict[int, FailedReason] = {
+    4001: "wallet_rejected",
+    3: "transaction_reverted",
+}
+
+# Web3Exception message keywords -> failure reason (one scan, first keyword in the message wins)
+_ERROR_REASON_RE = re.compile(r"rejected|denied|revert|gas|insufficient", re.IGNORECASE)
+_ERROR_REASONS: dict[str, FailedReason] = {
+    "rejected": "wallet_rejected",
+    "denied": "wallet_rejected",
+    "revert": "transaction_reverted",
+    "gas": "insufficient_gas",
+    "insufficient": "insufficient_gas",
+}
+
+# Zero-argument SplitConfigImpl view/pure functions: name -> (4-byte selector = full calldata, output types).
+# Also executeSplit, which execute pre-checks simulate in the same aggregate3 (no outputs: reads back
+# as () if it would succeed, None if it reverts).
+_SPLIT_VIEWS: dict[str, tuple[bytes, list[str]]] = {
+    name: (function_abi_to_4byte_selector(fn), get_abi_output_types(fn))
+    for name, fn in SPLIT_CONFIG_ABI_BY_NAME.items()
+    if (fn["stateMutability"] in ("view", "pure") or name == "executeSplit") and not fn["inputs"]
+}
+
+# SplitFactory functions: name -> (4-byte selector, input types, output types)
+_FACTORY_CALLS: dict[str, tuple[bytes, list[str], list[str]]] = {
+    name: (function_abi_to_4byte_selector(fn), get_abi_input_types(fn), get_abi_output_types(fn))
+    for name, fn in FACTORY_ABI_BY_NAME.items()
+}
+
+# Multicall3.aggregate3((address,bool,bytes)[]) selector
+_AGGREGATE3_SELECTOR = function_signature_to_4byte_selector("aggregate3((address,bool,bytes)[])")
+
+# Views read by get_split_config, in call order
+_CONFIG_VIEWS = ("isCascadeSplitConfig", "authority", "token", "uniqueId", "getRecipients")
+
+# Views read by get_split_snapshot(s), in request order
+_SNAPSHOT_VIEWS = (
+    "isCascadeSplitConfig",
+    "authority",
+    "token",
+    "uniqueId",
+    "getRecipients",
+    "getBalance",
+    "hasPendingFunds",
+    "pendingAmount",
+    "totalUnclaimed",
+    "previewExecution",
+)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _to_checksum_address(address: str) -> ChecksumAddress:
+    """Memoized to_checksum_address (keccak256 over the hex string)."""
+    return to_checksum_address(address)
+
+
+class _ContractCache:
+    """
+    Contracts built for one w3 instance.
+
+    One parsed contract class per ABI kind, and bound instances per
+    (address, kind), least recently used evicted beyond CACHE_SIZE.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._classes: dict[ContractKind, Any] = {}
+        self._contracts: OrderedDict[tuple[str, ContractKind], Any] = OrderedDict()
+
+    def contract_class(self, w3: Any, kind: ContractKind) -> Any:
+        """Get the unbound contract class for an ABI, parsed on first use."""
+        with self._lock:
+            contract_class = self._classes.get(kind)
+            if contract_class is None:
+                contract_class = self._classes[kind] = w3.eth.contract(abi=_ABIS[kind])
+            return contract_class
+
+    def contract(self, w3: Any, address: ChecksumAddress, kind: ContractKind) -> Any:
+        """Get the bound contract instance for a checksummed address, built on first use."""
+        key = (address, kind)
+        with self._lock:
+            contract = self._contracts.get(key)
+            if contract is not None:
+                self._contracts.move_to_end(key)
+                return contract
+        contract = self.contract_class(w3, kind)(address=address)
+        with self._lock:
+            self._contracts[key] = contract
+            if len(self._contracts) > CACHE_SIZE:
+                self._contracts.popitem(last=False)
+        return contract
+
+
+# Attribute holding a w3 instance's _ContractCache. Cached contracts reference their w3,
+# so a module-level map (even a WeakKeyDictionary) would keep every instance alive; stored
+# on the instance, the cache is collected with it.
+_CONTRACT_CACHE_ATTR = "_cascade_splits_contracts"
+
+
+def _contract_cache(w3: Any) -> _ContractCache:
+    """Get the contract cache stored on a Web3 or AsyncWeb3 instance."""
+    attrs = vars(w3)
+    cache = attrs.get(_CONTRACT_CACHE_ATTR)
+    if cache is None:
+        cache = attrs.setdefault(_CONTRACT_CACHE_ATTR, _ContractCache())
+    return cache
+
+
+def _contract(w3: Web3, address: str, kind: ContractKind = "split") -> Contract:
+    """
+    Get a bound contract instance, built once per (w3, address, kind).
+
+    Building a contract re-parses its ABI, so instances are reused across calls.
+    """
+    return _contract_cache(w3).contract(w3, _to_checksum_address(address), kind)
+
+
+def _contract_class(w3: Web3, kind: ContractKind) -> type[Contract]:
+    """Get the unbound contract class for an ABI, parsed once per (w3, kind)."""
+    return _contract_cache(w3).contract_class(w3, kind)
+
 
 def to_evm_recipient(recipient: Recipient) -> EvmRecipient:
     """
@@ -40,23 +225,281 @@ def to_evm_recipients(recipients: list[Recipient]) -> list[EvmRecipient]:
     Raises:
         ValueError: If shares don't sum to 100
     """
-    total = sum(r.share for r in recipients)
+    # Validated construction runs in pydantic-core, which outpaces model_construct's Python loop
+    evm_recipients: list[EvmRecipient] = []
+    total = 0
+    for r in recipients:
+        share = r.share
+        total += share
+        evm_recipients.append(EvmRecipient(addr=r.address, percentage_bps=share * 99))
+    _check_share_total(total)
+    return evm_recipients
+
+
+def _check_share_total(total: int) -> None:
+    """Raise ValueError unless recipient shares (summed while converting) total 100."""
     if total != 100:
         raise ValueError(f"Recipient shares must sum to 100, got {total}")
 
-    return [to_evm_recipient(r) for r in recipients]
+
+def _recipient_tuples(recipients: Sequence[Recipient]) -> list[tuple[str, int]]:
+    """
+    createSplitConfig (addr, percentageBps) tuples, without building EvmRecipients.
+
+    Shares are summed in the same pass that builds the tuples.
+
+    Raises:
+        ValueError: If shares don't sum to 100
+    """
+    tuples: list[tuple[str, int]] = []
+    total = 0
+    for r in recipients:
+        share = r.share
+        total += share
+        tuples.append((r.address, share * 99))
+    _check_share_total(total)
+    return tuples
+
+
+def classify_web3_error(error: Web3Exception, result_class: type[_T]) -> _T:
+    """Map a Web3Exception to a FAILED result of the given type (by RPC error code, else message)."""
+    message = str(error)
+    reason = _error_code_reason(error)
+    if reason is None:
+        match = _ERROR_REASON_RE.search(message)
+        reason = _ERROR_REASONS[match.group().lower()] if match else "transaction_failed"
+    if reason == "wallet_rejected":
+        message = "Transaction rejected"
+    return result_class(status="FAILED", reason=reason, message=message)
+
+
+def _failure_result(error: Exception, result_class: type[_T]) -> _T:
+    """Map an error raised while sending a transaction to a FAILED result of the given type."""
+    if isinstance(error, ContractLogicError):
+        return result_class(status="FAILED", reason="transaction_reverted", message=str(error))
+    if isinstance(error, Web3Exception):
+        return classify_web3_error(error, result_class)
+    # Unexpected errors (network issues, etc.)
+    return result_class(status="FAILED", reason="transaction_failed", message=str(error))
+
+
+def _error_code_reason(error: Web3Exception) -> FailedReason | None:
+    """Failure reason for a Web3RPCError with a known JSON-RPC error code."""
+    if not isinstance(error, Web3RPCError) or not error.rpc_response:
+        return None
+    rpc_error = error.rpc_response.get("error")
+    code = rpc_error.get("code") if isinstance(rpc_error, dict) else None
+    return _ERROR_CODE_REASONS.get(code) if isinstance(code, int) else None
+
+
+def normalize_unique_id(unique_id: bytes) -> bytes:
+    """
+    Right-pad a unique_id with zero bytes to the contract's bytes32.
+
+    Raises:
+        ValueError: If unique_id is longer than 32 bytes (truncating could collide with another id)
+    """
+    if len(unique_id) > 32:
+        raise ValueError(f"unique_id must be at most 32 bytes, got {len(unique_id)}")
+    # One C-level pad; returns unique_id itself when it is already 32 bytes
+    return unique_id.ljust(32, b"\x00")
+
+
+def _call_split_view(w3: Web3, split_address: str, name: str) -> Any:
+    """
+    Call a zero-argument SplitConfigImpl view with pre-encoded calldata.
+
+    Skips web3's ContractFunction encode/format path: the calldata is the
+    constant 4-byte selector, sent as a raw eth_call and decoded locally.
+    """
+    selector, output_types = _SPLIT_VIEWS[name]
+    raw = w3.eth.call({"to": _to_checksum_address(split_address), "data": selector})
+    values = abi_decode(output_types, raw)
+    return values[0] if len(values) == 1 else values
+
+
+def _call_data(call: Any) -> bytes:
+    """Calldata for a bound contract function call, encoded directly (skips web3's ContractFunction path)."""
+    return bytes.fromhex(call.selector[2:]) + abi_encode(get_abi_input_types(call.abi), call.args)
+
+
+def _encoded_transaction(call: Any, tx_params: TxParams) -> TxParams | None:
+    """
+    Complete tx_params for a contract call without build_transaction, or None if web3 must fill in fees.
+
+    build_transaction re-validates and re-encodes the call through web3's
+    middleware-aware path (about 1ms); once gas, nonce and fees are known only
+    the target and calldata are missing.
+    """
+    if "maxFeePerGas" not in tx_params:
+        return None
+    return {**tx_params, "to": call.address, "data": "0x" + _call_data(call).hex(), "value": 0}
+
+
+def _aggregate3_data(requests: Sequence[tuple[str, bool, bytes]]) -> bytes:
+    """Multicall3 aggregate3 calldata for (target, allowFailure, calldata) requests."""
+    return _AGGREGATE3_SELECTOR + abi_encode(["(address,bool,bytes)[]"], [requests])
+
+
+def _aggregate3_results(raw: bytes) -> list[tuple[bool, bytes]]:
+    """Decode aggregate3 return data into (success, returnData) per request."""
+    (results,) = abi_decode(["(bool,bytes)[]"], raw)
+    return results
+
+
+def _multicall_data(calls: Sequence[Any]) -> bytes:
+    """Multicall3 aggregate3 calldata for bound contract function calls (every sub-call may fail)."""
+    return _aggregate3_data([(call.address, True, _call_data(call)) for call in calls])
+
+
+def _decode_multicall(calls: Sequence[Any], raw: bytes) -> list[Any]:
+    """Decode aggregate3 results for _multicall_data; failed sub-calls are None."""
+    results = _aggregate3_results(raw)
+    decoded: list[Any] = []
+    for call, (success, data) in zip(calls, results, strict=True):
+        if not success:
+            decoded.append(None)
+            continue
+        try:
+            values = abi_decode(get_abi_output_types(call.abi), data)
+        except Exception:
+            # Empty return data (no code at target) or mismatched ABI
+            decoded.append(None)
+            continue
+        decoded.append(values[0] if len(values) == 1 else values)
+    return decoded
+
+
+def multicall(w3: Web3, calls: Sequence[ContractFunction]) -> list[Any]:
+    """
+    Batch view calls into a single Multicall3 aggregate3 eth_call.
+
+    Every sub-call is allowed to fail. Failed or undecodable results are returned
+    as None; single-value outputs are unwrapped. Values are returned as decoded by
+    the ABI codec, so addresses are lowercase (not checksummed).
+
+    Example:
+        >>> contract = w3.eth.contract(address=split, abi=SPLIT_CONFIG_IMPL_ABI)
+        >>> is_valid, balance = multicall(w3, [
+        ...     contract.functions.isCascadeSplitConfig(),
+        ...     contract.functions.getBalance(),
+        ... ])
+    """
+    raw = w3.eth.call({"to": MULTICALL3_ADDRESS, "data": _multicall_data(calls)})
+    return _decode_multicall(calls, raw)
+
+
+def _factory_call_data(name: str, args: Sequence[Any]) -> bytes:
+    """SplitFactory calldata, encoded without a contract ABI lookup."""
+    selector, input_types, _ = _FACTORY_CALLS[name]
+    return selector + abi_encode(input_types, args)
+
+
+def _predict_split_address_call(
+    factory_address: str, authority: str, token: str, unique_id: bytes, recipients: list[EvmRecipient]
+) -> dict[str, Any]:
+    """eth_call params for SplitFactory.predictSplitAddress."""
+    args = (
+        _to_checksum_address(authority),
+        _to_checksum_address(token),
+        unique_id,
+        [(r.addr, r.percentage_bps) for r in recipients],
+    )
+    return {"to": _to_checksum_address(factory_address), "data": _factory_call_data("predictSplitAddress", args)}
+
+
+def _decode_predicted_address(raw: bytes) -> str:
+    """Decode predictSplitAddress return data to a checksummed address."""
+    (address,) = abi_decode(_FACTORY_CALLS["predictSplitAddress"][2], raw)
+    return _to_checksum_address(address)
+
+
+def _decode_current_implementation(raw: bytes) -> str:
+    """Decode currentImplementation return data to a checksummed address."""
+    (address,) = abi_decode(_FACTORY_CALLS["currentImplementation"][2], raw)
+    return _to_checksum_address(address)
+
+
+def _read_current_implementation(w3: Web3, factory_address: str) -> str:
+    """Read SplitFactory.currentImplementation with pre-encoded calldata."""
+    call = {"to": _to_checksum_address(factory_address), "data": _FACTORY_CALLS["currentImplementation"][0]}
+    return _decode_current_implementation(w3.eth.call(call))
+
+
+def _created_split_address(receipt: Any, fallback: str) -> str:
+    """Split address from a receipt's SplitConfigCreated log, or fallback if it has none."""
+    topic = EVENT_TOPICS["SplitConfigCreated"]
+    for log in receipt.get("logs") or ():
+        topics = log.get("topics") or ()
+        if len(topics) > 1 and bytes(topics[0]) == topic:
+            return _to_checksum_address("0x" + bytes(topics[1])[-20:].hex())
+    return fallback
+
+
+def _view_multicall_data(split_address: str, names: Sequence[str]) -> bytes:
+    """Multicall3 aggregate3 calldata for zero-argument split views (every sub-call may fail)."""
+    split = _to_checksum_address(split_address)
+    return _aggregate3_data([(split, True, _SPLIT_VIEWS[name][0]) for name in names])
+
+
+def _decode_view_multicall(names: Sequence[str], raw: bytes) -> list[Any]:
+    """Decode aggregate3 results for _view_multicall_data; failed sub-calls are None."""
+    results = _aggregate3_results(raw)
+    decoded: list[Any] = []
+    for name, (success, data) in zip(names, results, strict=True):
+        if not success:
+            decoded.append(None)
+            continue
+        try:
+            values = abi_decode(_SPLIT_VIEWS[name][1], data)
+        except Exception:
+            # Empty return data (no code at target)
+            decoded.append(None)
+            continue
+        decoded.append(values[0] if len(values) == 1 else values)
+    return decoded
+
+
+def _read_split_views(w3: Web3, split_address: str, names: Sequence[str]) -> list[Any]:
+    """
+    Read zero-argument split views in one pre-encoded Multicall3 eth_call.
+
+    Like multicall() without ContractFunction objects: calldata comes from
+    _SPLIT_VIEWS and results are decoded locally. Failed sub-calls are None.
+    Chains without Multicall3 (e.g. a bare local devnet) get one JSON-RPC
+    batch of direct eth_calls instead.
+    """
+    raw = w3.eth.call({"to": MULTICALL3_ADDRESS, "data": _view_multicall_data(split_address, names)})
+    if not raw:
+        # No code at MULTICALL3_ADDRESS
+        return _decode_view_responses(names, w3.provider.make_batch_request(_view_requests(split_address, names)))
+    return _decode_view_multicall(names, raw)
+
+
+def _to_split_config(authority: str, token: str, unique_id: bytes, raw_recipients: Sequence[Any]) -> SplitConfig:
+    """Build a SplitConfig from decoded view outputs (addresses checksummed)."""
+    return SplitConfig(
+        authority=_to_checksum_address(authority),
+        token=_to_checksum_address(token),
+        unique_id=unique_id,
+        recipients=[EvmRecipient(addr=_to_checksum_address(r[0]), percentage_bps=r[1]) for r in raw_recipients],
+    )
 
 
-def is_cascade_split(w3: Web3, address: str) -> bool:
-    """Check if an address is a valid Cascade split."""
+def is_cascade_split(w3: Web3, address: str, cache: SplitCache | None = None) -> bool:
+    """Check if an address is a valid Cascade split (answered from cache when possible)."""
+    if cache is not None:
+        cached = cache.get(address)
+        if cached is not None:
+            return cached
     try:
-        contract = w3.eth.contract(
-            address=Web3.to_checksum_address(address),
-            abi=SPLIT_CONFIG_IMPL_ABI,
-        )
-        return contract.functions.isCascadeSplitConfig().call()
+        result = bool(_call_split_view(w3, address, "isCascadeSplitConfig"))
     except Exception:
+        # A failed read is not cached as "not a split"
         return False
+    if cache is not None:
+        cache.set(address, result)
+    return result
 
 
 def get_split_balance(w3: Web3, split_address: str) -> int:
@@ -66,60 +509,41 @@ def get_split_balance(w3: Web3, split_address: str) -> int:
     Returns:
         Balance in token's smallest unit (e.g., 6 decimals for USDC)
     """
-    contract = w3.eth.contract(
-        address=Web3.to_checksum_address(split_address),
-        abi=SPLIT_CONFIG_IMPL_ABI,
-    )
-    return contract.functions.getBalance().call()
+    return _call_split_view(w3, split_address, "getBalance")
 
 
 def has_pending_funds(w3: Web3, split_address: str) -> bool:
     """Check if a split has pending funds to distribute."""
-    contract = w3.eth.contract(
-        address=Web3.to_checksum_address(split_address),
-        abi=SPLIT_CONFIG_IMPL_ABI,
-    )
-    return contract.functions.hasPendingFunds().call()
+    return _call_split_view(w3, split_address, "hasPendingFunds")
 
 
-def get_split_config(w3: Web3, split_address: str) -> SplitConfig | None:
-    """Get the configuration of a split. Returns None if not a valid split."""
+def get_split_config(w3: Web3, split_address: str, cache: SplitCache | None = None) -> SplitConfig | None:
+    """Get the configuration of a split. Returns None if not a valid split (answered from cache when possible)."""
+    if cache is not None:
+        config = cache.get_config(split_address)
+        if config is not None or cache.get(split_address) is False:
+            return config
     try:
-        contract = w3.eth.contract(
-            address=Web3.to_checksum_address(split_address),
-            abi=SPLIT_CONFIG_IMPL_ABI,
-        )
-
-        is_valid = contract.functions.isCascadeSplitConfig().call()
+        # One round-trip for all reads
+        is_valid, authority, token, unique_id, raw_recipients = _read_split_views(w3, split_address, _CONFIG_VIEWS)
+        if is_valid is None:
+            # The check itself failed: unknown, so nothing is cached
+            return None
         if not is_valid:
+            if cache is not None:
+                cache.set(split_address, False)
             return None
-
-        authority = contract.functions.authority().call()
-        token = contract.functions.token().call()
-        unique_id = contract.functions.uniqueId().call()
-        raw_recipients = contract.functions.getRecipients().call()
-
-        recipients = [EvmRecipient(addr=r[0], percentage_bps=r[1]) for r in raw_recipients]
-
-        return SplitConfig(
-            authority=authority,
-            token=token,
-            unique_id=unique_id,
-            recipients=recipients,
-        )
+        # A failed sub-read (None) can't be converted
+        config = _to_split_config(authority, token, unique_id, raw_recipients)
     except Exception:
         return None
+    if cache is not None:
+        cache.set_config(split_address, config)
+    return config
 
 
-def preview_execution(w3: Web3, split_address: str) -> ExecutionPreview:
-    """Preview what would happen if the split is executed."""
-    contract = w3.eth.contract(
-        address=Web3.to_checksum_address(split_address),
-        abi=SPLIT_CONFIG_IMPL_ABI,
-    )
-
-    result = contract.functions.previewExecution().call()
-
+def _to_execution_preview(result: Sequence[Any]) -> ExecutionPreview:
+    """Build an ExecutionPreview from decoded previewExecution outputs."""
     return ExecutionPreview(
         recipient_amounts=list(result[0]),
         protocol_fee=result[1],
@@ -129,22 +553,179 @@ def preview_execution(w3: Web3, split_address: str) -> ExecutionPreview:
     )
 
 
+def _preflight_views(known_split: bool, return_preview: bool) -> tuple[str, ...]:
+    """
+    Calls made before an execute, in one aggregate3.
+
+    The split check (unless known), balance, pending funds, optionally the
+    preview, then a simulated executeSplit (last, so the reads see unchanged state).
+    """
+    views = (
+        ("getBalance", "hasPendingFunds") if known_split else ("isCascadeSplitConfig", "getBalance", "hasPendingFunds")
+    )
+    return (*views, "previewExecution", "executeSplit") if return_preview else (*views, "executeSplit")
+
+
+def _pop_preflight_extras(reads: list[Any], return_preview: bool) -> tuple[ExecutionPreview | None, bool]:
+    """Take the preview (if requested) and executeSplit simulation off the end of reads: (preview, executable)."""
+    executable = reads.pop() is not None
+    if not return_preview:
+        return None, executable
+    raw = reads.pop()
+    return (None if raw is None else _to_execution_preview(raw)), executable
+
+
+def preview_execution(w3: Web3, split_address: str) -> ExecutionPreview:
+    """Preview what would happen if the split is executed."""
+    return _to_execution_preview(_call_split_view(w3, split_address, "previewExecution"))
+
+
+def _view_requests(split_address: str, names: Sequence[str]) -> list[tuple[RPCEndpoint, Any]]:
+    """eth_call requests for zero-argument split views, with pre-encoded calldata."""
+    call = {"to": _to_checksum_address(split_address)}
+    return [
+        (RPCEndpoint("eth_call"), [{**call, "data": HexBytes(_SPLIT_VIEWS[name][0]).to_0x_hex()}, "latest"])
+        for name in names
+    ]
+
+
+def _decode_view_responses(names: Sequence[str], responses: list[RPCResponse] | RPCResponse) -> list[Any]:
+    """
+    Decode a batch of _view_requests responses; failed calls are None.
+
+    Raises:
+        Web3RPCError: If the node rejected the whole batch
+    """
+    if not isinstance(responses, list):
+        raise Web3RPCError(str(responses.get("error")), rpc_response=responses)
+
+    decoded: list[Any] = []
+    for name, response in zip(names, responses, strict=True):
+        try:
+            values = abi_decode(_SPLIT_VIEWS[name][1], HexBytes(response["result"]))
+        except Exception:
+            # Reverted or undecodable (e.g. no code at the address)
+            decoded.append(None)
+            continue
+        decoded.append(values[0] if len(values) == 1 else values)
+    return decoded
+
+
+def _snapshot_requests(split_address: str) -> list[tuple[RPCEndpoint, Any]]:
+    """eth_call requests for every snapshot view."""
+    return _view_requests(split_address, _SNAPSHOT_VIEWS)
+
+
+def _snapshot_from_responses(responses: list[RPCResponse] | RPCResponse) -> SplitSnapshot:
+    """
+    Decode a batch of snapshot eth_call responses.
+
+    Raises:
+        Web3RPCError: If the node rejected the whole batch
+    """
+    return _snapshot_from_values(_decode_view_responses(_SNAPSHOT_VIEWS, responses))
+
+
+def _snapshot_from_values(decoded: Sequence[Any]) -> SplitSnapshot:
+    """Build a SplitSnapshot from decoded _SNAPSHOT_VIEWS outputs (None for failed reads)."""
+    values = dict(zip(_SNAPSHOT_VIEWS, decoded, strict=True))
+
+    if values["isCascadeSplitConfig"] is None:
+        return SplitSnapshot(is_split=None)
+    if not values["isCascadeSplitConfig"]:
+        return SplitSnapshot(is_split=False)
+
+    config = None
+    if all(values[name] is not None for name in _CONFIG_VIEWS[1:]):
+        config = _to_split_config(*(values[name] for name in _CONFIG_VIEWS[1:]))
+    preview = values["previewExecution"]
+
+    return SplitSnapshot(
+        is_split=True,
+        config=config,
+        balance=values["getBalance"],
+        has_pending_funds=values["hasPendingFunds"],
+        pending_amount=values["pendingAmount"],
+        total_unclaimed=values["totalUnclaimed"],
+        preview=_to_execution_preview(preview) if preview is not None else None,
+    )
+
+
+def get_split_snapshot(w3: Web3, split_address: str) -> SplitSnapshot:
+    """
+    Read a split's config, balance, pending amounts and execution preview at once.
+
+    All views are sent as one JSON-RPC batch of eth_calls (one HTTP round-trip).
+    """
+    return _snapshot_from_responses(w3.provider.make_batch_request(_snapshot_requests(split_address)))
+
+
+def _snapshots_multicall_data(split_addresses: Sequence[str]) -> bytes:
+    """Multicall3 aggregate3 calldata for every snapshot view of every split, split by split."""
+    return _aggregate3_data(
+        [
+            (split, True, _SPLIT_VIEWS[name][0])
+            for split in map(_to_checksum_address, split_addresses)
+            for name in _SNAPSHOT_VIEWS
+        ]
+    )
+
+
+def _snapshots_from_values(decoded: Sequence[Any]) -> list[SplitSnapshot]:
+    """Split decoded views of several splits (in _snapshots_multicall_data order) into snapshots."""
+    size = len(_SNAPSHOT_VIEWS)
+    return [_snapshot_from_values(decoded[i : i + size]) for i in range(0, len(decoded), size)]
+
+
+def get_split_snapshots(w3: Web3, split_addresses: Sequence[str]) -> list[SplitSnapshot]:
+    """
+    Read the snapshots of many splits at once, in the order given.
+
+    Every view of every split is one sub-call of a single Multicall3 aggregate3
+    eth_call, so polling N splits costs one round-trip instead of N. Chains
+    without Multicall3 get one JSON-RPC batch of direct eth_calls instead.
+    """
+    if not split_addresses:
+        return []
+    names = _SNAPSHOT_VIEWS * len(split_addresses)
+    raw = w3.eth.call({"to": MULTICALL3_ADDRESS, "data": _snapshots_multicall_data(split_addresses)})
+    if not raw:
+        # No code at MULTICALL3_ADDRESS
+        requests = [request for split in split_addresses for request in _snapshot_requests(split)]
+        return _snapshots_from_values(_decode_view_responses(names, w3.provider.make_batch_request(requests)))
+    return _snapshots_from_values(_decode_view_multicall(names, raw))
+
+
 def get_pending_amount(w3: Web3, split_address: str) -> int:
     """Get the pending amount to be distributed."""
-    contract = w3.eth.contract(
-        address=Web3.to_checksum_address(split_address),
-        abi=SPLIT_CONFIG_IMPL_ABI,
-    )
-    return contract.functions.pendingAmount().call()
+    return _call_split_view(w3, split_address, "pendingAmount")
 
 
 def get_total_unclaimed(w3: Web3, split_address: str) -> int:
     """Get the total unclaimed amount (failed transfers)."""
-    contract = w3.eth.contract(
-        address=Web3.to_checksum_address(split_address),
-        abi=SPLIT_CONFIG_IMPL_ABI,
-    )
-    return contract.functions.totalUnclaimed().call()
+    return _call_split_view(w3, split_address, "totalUnclaimed")
+
+
+def existing_split_from_revert(error: ContractLogicError) -> str | None:
+    """
+    Extract the split address from a SplitAlreadyExists revert.
+
+    Simulating createSplitConfig with eth_call returns the new split address, or
+    reverts with SplitAlreadyExists(split) when it is already deployed. This lets
+    ensure_split detect existing splits in a single round-trip.
+
+    Returns:
+        Checksummed split address, or None if the revert is any other error
+    """
+    if not isinstance(error.data, str):
+        return None
+    try:
+        data = bytes.fromhex(error.data.removeprefix("0x"))
+    except ValueError:
+        return None
+    if data[:4] != SPLIT_ALREADY_EXISTS_SELECTOR or len(data) != 36:
+        return None
+    return _to_checksum_address("0x" + data[-20:].hex())
 
 
 def get_default_token(chain_id: int) -> str:
@@ -152,6 +733,39 @@ def get_default_token(chain_id: int) -> str:
     return get_usdc_address(chain_id)
 
 
+def compute_optimistic_gas(fn_name: str, recipient_count: int) -> int | None:
+    """
+    Predict the gas used by a Cascade Splits transaction without simulating it.
+
+    Gas scales linearly with recipient count, so createSplitConfig and
+    executeSplit are estimated from measured constants. Returns None for
+    any other function (those need eth_estimateGas).
+    """
+    if fn_name == "createSplitConfig":
+        return CREATE_GAS_BASE + recipient_count * CREATE_GAS_PER_RECIPIENT
+    if fn_name == "executeSplit":
+        return EXECUTE_GAS_BASE + recipient_count * EXECUTE_GAS_PER_RECIPIENT
+    return None
+
+
+def _optimistic_gas_limit(opts: GasOptions, contract_call: Any) -> int | None:
+    """Buffered precomputed gas limit for a known call, or None if it must be estimated."""
+    if opts.force_estimate_gas:
+        return None
+    fn_name = getattr(contract_call, "fn_name", None)
+    if not isinstance(fn_name, str):
+        return None
+    # executeSplit's recipient count isn't known here, so bound it by the maximum
+    recipient_count = len(contract_call.args[3]) if fn_name == "createSplitConfig" else MAX_RECIPIENTS
+    gas = compute_optimistic_gas(fn_name, recipient_count)
+    return None if gas is None else _buffered_gas(gas, opts)
+
+
+def _buffered_gas(gas: int, opts: GasOptions) -> int:
+    """Add the configured headroom to a gas estimate (integer math)."""
+    return gas * (100 + opts.gas_buffer_percent) // 100
+
+
 def build_tx_params(
     w3: Web3,
     sender: ChecksumAddress,
@@ -159,16 +773,21 @@ def build_tx_params(
     default_gas: int,
     gas_options: GasOptions | None = None,
     contract_call: ContractFunction | None = None,
+    nonce: int | None = None,
+    fees: FeeCache | None = None,
 ) -> TxParams:
     """
     Build transaction parameters with gas options (sync version).
 
     Handles:
-    - Gas estimation (with 20% buffer) when estimate_gas=True
+    - Gas estimation (with 20% buffer) when estimate_gas=True: precomputed for
+      createSplitConfig / executeSplit, eth_estimateGas otherwise
     - EIP-1559 type 2 transactions when max_fee_per_gas is set
-    - Fallback to legacy transactions otherwise
+    - Cached fee_history fees from a FeeCache otherwise
+    - Fallback to web3's fee lookup when neither is given
     """
-    nonce = w3.eth.get_transaction_count(sender)
+    if nonce is None:
+        nonce = w3.eth.get_transaction_count(sender)
 
     tx_params: TxParams = {
         "from": sender,
@@ -182,36 +801,113 @@ def build_tx_params(
     if opts.gas_limit is not None:
         tx_params["gas"] = opts.gas_limit
     elif opts.estimate_gas and contract_call is not None:
-        estimated = contract_call.estimate_gas({"from": sender})
-        tx_params["gas"] = int(estimated * 1.2)  # 20% buffer
+        optimistic = _optimistic_gas_limit(opts, contract_call)
+        if optimistic is not None:
+            tx_params["gas"] = optimistic
+        else:
+            tx_params["gas"] = _buffered_gas(contract_call.estimate_gas({"from": sender}), opts)
     else:
         tx_params["gas"] = default_gas
 
-    # EIP-1559 or legacy
+    # EIP-1559: explicit fees, else cached fee_history estimates
     if opts.max_fee_per_gas is not None:
         tx_params["type"] = "0x2"
         tx_params["maxFeePerGas"] = opts.max_fee_per_gas
         tx_params["maxPriorityFeePerGas"] = (
             opts.max_priority_fee_per_gas if opts.max_priority_fee_per_gas is not None else DEFAULT_PRIORITY_FEE
         )
+    elif fees is not None:
+        max_fee, priority_fee = fees.fees()
+        tx_params["type"] = "0x2"
+        tx_params["maxFeePerGas"] = max_fee
+        tx_params["maxPriorityFeePerGas"] = priority_fee
 
     return tx_params
 
 
-def predict_split_address(
+def send_transaction(
     w3: Web3,
+    account: LocalAccount,
+    chain_id: int,
+    contract_call: ContractFunction,
+    default_gas: int,
+    gas_options: GasOptions | None = None,
+    nonces: NonceManager | None = None,
+    fees: FeeCache | None = None,
+) -> HexBytes:
+    """
+    Build, sign and send a contract transaction (sync version).
+
+    With a NonceManager the nonce comes from the local counter; if the node
+    reports it as already used, the counter is resynced and the send retried once.
+    With a FeeCache, EIP-1559 fees come from the cache instead of per-send lookups.
+
+    Returns:
+        Transaction hash
+    """
+
+    def sign_and_send(nonce: int | None) -> HexBytes:
+        tx_params = build_tx_params(
+            w3,
+            account.address,
+            chain_id,
+            default_gas,
+            gas_options=gas_options,
+            contract_call=contract_call,
+            nonce=nonce,
+            fees=fees,
+        )
+        tx = _encoded_transaction(contract_call, tx_params) or contract_call.build_transaction(tx_params)
+        signed = account.sign_transaction(tx)
+        return w3.eth.send_raw_transaction(signed.raw_transaction)
+
+    if nonces is None:
+        return sign_and_send(None)
+
+    for attempt in range(2):
+        try:
+            return sign_and_send(nonces.next_nonce())
+        except Exception as e:
+            # The reserved nonce was not consumed, resync before the next send
+            nonces.reset()
+            if attempt > 0 or not is_nonce_error(e):
+                raise
+    raise AssertionError("unreachable")
+
+
+def poll_receipt(w3: Web3, tx_hash: HexBytes | str) -> TxReceipt | None:
+    """
+    Check once for a transaction receipt, without waiting.
+
+    Completes a send made with await_receipt=False: returns None while the
+    transaction is still pending.
+    """
+    try:
+        return w3.eth.get_transaction_receipt(tx_hash)
+    except TransactionNotFound:
+        return None
+
+
+def compute_split_address(
     factory_address: str,
+    implementation: str,
     authority: str,
     token: str,
     unique_id: bytes,
     recipients: list[EvmRecipient],
 ) -> str:
     """
-    Predict the deterministic address of a split before creation.
+    Compute the deterministic address of a split locally (no RPC).
+
+    Mirrors SplitFactory.predictSplitAddress: splits are Solady LibClone ERC-1167
+    proxies with immutable args, deployed with CREATE2 by the factory.
+
+    - args = factory || authority || token || uniqueId || (addr || uint16 bps) per recipient
+    - salt = keccak256(abi.encode(authority, token, uniqueId))
 
     Args:
-        w3: Web3 instance
         factory_address: The split factory contract address
+        implementation: The factory's currentImplementation
         authority: The authority address for the split
         token: The token address (e.g., USDC)
         unique_id: Unique identifier (32 bytes)
@@ -220,16 +916,104 @@ def predict_split_address(
     Returns:
         Predicted split address
     """
-    factory = w3.eth.contract(
-        address=Web3.to_checksum_address(factory_address),
-        abi=SPLIT_FACTORY_ABI,
+    return _compute_split_address(
+        factory_address,
+        implementation,
+        authority,
+        token,
+        unique_id,
+        [(r.addr, r.percentage_bps) for r in recipients],
     )
 
-    recipient_tuples = [(r.addr, r.percentage_bps) for r in recipients]
 
-    return factory.functions.predictSplitAddress(
-        Web3.to_checksum_address(authority),
-        Web3.to_checksum_address(token),
-        unique_id,
-        recipient_tuples,
-    ).call()
+def _compute_split_address(
+    factory_address: str,
+    implementation: str,
+    authority: str,
+    token: str,
+    unique_id: bytes,
+    recipients: Sequence[tuple[str, int]],
+) -> str:
+    """compute_split_address over (addr, bps) tuples."""
+    factory = bytes.fromhex(factory_address[2:])
+    authority_bytes = bytes.fromhex(authority[2:])
+    token_bytes = bytes.fromhex(token[2:])
+
+    args = b"".join(
+        [factory, authority_bytes, token_bytes, unique_id]
+        + [bytes.fromhex(addr[2:]) + bps.to_bytes(2, "big") for addr, bps in recipients]
+    )
+    init_code = (
+        b"\x61"
+        + (len(args) + 0x2D).to_bytes(2, "big")
+        + bytes.fromhex("3d81600a3d39f3363d3d373d3d3d363d73")
+        + bytes.fromhex(implementation[2:])
+        + bytes.fromhex("5af43d82803e903d91602b57fd5bf3")
+        + args
+    )
+    salt = Web3.keccak(authority_bytes.rjust(32, b"\x00") + token_bytes.rjust(32, b"\x00") + unique_id)
+
+    address = Web3.keccak(b"\xff" + factory + salt + Web3.keccak(init_code))[12:]
+    return _to_checksum_address("0x" + address.hex())
+
+
+def _cached_split_address(
+    cache: SplitCache,
+    factory_address: str,
+    implementation: str,
+    authority: str,
+    token: str,
+    unique_id: bytes,
+    recipients: Sequence[Recipient],
+) -> str | None:
+    """
+    Address of a split with these parameters that the cache knows is deployed, else None.
+
+    The CREATE2 address commits to every parameter, so a known split at that
+    address is exactly the split being ensured. Invalid parameters give None.
+    """
+    try:
+        split = _compute_split_address(
+            factory_address,
+            implementation,
+            authority,
+            token,
+            normalize_unique_id(unique_id),
+            _recipient_tuples(recipients),
+        )
+    except ValueError:
+        return None
+    return split if cache.get(split) else None
+
+
+def _record_ensured(cache: SplitCache, result: EnsureResult) -> EnsureResult:
+    """Mark the split of a CREATED or NO_CHANGE result as deployed, for _cached_split_address."""
+    if result.status in ("CREATED", "NO_CHANGE") and result.split is not None:
+        cache.set(result.split, True)
+    return result
+
+
+def predict_split_address(
+    w3: Web3,
+    factory_address: str,
+    authority: str,
+    token: str,
+    unique_id: bytes,
+    recipients: list[EvmRecipient],
+) -> str:
+    """
+    Predict the deterministic address of a split before creation.
+
+    Args:
+        w3: Web3 instance
+        factory_address: The split factory contract address
+        authority: The authority address for the split
+        token: The token address (e.g., USDC)
+        unique_id: Unique identifier (32 bytes)
+        recipients: List of EvmRecipients with percentage_bps
+
+    Returns:
+        Predicted split address
+    """
+    call = _predict_split_address_call(factory_address, authority, token, unique_id, recipients)
+    return _decode_predicted_address(w3.eth.call(call))
@@ -0,0 +1,87 @@
+"""Coalescing of concurrent eth_calls into Multicall3 batches for Cascade Splits EVM SDK."""
+
+import asyncio
+from typing import Any
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+
+from .constants import MULTICALL3_ADDRESS, MULTICALL_BATCH_SIZE, MULTICALL_BATCH_WINDOW
+from .helpers import _aggregate3_data, _aggregate3_results, _to_checksum_address
+
+# (target, calldata, future resolved with (success, returnData))
+_PendingCall = tuple[str, bytes, "asyncio.Future[tuple[bool, bytes]]"]
+
+
+class MulticallBatcher:
+    """
+    Sends concurrent eth_calls as one Multicall3 aggregate3 eth_call.
+
+    Calls made within `window` seconds of the first pending one (or until
+    `max_batch` are pending) share a single request, so many concurrent
+    reads cost one round-trip instead of one each, for at most `window`
+    seconds of added latency. A sub-call that fails inside the batch, or a
+    chain without Multicall3, is repeated as a direct eth_call, so results
+    and errors match an unbatched call.
+    """
+
+    def __init__(
+        self,
+        w3: AsyncWeb3,
+        window: float = MULTICALL_BATCH_WINDOW,
+        max_batch: int = MULTICALL_BATCH_SIZE,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be at least 1, got {max_batch}")
+        self._w3 = w3
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: list[_PendingCall] = []
+        self._timer: asyncio.TimerHandle | None = None
+        # Flushes in flight (the event loop only keeps weak references to tasks)
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    async def call(self, transaction: dict[str, Any]) -> bytes:
+        """eth_call a {"to", "data"} transaction as part of the next batch; returns the raw return data."""
+        to = _to_checksum_address(transaction["to"])
+        data = bytes(HexBytes(transaction["data"]))
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[tuple[bool, bytes]] = loop.create_future()
+        self._pending.append((to, data, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+
+        success, result = await future
+        if success:
+            return result
+        # Reverted in the batch (or no Multicall3): repeat directly so the caller sees the node's error
+        return await self._w3.eth.call({"to": to, "data": data})
+
+    def _flush(self) -> None:
+        """Send every pending call in one aggregate3."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._send(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _send(self, batch: list[_PendingCall]) -> None:
+        try:
+            raw = await self._w3.eth.call(
+                {"to": MULTICALL3_ADDRESS, "data": _aggregate3_data([(to, True, data) for to, data, _ in batch])}
+            )
+            # Empty return data: no code at MULTICALL3_ADDRESS
+            results = _aggregate3_results(raw) if raw else [(False, b"")] * len(batch)
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (*_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,76 @@
+"""Local nonce tracking for Cascade Splits EVM SDK."""
+
+import asyncio
+import re
+import threading
+
+from eth_typing import ChecksumAddress
+from web3 import AsyncWeb3, Web3
+
+# Node errors meaning the cached nonce is behind the chain (resync and retry once)
+NONCE_ERRORS = ("nonce too low", "already known")
+_NONCE_ERROR_RE = re.compile("|".join(map(re.escape, NONCE_ERRORS)), re.IGNORECASE)
+
+
+def is_nonce_error(error: Exception) -> bool:
+    """Check if a send failed because the nonce was already used."""
+    return _NONCE_ERROR_RE.search(str(error)) is not None
+
+
+class NonceManager:
+    """
+    Hands out sequential nonces for one sender without an RPC per transaction.
+
+    The pending nonce is fetched once, then incremented locally under a lock,
+    so several transactions can be in flight from the same account. Call
+    `reset()` after a failed send to resync with the node.
+    """
+
+    def __init__(self, w3: Web3, address: ChecksumAddress) -> None:
+        self._w3 = w3
+        self._address = address
+        self._lock = threading.Lock()
+        self._nonce: int | None = None
+
+    def next_nonce(self) -> int:
+        """Reserve the next nonce."""
+        with self._lock:
+            if self._nonce is None:
+                self._nonce = self._w3.eth.get_transaction_count(self._address, "pending")
+            nonce = self._nonce
+            self._nonce += 1
+            return nonce
+
+    def reset(self) -> None:
+        """Drop the cached nonce; the next reservation refetches it from the node."""
+        with self._lock:
+            self._nonce = None
+
+
+class AsyncNonceManager:
+    """
+    Async version of NonceManager.
+
+    Concurrent tasks (e.g. AsyncCascadeSplitsClient.ensure_splits) get distinct
+    nonces for the same account.
+    """
+
+    def __init__(self, w3: AsyncWeb3, address: ChecksumAddress) -> None:
+        self._w3 = w3
+        self._address = address
+        self._lock = asyncio.Lock()
+        self._nonce: int | None = None
+
+    async def next_nonce(self) -> int:
+        """Reserve the next nonce."""
+        async with self._lock:
+            if self._nonce is None:
+                self._nonce = await self._w3.eth.get_transaction_count(self._address, "pending")
+            nonce = self._nonce
+            self._nonce += 1
+            return nonce
+
+    async def reset(self) -> None:
+        """Drop the cached nonce; the next reservation refetches it from the node."""
+        async with self._lock:
+            self._nonce = None
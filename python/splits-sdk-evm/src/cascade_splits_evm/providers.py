@@ -0,0 +1,147 @@
+"""Multi-endpoint RPC providers for Cascade Splits EVM SDK."""
+
+import asyncio
+import itertools
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
+
+import aiohttp
+import requests
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.providers.base import JSONBaseProvider
+from web3.providers.rpc import AsyncHTTPProvider, HTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+_P = TypeVar("_P")
+_R = TypeVar("_R")
+
+# Methods that go to the primary endpoint first: sends, and nonce lookups that
+# depend on the mempool of the node the transactions were sent to
+PRIMARY_METHODS = frozenset({"eth_sendRawTransaction", "eth_sendTransaction", "eth_getTransactionCount"})
+
+# HTTP statuses that mean "try another endpoint" (rate limited / server error)
+FAILOVER_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _should_fail_over(error: Exception) -> bool:
+    """Check if a request error is an endpoint problem rather than a bad request."""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code in FAILOVER_STATUSES
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in FAILOVER_STATUSES
+    return isinstance(
+        error,
+        (requests.ConnectionError, requests.Timeout, aiohttp.ClientConnectionError, asyncio.TimeoutError),
+    )
+
+
+class _EndpointPool:
+    """Endpoint ordering shared by the sync and async failover providers."""
+
+    def __init__(self, providers: Sequence[_P]) -> None:
+        if not providers:
+            raise ValueError("At least one RPC endpoint is required")
+        self.providers = list(providers)
+        self._counter = itertools.count()
+
+    def order(self, method: str) -> list[_P]:
+        """Primary-first for PRIMARY_METHODS, round-robin otherwise."""
+        if method in PRIMARY_METHODS:
+            return self.providers
+        start = next(self._counter) % len(self.providers)
+        return self.providers[start:] + self.providers[:start]
+
+
+def _first_success(providers: Sequence[_P], call: Callable[[_P], _R]) -> _R:
+    """Return call(provider) for the first provider that doesn't fail over."""
+    last_error: Exception | None = None
+    for provider in providers:
+        try:
+            return call(provider)
+        except Exception as e:
+            if not _should_fail_over(e):
+                raise
+            last_error = e
+    assert last_error is not None
+    raise last_error
+
+
+class FailoverHTTPProvider(JSONBaseProvider):
+    """
+    Spread requests across several HTTP endpoints with failover.
+
+    Reads are distributed round-robin; sends and nonce lookups prefer the first
+    (primary) endpoint. Connection errors, timeouts, 429 and 5xx responses move
+    the request to the next endpoint.
+
+    Example:
+        >>> w3 = Web3(FailoverHTTPProvider([
+        ...     HTTPProvider("https://mainnet.base.org"),
+        ...     HTTPProvider("https://base.llamarpc.com"),
+        ... ]))
+    """
+
+    def __init__(self, providers: Sequence[HTTPProvider]) -> None:
+        super().__init__()
+        self._pool = _EndpointPool(providers)
+
+    @property
+    def providers(self) -> list[HTTPProvider]:
+        """Endpoint providers, primary first."""
+        return self._pool.providers
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return _first_success(self._pool.order(method), lambda p: p.make_request(method, params))
+
+    def make_batch_request(self, batch_requests: list[tuple[RPCEndpoint, Any]]) -> list[RPCResponse] | RPCResponse:
+        return _first_success(self._pool.providers, lambda p: p.make_batch_request(batch_requests))
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return any(p.is_connected(show_traceback) for p in self._pool.providers)
+
+
+class AsyncFailoverHTTPProvider(AsyncJSONBaseProvider):
+    """Async version of FailoverHTTPProvider."""
+
+    def __init__(self, providers: Sequence[AsyncHTTPProvider]) -> None:
+        super().__init__()
+        self._pool = _EndpointPool(providers)
+
+    @property
+    def providers(self) -> list[AsyncHTTPProvider]:
+        """Endpoint providers, primary first."""
+        return self._pool.providers
+
+    @staticmethod
+    async def _first_success(
+        providers: Sequence[AsyncHTTPProvider], call: Callable[[AsyncHTTPProvider], Awaitable[_R]]
+    ) -> _R:
+        """Return await call(provider) for the first provider that doesn't fail over."""
+        last_error: Exception | None = None
+        for provider in providers:
+            try:
+                return await call(provider)
+            except Exception as e:
+                if not _should_fail_over(e):
+                    raise
+                last_error = e
+        assert last_error is not None
+        raise last_error
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return await self._first_success(self._pool.order(method), lambda p: p.make_request(method, params))
+
+    async def make_batch_request(
+        self, batch_requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        return await self._first_success(self._pool.providers, lambda p: p.make_batch_request(batch_requests))
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        for provider in self._pool.providers:
+            if await provider.is_connected(show_traceback):
+                return True
+        return False
+
+    async def disconnect(self) -> None:
+        for provider in self._pool.providers:
+            await provider.disconnect()
@@ -0,0 +1,79 @@
+"""Memoized split metadata for Cascade Splits EVM SDK."""
+
+import threading
+import time
+from collections import OrderedDict
+
+from .constants import SPLIT_CACHE_MAX_SIZE, SPLIT_CACHE_NEGATIVE_TTL
+from .types import SplitConfig
+
+
+class SplitCache:
+    """
+    Remembers which addresses are Cascade splits, and their configs.
+
+    A deployed split never stops being one and its config is immutable, so
+    positive answers and configs are kept until evicted (least recently used,
+    beyond max_size entries). Negative answers expire after negative_ttl
+    seconds, since the split may be created later.
+    """
+
+    def __init__(
+        self,
+        max_size: int = SPLIT_CACHE_MAX_SIZE,
+        negative_ttl: float = SPLIT_CACHE_NEGATIVE_TTL,
+    ) -> None:
+        self._max_size = max_size
+        self._negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        # lowercased address -> (is_split, checked_at, config if read)
+        self._entries: OrderedDict[str, tuple[bool, float, SplitConfig | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of cached entries (expired negative answers count until next looked up)."""
+        with self._lock:
+            return len(self._entries)
+
+    def _lookup(self, key: str) -> tuple[bool, float, SplitConfig | None] | None:
+        """Return the live entry for a key, dropping it if expired (lock held)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        is_split, checked_at, _ = entry
+        if not is_split and time.monotonic() - checked_at > self._negative_ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, entry: tuple[bool, float, SplitConfig | None]) -> None:
+        """Insert an entry, evicting the least recently used beyond max_size (lock held)."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def get(self, address: str) -> bool | None:
+        """Return the cached answer, or None if unknown or expired."""
+        with self._lock:
+            entry = self._lookup(address.lower())
+            return None if entry is None else entry[0]
+
+    def set(self, address: str, is_split: bool) -> None:
+        """Record whether an address is a split (keeps a known config)."""
+        key = address.lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            config = entry[2] if is_split and entry is not None else None
+            self._store(key, (is_split, time.monotonic(), config))
+
+    def get_config(self, address: str) -> SplitConfig | None:
+        """Return the cached config, or None if not read yet."""
+        with self._lock:
+            entry = self._lookup(address.lower())
+            return None if entry is None else entry[2]
+
+    def set_config(self, address: str, config: SplitConfig) -> None:
+        """Record a split's config (which also marks the address as a split)."""
+        with self._lock:
+            self._store(address.lower(), (True, time.monotonic(), config))
@@ -48,8 +48,8 @@ class SplitConfig(BaseModel):
 
 
 # Result status types
-EnsureStatus = Literal["CREATED", "NO_CHANGE", "FAILED"]
-ExecuteStatus = Literal["EXECUTED", "SKIPPED", "FAILED"]
+EnsureStatus = Literal["CREATED", "NO_CHANGE", "PENDING", "FAILED"]
+ExecuteStatus = Literal["EXECUTED", "SKIPPED", "PENDING", "FAILED"]
 FailedReason = Literal[
     "wallet_rejected",
     "wallet_disconnected",
@@ -69,7 +69,10 @@ class EnsureResult(BaseModel):
     """
     Result of ensure_split operation.
 
-    status: CREATED | NO_CHANGE | FAILED
+    status: CREATED | NO_CHANGE | PENDING | FAILED
+
+    PENDING means the creation was sent without waiting for its receipt
+    (await_receipt=False); split is the predicted address.
     """
 
     status: EnsureStatus
@@ -81,29 +84,54 @@ class EnsureResult(BaseModel):
     model_config = {"frozen": True}
 
 
+class ExecutionPreview(BaseModel):
+    """Preview of what would happen if split is executed."""
+
+    recipient_amounts: list[int]
+    protocol_fee: int
+    available: int
+    pending_recipient_amounts: list[int]
+    pending_protocol_amount: int
+
+    model_config = {"frozen": True}
+
+
 class ExecuteResult(BaseModel):
     """
     Result of execute_split operation.
 
-    status: EXECUTED | SKIPPED | FAILED
+    status: EXECUTED | SKIPPED | PENDING | FAILED
+
+    PENDING means the execution was sent without waiting for its receipt
+    (await_receipt=False). preview is set when requested with return_preview
+    and the split's pre-checks ran: the distribution as of those checks.
     """
 
     status: ExecuteStatus
     signature: str | None = None
     reason: FailedReason | SkippedReason | str | None = None
     message: str | None = None
+    preview: ExecutionPreview | None = None
 
     model_config = {"frozen": True}
 
 
-class ExecutionPreview(BaseModel):
-    """Preview of what would happen if split is executed."""
+class SplitSnapshot(BaseModel):
+    """
+    State of a split read in a single round-trip.
 
-    recipient_amounts: list[int]
-    protocol_fee: int
-    available: int
-    pending_recipient_amounts: list[int]
-    pending_protocol_amount: int
+    is_split is None when the isCascadeSplitConfig read failed (unknown, not
+    "not a split"). Other fields are None when the address is not a split or
+    the individual read failed.
+    """
+
+    is_split: bool | None
+    config: SplitConfig | None = None
+    balance: int | None = None
+    has_pending_funds: bool | None = None
+    pending_amount: int | None = None
+    total_unclaimed: int | None = None
+    preview: ExecutionPreview | None = None
 
     model_config = {"frozen": True}
 
@@ -123,6 +151,12 @@ class GasOptions(BaseModel):
     estimate_gas: bool = False
     """Estimate gas dynamically (adds 20% buffer). Default: False (use fixed limits)."""
 
+    force_estimate_gas: bool = False
+    """Simulate with eth_estimateGas even for SDK calls, whose gas is otherwise precomputed per recipient."""
+
+    gas_buffer_percent: int = 20
+    """Headroom added to estimated gas, in percent. Default: 20."""
+
     gas_limit: int | None = None
     """Override gas limit. If None, uses default or estimation."""
 
@@ -143,6 +177,7 @@ class EnsureParams(BaseModel):
     authority: str | None = None
     token: str | None = None
     gas: GasOptions | None = None
+    await_receipt: bool = True
 
     model_config = {"frozen": True}
 
@@ -152,5 +187,7 @@ class ExecuteOptions(BaseModel):
 
     min_balance: int | None = None
     gas: GasOptions | None = None
+    await_receipt: bool = True
+    return_preview: bool = False
 
     model_config = {"frozen": True}
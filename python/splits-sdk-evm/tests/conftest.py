@@ -3,8 +3,10 @@
 import subprocess
 import time
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 import pytest
+from eth_abi import encode
 from web3 import AsyncWeb3, Web3
 
 # Anvil's pre-funded test accounts (same as Hardhat/Foundry)
@@ -124,6 +126,20 @@ ERC20_BALANCE_ABI = [
 ]
 
 
+# Balances mapping slots to try: slot 0 (standard ERC20), then slot 9 (Circle's USDC)
+USDC_BALANCE_SLOTS = (0, 9)
+
+# Balances mapping slot that worked, per token: later fundings try it first
+_USDC_SLOT_CACHE: dict[str, int] = {}
+
+
+def _balance_slots(usdc_address: str) -> list[int]:
+    """Balances mapping slots to try for a token, the one that last worked first."""
+    known = _USDC_SLOT_CACHE.get(usdc_address)
+    return sorted(USDC_BALANCE_SLOTS, key=lambda slot: slot != known)
+
+
+@lru_cache(maxsize=2048)
 def _compute_balance_slot(address: str, mapping_slot: int = 0) -> str:
     """
     Compute storage slot for ERC20 balances mapping.
@@ -152,9 +168,8 @@ async def fund_with_usdc(w3, address: str, amount: int, usdc_address: str = BASE
         amount: Amount in USDC smallest units (6 decimals, so 1_000_000 = 1 USDC)
         usdc_address: USDC contract address
     """
-    # USDC uses slot 0 for balances mapping (standard ERC20 pattern)
-    # Try slot 0 first, then slot 9 (Circle's USDC uses slot 9)
-    for slot in [0, 9]:
+    # Try the slot that worked for this token before, else slot 0 then slot 9
+    for slot in _balance_slots(usdc_address):
         storage_slot = _compute_balance_slot(address, slot)
         # Encode amount as 32-byte hex
         amount_hex = "0x" + amount.to_bytes(32, "big").hex()
@@ -168,6 +183,7 @@ async def fund_with_usdc(w3, address: str, amount: int, usdc_address: str = BASE
         usdc = w3.eth.contract(address=Web3.to_checksum_address(usdc_address), abi=ERC20_BALANCE_ABI)
         balance = await usdc.functions.balanceOf(Web3.to_checksum_address(address)).call()
         if balance == amount:
+            _USDC_SLOT_CACHE[usdc_address] = slot
             return
 
     raise RuntimeError(f"Failed to set USDC balance for {address}")
@@ -177,7 +193,7 @@ def fund_with_usdc_sync(w3, address: str, amount: int, usdc_address: str = BASE_
     """
     Sync version of fund_with_usdc for sync Web3 instance.
     """
-    for slot in [0, 9]:
+    for slot in _balance_slots(usdc_address):
         storage_slot = _compute_balance_slot(address, slot)
         amount_hex = "0x" + amount.to_bytes(32, "big").hex()
 
@@ -189,6 +205,7 @@ def fund_with_usdc_sync(w3, address: str, amount: int, usdc_address: str = BASE_
         usdc = w3.eth.contract(address=Web3.to_checksum_address(usdc_address), abi=ERC20_BALANCE_ABI)
         balance = usdc.functions.balanceOf(Web3.to_checksum_address(address)).call()
         if balance == amount:
+            _USDC_SLOT_CACHE[usdc_address] = slot
             return
 
     raise RuntimeError(f"Failed to set USDC balance for {address}")
@@ -214,3 +231,37 @@ async def async_w3(rpc_url: str):
         yield w3
     finally:
         await w3.provider.disconnect()
+
+
+# Mock get_split_snapshot batch responses (unit tests)
+SNAPSHOT_SPLIT = "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"
+SNAPSHOT_AUTHORITY = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+SNAPSHOT_TOKEN = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+SNAPSHOT_RECIPIENT = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+
+def snapshot_responses(is_split: bool = True) -> list[dict]:
+    """Batch responses for get_split_snapshot, in request order (for unit tests)."""
+    results = [
+        encode(["bool"], [is_split]),
+        encode(["address"], [SNAPSHOT_AUTHORITY]),
+        encode(["address"], [SNAPSHOT_TOKEN]),
+        encode(["bytes32"], [b"test-id".ljust(32, b"\x00")]),
+        encode(["(address,uint16)[]"], [[(SNAPSHOT_RECIPIENT, 9900)]]),
+        encode(["uint256"], [5_000_000]),
+        encode(["bool"], [True]),
+        encode(["uint256"], [5_000_000]),
+        encode(["uint256"], [0]),
+        encode(["uint256[]", "uint256", "uint256", "uint256[]", "uint256"], [[4_950_000], 50_000, 5_000_000, [0], 0]),
+    ]
+    return [{"jsonrpc": "2.0", "id": i, "result": "0x" + r.hex()} for i, r in enumerate(results)]
+
+
+def aggregate3_result(*results: bytes | None) -> bytes:
+    """Multicall3 aggregate3 return data; None marks a failed sub-call (for unit tests)."""
+    return encode(["(bool,bytes)[]"], [[(False, b"") if r is None else (True, r) for r in results]])
+
+
+def config_multicall_result(is_split: bool = True) -> bytes:
+    """Multicall3 aggregate3 return data for get_split_config (for unit tests)."""
+    return aggregate3_result(*(bytes.fromhex(r["result"][2:]) for r in snapshot_responses(is_split)[:5]))
@@ -1,24 +1,57 @@
 """Tests for async helper functions."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import gc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-
-from cascade_splits_evm import Recipient
+from conftest import (
+    SNAPSHOT_AUTHORITY,
+    SNAPSHOT_RECIPIENT,
+    SNAPSHOT_SPLIT,
+    SNAPSHOT_TOKEN,
+    aggregate3_result,
+    config_multicall_result,
+    snapshot_responses,
+)
+from eth_abi import encode
+from eth_account import Account
+from eth_utils import function_signature_to_4byte_selector
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3.exceptions import TransactionNotFound, Web3RPCError
+from web3.providers.persistent import WebSocketProvider
+
+from cascade_splits_evm import RECEIPT_POLL_LATENCY, RECEIPT_TIMEOUT, SPLIT_CONFIG_IMPL_ABI, Recipient
 from cascade_splits_evm.async_helpers import (
+    _chain_id,
+    _contract,
     get_default_token,
     get_pending_amount,
     get_split_balance,
     get_split_config,
+    get_split_snapshot,
+    get_split_snapshots,
     get_total_unclaimed,
     has_pending_funds,
     is_cascade_split,
+    multicall,
+    poll_receipt,
     predict_split_address,
     preview_execution,
+    send_transaction,
+    sign_raw_transaction,
     to_evm_recipient,
     to_evm_recipients,
+    wait_for_receipt,
 )
-from cascade_splits_evm.types import EvmRecipient
+from cascade_splits_evm.constants import MULTICALL3_ADDRESS
+from cascade_splits_evm.execute import execute_split
+from cascade_splits_evm.multicall_batcher import MulticallBatcher
+from cascade_splits_evm.split_cache import SplitCache
+from cascade_splits_evm.types import EvmRecipient, ExecuteOptions, SplitSnapshot
 
 
 class TestAsyncHelpers:
@@ -64,6 +97,21 @@ class TestAsyncHelpers:
         token = get_default_token(84532)
         assert token == "0x036CbD53842c5426634e7929541eC2318f3dCF7e"  # Sepolia USDC
 
+    @pytest.mark.asyncio
+    async def test_chain_id_read_once_per_provider(self) -> None:
+        """eth_chainId should be requested once per provider, not once per operation."""
+        reads = []
+
+        async def chain_id() -> int:
+            reads.append(1)
+            return 8453
+
+        mock_w3 = MagicMock()
+        type(mock_w3.eth).chain_id = property(lambda _: chain_id())
+
+        assert [await _chain_id(mock_w3) for _ in range(3)] == [8453] * 3
+        assert len(reads) == 1
+
 
 class TestAsyncContractCalls:
     """Tests for async contract call functions."""
@@ -72,17 +120,9 @@ class TestAsyncContractCalls:
     async def test_is_cascade_split_true(self) -> None:
         """Test is_cascade_split returns True for valid split."""
         mock_w3 = MagicMock()
-        mock_contract = MagicMock()
-        mock_contract.functions.isCascadeSplitConfig.return_value.call = AsyncMock(return_value=True)
-        mock_w3.eth.contract.return_value = mock_contract
-        mock_w3.to_checksum_address = lambda x: x
-
-        # Patch AsyncWeb3.to_checksum_address
-        with patch(
-            "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
-            return_value="0xSplit",
-        ):
-            result = await is_cascade_split(mock_w3, "0xSplit")
+        mock_w3.eth.call = AsyncMock(return_value=encode(["bool"], [True]))
+
+        result = await is_cascade_split(mock_w3, SNAPSHOT_SPLIT)
 
         assert result is True
 
@@ -90,45 +130,32 @@ class TestAsyncContractCalls:
     async def test_is_cascade_split_false_on_error(self) -> None:
         """Test is_cascade_split returns False on error."""
         mock_w3 = MagicMock()
-        mock_w3.eth.contract.side_effect = Exception("Not a split")
+        mock_w3.eth.call = AsyncMock(side_effect=Exception("Not a split"))
 
-        with patch(
-            "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
-            return_value="0xNotASplit",
-        ):
-            result = await is_cascade_split(mock_w3, "0xNotASplit")
+        result = await is_cascade_split(mock_w3, SNAPSHOT_SPLIT)
 
         assert result is False
 
     @pytest.mark.asyncio
     async def test_get_split_balance(self) -> None:
-        """Test getting split balance."""
+        """Test getting split balance with a pre-encoded eth_call."""
         mock_w3 = MagicMock()
-        mock_contract = MagicMock()
-        mock_contract.functions.getBalance.return_value.call = AsyncMock(return_value=1000000)
-        mock_w3.eth.contract.return_value = mock_contract
+        mock_w3.eth.call = AsyncMock(return_value=encode(["uint256"], [1000000]))
 
-        with patch(
-            "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
-            return_value="0xSplit",
-        ):
-            result = await get_split_balance(mock_w3, "0xSplit")
+        result = await get_split_balance(mock_w3, SNAPSHOT_SPLIT)
 
         assert result == 1000000
+        tx = mock_w3.eth.call.await_args.args[0]
+        assert tx == {"to": SNAPSHOT_SPLIT, "data": function_signature_to_4byte_selector("getBalance()")}
+        mock_w3.eth.contract.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_has_pending_funds(self) -> None:
         """Test checking for pending funds."""
         mock_w3 = MagicMock()
-        mock_contract = MagicMock()
-        mock_contract.functions.hasPendingFunds.return_value.call = AsyncMock(return_value=True)
-        mock_w3.eth.contract.return_value = mock_contract
+        mock_w3.eth.call = AsyncMock(return_value=encode(["bool"], [True]))
 
-        with patch(
-            "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
-            return_value="0xSplit",
-        ):
-            result = await has_pending_funds(mock_w3, "0xSplit")
+        result = await has_pending_funds(mock_w3, SNAPSHOT_SPLIT)
 
         assert result is True
 
@@ -136,15 +163,9 @@ class TestAsyncContractCalls:
     async def test_get_pending_amount(self) -> None:
         """Test getting pending amount."""
         mock_w3 = MagicMock()
-        mock_contract = MagicMock()
-        mock_contract.functions.pendingAmount.return_value.call = AsyncMock(return_value=500000)
-        mock_w3.eth.contract.return_value = mock_contract
+        mock_w3.eth.call = AsyncMock(return_value=encode(["uint256"], [500000]))
 
-        with patch(
-            "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
-            return_value="0xSplit",
-        ):
-            result = await get_pending_amount(mock_w3, "0xSplit")
+        result = await get_pending_amount(mock_w3, SNAPSHOT_SPLIT)
 
         assert result == 500000
 
@@ -152,15 +173,9 @@ class TestAsyncContractCalls:
     async def test_get_total_unclaimed(self) -> None:
         """Test getting total unclaimed."""
         mock_w3 = MagicMock()
-        mock_contract = MagicMock()
-        mock_contract.functions.totalUnclaimed.return_value.call = AsyncMock(return_value=100000)
-        mock_w3.eth.contract.return_value = mock_contract
+        mock_w3.eth.call = AsyncMock(return_value=encode(["uint256"], [100000]))
 
-        with patch(
-            "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
-            return_value="0xSplit",
-        ):
-            result = await get_total_unclaimed(mock_w3, "0xSplit")
+        result = await get_total_unclaimed(mock_w3, SNAPSHOT_SPLIT)
 
         assert result == 100000
 
@@ -168,23 +183,14 @@ class TestAsyncContractCalls:
     async def test_preview_execution(self) -> None:
         """Test previewing execution."""
         mock_w3 = MagicMock()
-        mock_contract = MagicMock()
-        mock_contract.functions.previewExecution.return_value.call = AsyncMock(
-            return_value=(
-                [500000, 300000],  # recipient_amounts
-                10000,  # protocol_fee
-                810000,  # available
-                [0, 0],  # pending_recipient_amounts
-                0,  # pending_protocol_amount
+        mock_w3.eth.call = AsyncMock(
+            return_value=encode(
+                ["uint256[]", "uint256", "uint256", "uint256[]", "uint256"],
+                [[500000, 300000], 10000, 810000, [0, 0], 0],
             )
         )
-        mock_w3.eth.contract.return_value = mock_contract
 
-        with patch(
-            "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
-            return_value="0xSplit",
-        ):
-            result = await preview_execution(mock_w3, "0xSplit")
+        result = await preview_execution(mock_w3, SNAPSHOT_SPLIT)
 
         assert result.recipient_amounts == [500000, 300000]
         assert result.protocol_fee == 10000
@@ -192,71 +198,337 @@ class TestAsyncContractCalls:
 
     @pytest.mark.asyncio
     async def test_get_split_config(self) -> None:
-        """Test getting split config."""
+        """Test getting split config reads every field in one Multicall3 call."""
         mock_w3 = MagicMock()
-        mock_contract = MagicMock()
-
-        # Setup mock calls
-        mock_contract.functions.isCascadeSplitConfig.return_value.call = AsyncMock(return_value=True)
-        mock_contract.functions.authority.return_value.call = AsyncMock(return_value="0xAuthority")
-        mock_contract.functions.token.return_value.call = AsyncMock(return_value="0xToken")
-        mock_contract.functions.uniqueId.return_value.call = AsyncMock(return_value=b"unique-id")
-        mock_contract.functions.getRecipients.return_value.call = AsyncMock(
-            return_value=[("0xAlice", 5940), ("0xBob", 3960)]
-        )
-        mock_w3.eth.contract.return_value = mock_contract
+        mock_w3.eth.call = AsyncMock(return_value=config_multicall_result())
 
-        with patch(
-            "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
-            return_value="0xSplit",
-        ):
-            result = await get_split_config(mock_w3, "0xSplit")
+        result = await get_split_config(mock_w3, SNAPSHOT_SPLIT)
 
         assert result is not None
-        assert result.authority == "0xAuthority"
-        assert result.token == "0xToken"
-        assert len(result.recipients) == 2
+        assert result.authority == SNAPSHOT_AUTHORITY
+        assert result.token == SNAPSHOT_TOKEN
+        assert result.unique_id == b"test-id".ljust(32, b"\x00")
+        assert result.recipients == [EvmRecipient(addr=SNAPSHOT_RECIPIENT, percentage_bps=9900)]
+        mock_w3.eth.call.assert_awaited_once()
+        assert mock_w3.eth.call.await_args.args[0]["to"] == MULTICALL3_ADDRESS
+
+    @pytest.mark.asyncio
+    async def test_multicall(self) -> None:
+        """Bound calls should go out as one aggregate3 eth_call; failed sub-calls are None."""
+        w3 = AsyncWeb3()
+        contract = w3.eth.contract(address=SNAPSHOT_SPLIT, abi=SPLIT_CONFIG_IMPL_ABI)
+        response = encode(["(bool,bytes)[]"], [[(True, encode(["uint256"], [5])), (False, b"")]])
+        w3.eth.call = AsyncMock(return_value=response)
+
+        balance, pending = await multicall(w3, [contract.functions.getBalance(), contract.functions.pendingAmount()])
+
+        assert (balance, pending) == (5, None)
+        assert w3.eth.call.await_args.args[0]["to"] == MULTICALL3_ADDRESS
+
+    @pytest.mark.asyncio
+    async def test_get_split_config_is_cached(self) -> None:
+        """Configs are immutable, so a cached config should skip the RPC."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.call = AsyncMock(return_value=config_multicall_result())
+        cache = SplitCache()
+
+        first = await get_split_config(mock_w3, SNAPSHOT_SPLIT, cache=cache)
+        second = await get_split_config(mock_w3, SNAPSHOT_SPLIT.lower(), cache=cache)
+
+        assert first is not None
+        assert second == first
+        assert cache.get(SNAPSHOT_SPLIT) is True
+        mock_w3.eth.call.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_get_split_config_invalid_returns_none(self) -> None:
         """Test get_split_config returns None for invalid split."""
         mock_w3 = MagicMock()
-        mock_contract = MagicMock()
-        mock_contract.functions.isCascadeSplitConfig.return_value.call = AsyncMock(return_value=False)
-        mock_w3.eth.contract.return_value = mock_contract
+        mock_w3.eth.call = AsyncMock(return_value=config_multicall_result(is_split=False))
 
-        with patch(
-            "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
-            return_value="0xNotASplit",
-        ):
-            result = await get_split_config(mock_w3, "0xNotASplit")
+        result = await get_split_config(mock_w3, SNAPSHOT_SPLIT)
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_split_config_error_returns_none(self) -> None:
+        """Test get_split_config returns None when the call fails."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.call = AsyncMock(side_effect=Web3RPCError("boom"))
+
+        result = await get_split_config(mock_w3, SNAPSHOT_SPLIT)
 
         assert result is None
 
     @pytest.mark.asyncio
     async def test_predict_split_address(self) -> None:
-        """Test predicting split address."""
+        """Test predicting split address with pre-encoded calldata."""
         mock_w3 = MagicMock()
-        mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.return_value.call = AsyncMock(return_value="0xPredictedAddress")
-        mock_w3.eth.contract.return_value = mock_factory
+        mock_w3.eth.call = AsyncMock(return_value=encode(["address"], [SNAPSHOT_SPLIT]))
 
-        recipients = [
-            EvmRecipient(addr="0xAlice", percentage_bps=5940),
-            EvmRecipient(addr="0xBob", percentage_bps=3960),
-        ]
+        recipients = [EvmRecipient(addr=SNAPSHOT_RECIPIENT, percentage_bps=9900)]
+
+        result = await predict_split_address(
+            mock_w3,
+            MULTICALL3_ADDRESS,
+            SNAPSHOT_AUTHORITY,
+            SNAPSHOT_TOKEN,
+            b"unique-id".ljust(32, b"\x00"),
+            recipients,
+        )
+
+        assert result == SNAPSHOT_SPLIT
+        tx = mock_w3.eth.call.await_args.args[0]
+        assert tx["to"] == MULTICALL3_ADDRESS
+        assert tx["data"][:4] == function_signature_to_4byte_selector(
+            "predictSplitAddress(address,address,bytes32,(address,uint16)[])"
+        )
+
+    def test_contract_built_once_per_address(self) -> None:
+        """Repeated lookups of the same contract should reuse one contract instance."""
+        mock_w3 = MagicMock()
+
+        first = _contract(mock_w3, SNAPSHOT_SPLIT, "factory")
+
+        assert _contract(mock_w3, SNAPSHOT_SPLIT, "factory") is first
+        mock_w3.eth.contract.assert_called_once()
+
+    def test_abi_parsed_once_across_addresses(self) -> None:
+        """Contracts sharing an ABI should be bound from one parsed contract class."""
+        w3 = AsyncWeb3()
+
+        split = _contract(w3, SNAPSHOT_SPLIT)
+        other = _contract(w3, SNAPSHOT_AUTHORITY)
+
+        assert type(split) is type(other)
+        assert other.address == SNAPSHOT_AUTHORITY
+
+    def test_contract_cache_does_not_keep_web3_alive(self) -> None:
+        """Cached contracts should be released with their AsyncWeb3 instance."""
+        w3 = AsyncWeb3()
+        _contract(w3, SNAPSHOT_SPLIT)
+        ref = weakref.ref(w3)
+
+        del w3
+        gc.collect()
+
+        assert ref() is None
+
+
+class TestAsyncSplitSnapshot:
+    """Tests for batched split snapshots (async)."""
+
+    async def test_snapshot_reads_everything_in_one_batch(self) -> None:
+        """The async snapshot should await one batch request."""
+        mock_w3 = MagicMock()
+        mock_w3.provider.make_batch_request = AsyncMock(return_value=snapshot_responses())
+
+        snapshot = await get_split_snapshot(mock_w3, SNAPSHOT_SPLIT)
+
+        mock_w3.provider.make_batch_request.assert_awaited_once()
+        assert snapshot.is_split is True
+        assert snapshot.pending_amount == 5_000_000
+
+    async def test_snapshots_of_many_splits_in_one_call(self) -> None:
+        """Several splits should be read in one aggregate3 and come back in order."""
+        results = [bytes.fromhex(r["result"][2:]) for r in snapshot_responses() + snapshot_responses(is_split=False)]
+        mock_w3 = MagicMock()
+        mock_w3.eth.call = AsyncMock(return_value=aggregate3_result(*results))
+
+        split, other = await get_split_snapshots(mock_w3, [SNAPSHOT_SPLIT, SNAPSHOT_AUTHORITY])
+
+        mock_w3.eth.call.assert_awaited_once()
+        assert mock_w3.eth.call.await_args.args[0]["to"] == MULTICALL3_ADDRESS
+        assert split.is_split is True
+        assert split.config is not None
+        assert split.pending_amount == 5_000_000
+        assert other == SplitSnapshot(is_split=False)
+        assert await get_split_snapshots(mock_w3, []) == []
+
+    async def test_rejected_batch_raises(self) -> None:
+        """A node that rejects the batch outright should surface as an RPC error."""
+        mock_w3 = MagicMock()
+        mock_w3.provider.make_batch_request = AsyncMock(
+            return_value={"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch not supported"}}
+        )
+
+        with pytest.raises(Web3RPCError):
+            await get_split_snapshot(mock_w3, SNAPSHOT_SPLIT)
+
+
+class TestSigning:
+    """Tests for transaction signing off the event loop."""
+
+    TX = {
+        "to": "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7",
+        "data": "0x",
+        "nonce": 0,
+        "gas": 300_000,
+        "gasPrice": 1_000_000_000,
+        "chainId": 8453,
+        "value": 0,
+    }
+
+    def test_sign_raw_transaction_matches_account(self) -> None:
+        """Module-level signer (for process pools) should match account signing."""
+        account = Account.from_key("0x" + "ab" * 32)
+
+        raw = sign_raw_transaction(self.TX, account.key)
+
+        assert raw == account.sign_transaction(self.TX).raw_transaction
+
+    @pytest.mark.asyncio
+    async def test_send_transaction_signs_in_executor(self) -> None:
+        """With a signing_executor, the raw transaction is produced there."""
+        account = Account.from_key("0x" + "ab" * 32)
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count = AsyncMock(return_value=0)
+        mock_w3.eth.send_raw_transaction = AsyncMock(return_value=b"test-id".ljust(32, b"\x00"))
+        mock_call = MagicMock()
+        mock_call.build_transaction = AsyncMock(return_value=self.TX)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await send_transaction(mock_w3, account, 8453, mock_call, 300_000, signing_executor=executor)
+
+        mock_w3.eth.send_raw_transaction.assert_called_once_with(account.sign_transaction(self.TX).raw_transaction)
+
+
+class TestWaitForReceipt:
+    """Tests for receipt waiting."""
+
+    TX_HASH = b"test-id".ljust(32, b"\x00")
+
+    @pytest.mark.asyncio
+    async def test_http_provider_polls_with_tight_latency(self) -> None:
+        """HTTP providers poll with the SDK's latency and timeout."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.wait_for_transaction_receipt = AsyncMock(return_value={"status": 1})
+
+        receipt = await wait_for_receipt(mock_w3, self.TX_HASH)
+
+        assert receipt == {"status": 1}
+        mock_w3.eth.wait_for_transaction_receipt.assert_called_once_with(
+            self.TX_HASH, timeout=RECEIPT_TIMEOUT, poll_latency=RECEIPT_POLL_LATENCY
+        )
+
+    @pytest.mark.asyncio
+    async def test_http_poll_latency_is_configurable(self) -> None:
+        """A caller-supplied poll latency replaces the default."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.wait_for_transaction_receipt = AsyncMock(return_value={"status": 1})
+
+        await wait_for_receipt(mock_w3, self.TX_HASH, poll_latency=0.1)
+
+        assert mock_w3.eth.wait_for_transaction_receipt.call_args.kwargs["poll_latency"] == 0.1
+
+    @pytest.mark.asyncio
+    async def test_websocket_provider_checks_receipt_per_block(self) -> None:
+        """Websocket providers fetch the receipt once per newHeads message, then unsubscribe."""
+        mock_w3 = MagicMock()
+        mock_w3.provider = MagicMock(spec=WebSocketProvider)
+        mock_w3.eth.subscribe = AsyncMock(return_value="0xsub")
+        mock_w3.eth.unsubscribe = AsyncMock(return_value=True)
+        mock_w3.eth.get_transaction_receipt = AsyncMock(
+            side_effect=[TransactionNotFound("pending"), TransactionNotFound("pending"), {"status": 1}]
+        )
+
+        async def new_heads():
+            for number in range(5):
+                yield {"subscription": "0xsub", "result": {"number": number}}
+
+        mock_w3.socket.process_subscriptions = new_heads
+
+        receipt = await wait_for_receipt(mock_w3, self.TX_HASH)
+
+        assert receipt == {"status": 1}
+        assert mock_w3.eth.get_transaction_receipt.call_count == 3
+        mock_w3.eth.subscribe.assert_called_once_with("newHeads")
+        mock_w3.eth.unsubscribe.assert_called_once_with("0xsub")
+        mock_w3.eth.wait_for_transaction_receipt.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_poll_receipt_checks_once(self) -> None:
+        """poll_receipt returns None while pending, then the receipt, without waiting."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_receipt = AsyncMock(side_effect=[TransactionNotFound("pending"), {"status": 1}])
+
+        assert await poll_receipt(mock_w3, self.TX_HASH) is None
+        assert await poll_receipt(mock_w3, self.TX_HASH) == {"status": 1}
+
+    @pytest.mark.asyncio
+    async def test_execute_without_await_receipt_returns_pending(self) -> None:
+        """With await_receipt=False, execute_split returns PENDING as soon as the transaction is sent."""
+        checks = aggregate3_result(encode(["bool"], [True]), encode(["uint256"], [1]), encode(["bool"], [True]), b"")
+        mock_w3 = MagicMock()
+        mock_w3.eth.call = AsyncMock(return_value=checks)
+        mock_w3.eth.get_transaction_count = AsyncMock(return_value=0)
+        mock_w3.eth.send_raw_transaction = AsyncMock(return_value=HexBytes(self.TX_HASH))
+        mock_w3.eth.wait_for_transaction_receipt = AsyncMock()
+        mock_call = mock_w3.eth.contract.return_value.return_value.functions.executeSplit.return_value
+        mock_call.build_transaction = AsyncMock(side_effect=lambda params: params)
+        account = MagicMock(address=SNAPSHOT_AUTHORITY)
+        account.sign_transaction.return_value = MagicMock(raw_transaction=b"signed")
+
+        result = await execute_split(
+            mock_w3, account, SNAPSHOT_SPLIT, ExecuteOptions(await_receipt=False), chain_id=8453
+        )
+
+        assert (result.status, result.signature) == ("PENDING", HexBytes(self.TX_HASH).hex())
+        mock_w3.eth.wait_for_transaction_receipt.assert_not_called()
+
+
+class TestMulticallBatcher:
+    """Tests for coalescing concurrent reads into one aggregate3."""
+
+    SPLIT_B = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_aggregate3(self) -> None:
+        """Reads made within the window go out as a single Multicall3 eth_call, each getting its own result."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.call = AsyncMock(
+            return_value=aggregate3_result(encode(["uint256"], [1]), encode(["uint256"], [2]), encode(["bool"], [True]))
+        )
+        batcher = MulticallBatcher(mock_w3, window=0.01)
+
+        results = await asyncio.gather(
+            get_split_balance(mock_w3, SNAPSHOT_SPLIT, batcher),
+            get_split_balance(mock_w3, self.SPLIT_B, batcher),
+            has_pending_funds(mock_w3, SNAPSHOT_SPLIT, batcher),
+        )
+
+        assert results == [1, 2, True]
+        mock_w3.eth.call.assert_called_once()
+        assert mock_w3.eth.call.call_args.args[0]["to"] == MULTICALL3_ADDRESS
+
+    @pytest.mark.asyncio
+    async def test_failed_sub_call_is_repeated_directly(self) -> None:
+        """A sub-call that fails in the batch is sent on its own, so the caller sees the node's error."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.call = AsyncMock(
+            side_effect=[aggregate3_result(encode(["uint256"], [1]), None), Web3RPCError("execution reverted")]
+        )
+        batcher = MulticallBatcher(mock_w3, window=0.01)
+
+        balance, reverted = await asyncio.gather(
+            get_split_balance(mock_w3, SNAPSHOT_SPLIT, batcher),
+            is_cascade_split(mock_w3, self.SPLIT_B, batcher=batcher),
+        )
+
+        assert (balance, reverted) == (1, False)
+        assert mock_w3.eth.call.call_args.args[0]["to"] == self.SPLIT_B
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_waiting(self) -> None:
+        """Reaching max_batch flushes immediately instead of waiting out the window."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.call = AsyncMock(return_value=aggregate3_result(encode(["uint256"], [7]), encode(["uint256"], [8])))
+        batcher = MulticallBatcher(mock_w3, window=60, max_batch=2)
 
-        with patch(
-            "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
-            side_effect=lambda x: x,
-        ):
-            result = await predict_split_address(
-                mock_w3,
-                "0xFactory",
-                "0xAuthority",
-                "0xToken",
-                b"unique-id".ljust(32, b"\x00"),
-                recipients,
+        async with asyncio.timeout(1):
+            results = await asyncio.gather(
+                get_split_balance(mock_w3, SNAPSHOT_SPLIT, batcher),
+                get_split_balance(mock_w3, self.SPLIT_B, batcher),
             )
 
-        assert result == "0xPredictedAddress"
+        assert results == [7, 8]
@@ -3,15 +3,22 @@
 These tests verify that clients fail fast with clear errors on invalid configuration.
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from web3.providers.persistent import WebSocketProvider
 
 from cascade_splits_evm import (
     SPLIT_FACTORY_ADDRESSES,
     AsyncCascadeSplitsClient,
     CascadeSplitsClient,
     ChainNotSupportedError,
+    EnsureParams,
+    EnsureResult,
+    ExecuteResult,
+    Recipient,
+    create_http_session,
 )
 
 
@@ -76,7 +83,7 @@ class TestAsyncClientInitialization:
 
     def test_async_client_accepts_custom_factory_address(self) -> None:
         """Should use custom factory address when provided."""
-        custom_factory = "0xCustomFactory123456789012345678901234567"
+        custom_factory = "0x70997970c51812dc3a010c7d01b50e0d17dc79c8"
 
         with patch("cascade_splits_evm.async_client.AsyncWeb3") as mock_web3_class:
             mock_w3 = MagicMock()
@@ -96,7 +103,7 @@ class TestAsyncClientInitialization:
                     factory_address=custom_factory,
                 )
 
-                assert client.factory_address == custom_factory
+                assert client.factory_address == "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
 
     def test_async_client_default_chain_is_base_mainnet(self) -> None:
         """Default chain_id should be Base mainnet (8453)."""
@@ -168,7 +175,7 @@ class TestSyncClientInitialization:
 
     def test_sync_client_accepts_custom_factory_address(self) -> None:
         """Should use custom factory address when provided."""
-        custom_factory = "0xCustomFactory123456789012345678901234567"
+        custom_factory = "0x70997970c51812dc3a010c7d01b50e0d17dc79c8"
 
         with patch("cascade_splits_evm.client.Web3") as mock_web3_class:
             mock_w3 = MagicMock()
@@ -188,7 +195,190 @@ class TestSyncClientInitialization:
                     factory_address=custom_factory,
                 )
 
-                assert client.factory_address == custom_factory
+                assert client.factory_address == "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+
+class TestSyncClientSession:
+    """Tests for the sync client's pooled HTTP session."""
+
+    def test_sync_client_shares_pooled_session_with_provider(self) -> None:
+        """Provider should reuse a keep-alive session with a sized connection pool."""
+        with (
+            patch("cascade_splits_evm.client.Web3") as mock_web3_class,
+            patch("cascade_splits_evm.client._HTTPProvider") as mock_provider_class,
+        ):
+            mock_web3_class.return_value = MagicMock()
+            mock_web3_class.to_checksum_address = lambda x: x
+
+            client = CascadeSplitsClient(
+                rpc_url="https://sepolia.base.org",
+                private_key="0x" + "ab" * 32,
+                chain_id=84532,
+            )
+
+            mock_provider_class.assert_called_once_with("https://sepolia.base.org", session=client._session)
+            adapter = client._session.get_adapter("https://sepolia.base.org")
+            assert adapter._pool_maxsize == 20
+
+    def test_sync_client_context_manager_closes_session(self) -> None:
+        """Exiting the context manager should close the HTTP session."""
+        with patch("cascade_splits_evm.client.Web3") as mock_web3_class:
+            mock_web3_class.return_value = MagicMock()
+            mock_web3_class.to_checksum_address = lambda x: x
+
+            with (
+                patch("cascade_splits_evm.client.create_requests_session") as mock_create_session,
+                CascadeSplitsClient(
+                    rpc_url="https://sepolia.base.org",
+                    private_key="0x" + "ab" * 32,
+                    chain_id=84532,
+                ),
+            ):
+                pass
+
+            mock_create_session.return_value.close.assert_called_once()
+
+    def test_sync_client_leaves_shared_session_open(self) -> None:
+        """A session passed in is used by the provider and left for the caller to close."""
+        session = MagicMock()
+
+        with CascadeSplitsClient(
+            rpc_url="https://sepolia.base.org",
+            private_key="0x" + "ab" * 32,
+            chain_id=84532,
+            session=session,
+        ) as client:
+            assert client._session is session
+
+        session.close.assert_not_called()
+
+
+class TestAsyncClientSession:
+    """Tests for the async client's pooled HTTP session."""
+
+    @pytest.mark.asyncio
+    async def test_async_client_caches_keep_alive_session(self) -> None:
+        """Provider should use a pooled keep-alive session instead of web3's force-close default."""
+        async with AsyncCascadeSplitsClient(
+            rpc_url="https://sepolia.base.org",
+            private_key="0x" + "ab" * 32,
+            chain_id=84532,
+        ) as client:
+            provider = client.w3.provider
+            await provider._ensure_pooled_session()
+            await provider._ensure_pooled_session()
+
+            sessions = [session for _, session in provider._request_session_manager.session_cache.items()]
+            assert len(sessions) == 1
+            assert sessions[0].connector.limit == 50
+            assert sessions[0].connector.force_close is False
+
+        assert sessions[0].closed
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_websocket_provider_for_ws_urls(self) -> None:
+        """ws(s):// URLs should get a persistent websocket provider that decodes responses."""
+        client = AsyncCascadeSplitsClient(
+            rpc_url="wss://sepolia.base.org",
+            private_key="0x" + "ab" * 32,
+            chain_id=84532,
+        )
+        provider = client.w3.provider
+        provider._ws = MagicMock(recv=AsyncMock(return_value=b'{"jsonrpc":"2.0","id":1,"result":"0x1"}'))
+
+        assert isinstance(provider, WebSocketProvider)
+        assert await provider.socket_recv() == {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+
+    @pytest.mark.asyncio
+    async def test_async_clients_share_injected_session(self) -> None:
+        """Clients given one session should pool through it and leave it open on close."""
+        session = create_http_session(limit=100, limit_per_host=40)
+        clients = [
+            AsyncCascadeSplitsClient(
+                rpc_url="https://sepolia.base.org",
+                private_key="0x" + "ab" * 32,
+                chain_id=84532,
+                session=session,
+            )
+            for _ in range(2)
+        ]
+
+        for client in clients:
+            await client.w3.provider._ensure_pooled_session()
+            cached = [s for _, s in client.w3.provider._request_session_manager.session_cache.items()]
+            assert cached == [session]
+            await client.close()
+
+        assert (session.connector.limit, session.connector.limit_per_host) == (100, 40)
+        assert not session.closed
+        await session.close()
+
+
+class TestAsyncClientEnsureSplits:
+    """Tests for bulk ensure on the async client."""
+
+    @pytest.mark.asyncio
+    async def test_ensure_splits_bounds_concurrency_and_keeps_order(self) -> None:
+        """Results should be in input order with at most `concurrency` calls in flight (and no chain ID lookup)."""
+        client = AsyncCascadeSplitsClient(
+            rpc_url="https://sepolia.base.org",
+            private_key="0x" + "ab" * 32,
+            chain_id=84532,
+        )
+        in_flight = 0
+        peak = 0
+
+        async def fake_ensure(w3, account, factory_address, params, **kwargs):
+            nonlocal in_flight, peak
+            assert kwargs["chain_id"] == 84532
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return EnsureResult(status="NO_CHANGE", split=params.unique_id.decode())
+
+        items = [
+            EnsureParams(unique_id=f"split-{i}".encode(), recipients=[Recipient(address="0xAlice", share=100)])
+            for i in range(5)
+        ]
+
+        with patch("cascade_splits_evm.async_client._ensure_split", AsyncMock(side_effect=fake_ensure)):
+            results = await client.ensure_splits(items, concurrency=2)
+
+        assert [r.split for r in results] == [f"split-{i}" for i in range(5)]
+        assert peak == 2
+
+
+class TestAsyncClientExecuteSplits:
+    """Tests for bulk execute on the async client."""
+
+    @pytest.mark.asyncio
+    async def test_execute_splits_bounds_concurrency_and_keeps_order(self) -> None:
+        """Results should be in input order with at most `concurrency` executions in flight."""
+        client = AsyncCascadeSplitsClient(
+            rpc_url="https://sepolia.base.org",
+            private_key="0x" + "ab" * 32,
+            chain_id=84532,
+        )
+        in_flight = 0
+        peak = 0
+
+        async def fake_execute(w3, account, split_address, options, **kwargs):
+            nonlocal in_flight, peak
+            assert options.min_balance == 1_000
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return ExecuteResult(status="EXECUTED", signature=split_address)
+
+        splits = [f"0xSplit{i}" for i in range(5)]
+
+        with patch("cascade_splits_evm.async_client._execute_split", AsyncMock(side_effect=fake_execute)):
+            results = await client.execute_splits(splits, min_balance=1_000, concurrency=2)
+
+        assert [r.signature for r in results] == splits
+        assert peak == 2
 
 
 class TestClientAddressProperty:
@@ -4,11 +4,99 @@ These tests verify that the sync client has parity with the async client
 for validation and error handling.
 """
 
+import inspect
 from unittest.mock import MagicMock, patch
 
 import pytest
-
-from cascade_splits_evm import CascadeSplitsClient, ChainNotSupportedError, Recipient
+from eth_abi import encode
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import Web3RPCError
+
+from cascade_splits_evm import (
+    CascadeSplitsClient,
+    ChainNotSupportedError,
+    EnsureParams,
+    GasOptions,
+    Recipient,
+    SplitSnapshot,
+    compute_split_address,
+    to_evm_recipients,
+)
+from cascade_splits_evm import client as client_module
+
+ALICE = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+EXISTING_SPLIT = "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC"
+# Factory currentImplementation() as deployed on Base Sepolia
+IMPLEMENTATION = "0xF9ad695ecc76c4b8E13655365b318d54E4131EA6"
+
+
+def _sent_nonces(client: CascadeSplitsClient) -> list[int]:
+    """Nonces of the raw transactions passed to send_raw_transaction, in send order."""
+    calls = client.w3.eth.send_raw_transaction.call_args_list
+    return [TypedTransaction.from_bytes(HexBytes(call.args[0])).as_dict()["nonce"] for call in calls]
+
+
+def _create_bulk_client(send_responses: list[dict]) -> CascadeSplitsClient:
+    """
+    Client with a mocked RPC for batched requests.
+
+    createSplitConfig simulations revert with SplitAlreadyExists for b"exists";
+    sends get send_responses in turn (repeating), an "error" response raising.
+    """
+    client = CascadeSplitsClient(
+        rpc_url="https://sepolia.base.org",
+        private_key="0x" + "ab" * 32,
+        chain_id=84532,
+    )
+    client.w3 = MagicMock()
+    client.w3.eth.get_transaction_count.return_value = 5
+    client.w3.eth.fee_history.return_value = {"baseFeePerGas": [10**9], "reward": [[10**8]]}
+    client._nonces._w3 = client.w3
+    client._fees._w3 = client.w3
+
+    selector = Web3.keccak(text="SplitAlreadyExists(address)")[:4]
+    revert_data = "0x" + (selector + encode(["address"], [EXISTING_SPLIT])).hex()
+
+    def simulate(request_id: int, params: list) -> dict:
+        if b"exists".hex() in params[0]["data"]:
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": 3, "message": "execution reverted", "data": revert_data},
+            }
+        return {"jsonrpc": "2.0", "id": request_id, "result": "0x" + encode(["address"], [ALICE]).hex()}
+
+    def make_batch_request(requests: list) -> list[dict]:
+        return [simulate(i, params) for i, (_, params) in enumerate(requests)]
+
+    def send_raw_transaction(raw: bytes) -> HexBytes:
+        response = send_responses[(client.w3.eth.send_raw_transaction.call_count - 1) % len(send_responses)]
+        if "error" in response:
+            raise Web3RPCError(response["error"]["message"], rpc_response=response)
+        return HexBytes(response["result"])
+
+    client.w3.provider.make_batch_request.side_effect = make_batch_request
+    client.w3.eth.send_raw_transaction.side_effect = send_raw_transaction
+
+    return client
+
+
+class TestSyncClientIsBlocking:
+    """The sync client must never call async helpers (their coroutines would be truthy and never run)."""
+
+    def test_no_coroutine_functions(self) -> None:
+        """Neither the client's methods nor the SDK functions it imports may be coroutine functions."""
+        sdk_functions = [
+            value
+            for value in vars(client_module).values()
+            if inspect.isfunction(value) and value.__module__.startswith("cascade_splits_evm")
+        ]
+        methods = [value for value in vars(CascadeSplitsClient).values() if inspect.isfunction(value)]
+
+        assert sdk_functions
+        assert [f.__qualname__ for f in sdk_functions + methods if inspect.iscoroutinefunction(f)] == []
 
 
 class TestSyncClientInitialization:
@@ -24,6 +112,16 @@ class TestSyncClientInitialization:
             )
         assert exc_info.value.chain_id == 1
 
+    def test_sync_client_init_rejects_empty_batch_size(self) -> None:
+        """batch_size below 1 would never send anything."""
+        with pytest.raises(ValueError, match="batch_size"):
+            CascadeSplitsClient(
+                rpc_url="https://sepolia.base.org",
+                private_key="0x" + "ab" * 32,
+                chain_id=84532,
+                batch_size=0,
+            )
+
     def test_sync_client_accepts_base_mainnet(self) -> None:
         """Sync client should accept Base mainnet."""
         with patch.object(CascadeSplitsClient, "__init__", lambda self, **kwargs: None):
@@ -176,19 +274,15 @@ class TestSyncClientExecuteSplitValidation:
             mock_web3_class.HTTPProvider.return_value = MagicMock()
             mock_web3_class.to_checksum_address = lambda x: x
 
-            # Mock is_cascade_split to return False
-            mock_contract = MagicMock()
-            mock_contract.functions.isCascadeSplitConfig.return_value.call.return_value = False
-            mock_w3.eth.contract.return_value = mock_contract
-
             with patch("cascade_splits_evm.client.Account") as mock_account_class:
                 mock_account = MagicMock()
                 mock_account.address = "0x1234567890123456789012345678901234567890"
                 mock_account_class.from_key.return_value = mock_account
 
+                # Batched pre-flight: isCascadeSplitConfig returns false
                 with patch(
-                    "cascade_splits_evm.helpers.Web3.to_checksum_address",
-                    side_effect=lambda x: x,
+                    "cascade_splits_evm.client._read_split_views",
+                    return_value=[False, None, None, None],
                 ):
                     client = CascadeSplitsClient(
                         rpc_url="https://sepolia.base.org",
@@ -196,11 +290,70 @@ class TestSyncClientExecuteSplitValidation:
                         chain_id=84532,
                     )
 
-                    result = client.execute_split("0xNotASplit")
+                    result = client.execute_split("0x000000000000000000000000000000000000dEaD")
 
                     assert result.status == "SKIPPED"
                     assert result.reason == "not_a_split"
 
+    def test_sync_execute_fails_on_failed_split_check(self) -> None:
+        """A failed split check should fail the execute and not be cached as a non-split."""
+        with patch("cascade_splits_evm.client.Web3") as mock_web3_class:
+            mock_w3 = MagicMock()
+            mock_web3_class.return_value = mock_w3
+            mock_web3_class.HTTPProvider.return_value = MagicMock()
+            mock_web3_class.to_checksum_address = lambda x: x
+
+            with patch("cascade_splits_evm.client.Account") as mock_account_class:
+                mock_account = MagicMock()
+                mock_account.address = "0x1234567890123456789012345678901234567890"
+                mock_account_class.from_key.return_value = mock_account
+
+                # Batched pre-flight: isCascadeSplitConfig reverts (None)
+                with patch(
+                    "cascade_splits_evm.client._read_split_views",
+                    return_value=[None, None, None, None],
+                ):
+                    client = CascadeSplitsClient(
+                        rpc_url="https://sepolia.base.org",
+                        private_key="0x" + "ab" * 32,
+                        chain_id=84532,
+                    )
+
+                    result = client.execute_split("0x000000000000000000000000000000000000dEaD")
+
+                    assert result.status == "FAILED"
+                    assert result.reason == "transaction_failed"
+                    assert client._splits.get("0x000000000000000000000000000000000000dEaD") is None
+
+    def test_sync_execute_fails_on_failed_pending_read(self) -> None:
+        """Sync client should fail, not skip, when the pending-funds read fails."""
+        with patch("cascade_splits_evm.client.Web3") as mock_web3_class:
+            mock_w3 = MagicMock()
+            mock_web3_class.return_value = mock_w3
+            mock_web3_class.HTTPProvider.return_value = MagicMock()
+            mock_web3_class.to_checksum_address = lambda x: x
+
+            with patch("cascade_splits_evm.client.Account") as mock_account_class:
+                mock_account = MagicMock()
+                mock_account.address = "0x1234567890123456789012345678901234567890"
+                mock_account_class.from_key.return_value = mock_account
+
+                # Batched pre-flight: valid split with a balance, hasPendingFunds reverts (None)
+                with patch(
+                    "cascade_splits_evm.client._read_split_views",
+                    return_value=[True, 1_000_000, None, True],
+                ):
+                    client = CascadeSplitsClient(
+                        rpc_url="https://sepolia.base.org",
+                        private_key="0x" + "ab" * 32,
+                        chain_id=84532,
+                    )
+
+                    result = client.execute_split("0x000000000000000000000000000000000000dEaD")
+
+                    assert result.status == "FAILED"
+                    assert result.reason == "transaction_failed"
+
     def test_sync_execute_skips_no_pending_funds(self) -> None:
         """Sync client should skip when no pending funds."""
         with patch("cascade_splits_evm.client.Web3") as mock_web3_class:
@@ -209,20 +362,15 @@ class TestSyncClientExecuteSplitValidation:
             mock_web3_class.HTTPProvider.return_value = MagicMock()
             mock_web3_class.to_checksum_address = lambda x: x
 
-            # Mock is_cascade_split to return True, but no pending funds
-            mock_contract = MagicMock()
-            mock_contract.functions.isCascadeSplitConfig.return_value.call.return_value = True
-            mock_contract.functions.hasPendingFunds.return_value.call.return_value = False
-            mock_w3.eth.contract.return_value = mock_contract
-
             with patch("cascade_splits_evm.client.Account") as mock_account_class:
                 mock_account = MagicMock()
                 mock_account.address = "0x1234567890123456789012345678901234567890"
                 mock_account_class.from_key.return_value = mock_account
 
+                # Batched pre-flight: valid split, but no pending funds
                 with patch(
-                    "cascade_splits_evm.helpers.Web3.to_checksum_address",
-                    side_effect=lambda x: x,
+                    "cascade_splits_evm.client._read_split_views",
+                    return_value=[True, 0, False, ()],
                 ):
                     client = CascadeSplitsClient(
                         rpc_url="https://sepolia.base.org",
@@ -230,7 +378,7 @@ class TestSyncClientExecuteSplitValidation:
                         chain_id=84532,
                     )
 
-                    result = client.execute_split("0xValidSplit")
+                    result = client.execute_split("0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7")
 
                     assert result.status == "SKIPPED"
                     assert result.reason == "no_pending_funds"
@@ -243,20 +391,15 @@ class TestSyncClientExecuteSplitValidation:
             mock_web3_class.HTTPProvider.return_value = MagicMock()
             mock_web3_class.to_checksum_address = lambda x: x
 
-            # Mock is_cascade_split to return True, with low balance
-            mock_contract = MagicMock()
-            mock_contract.functions.isCascadeSplitConfig.return_value.call.return_value = True
-            mock_contract.functions.getBalance.return_value.call.return_value = 1_000_000  # 1 USDC
-            mock_w3.eth.contract.return_value = mock_contract
-
             with patch("cascade_splits_evm.client.Account") as mock_account_class:
                 mock_account = MagicMock()
                 mock_account.address = "0x1234567890123456789012345678901234567890"
                 mock_account_class.from_key.return_value = mock_account
 
+                # Batched pre-flight: valid split with low balance (1 USDC)
                 with patch(
-                    "cascade_splits_evm.helpers.Web3.to_checksum_address",
-                    side_effect=lambda x: x,
+                    "cascade_splits_evm.client._read_split_views",
+                    return_value=[True, 1_000_000, True, ()],
                 ):
                     client = CascadeSplitsClient(
                         rpc_url="https://sepolia.base.org",
@@ -265,9 +408,244 @@ class TestSyncClientExecuteSplitValidation:
                     )
 
                     result = client.execute_split(
-                        "0xValidSplit",
+                        "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7",
                         min_balance=10_000_000,  # 10 USDC threshold
                     )
 
                     assert result.status == "SKIPPED"
                     assert result.reason == "below_threshold"
+
+    def test_sync_execute_returns_preview_from_preflight_read(self) -> None:
+        """return_preview should read previewExecution in the pre-check round-trip and attach it."""
+        client = CascadeSplitsClient(
+            rpc_url="https://sepolia.base.org",
+            private_key="0x" + "ab" * 32,
+            chain_id=84532,
+        )
+        preview = ([990_000, 990_000], 20_000, 2_000_000, [0, 0], 0)
+
+        with patch(
+            "cascade_splits_evm.client._read_split_views",
+            return_value=[True, 2_000_000, True, preview, ()],
+        ) as mock_read:
+            result = client.execute_split(
+                "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7", min_balance=10_000_000, return_preview=True
+            )
+
+        assert (result.status, result.reason) == ("SKIPPED", "below_threshold")
+        assert result.preview is not None
+        assert (result.preview.recipient_amounts, result.preview.available) == ([990_000, 990_000], 2_000_000)
+        assert mock_read.call_count == 1
+        assert mock_read.call_args.args[2][-2:] == ("previewExecution", "executeSplit")
+
+    def test_sync_execute_remembers_split_check(self) -> None:
+        """Repeat executions should drop isCascadeSplitConfig from the pre-flight batch."""
+        with patch("cascade_splits_evm.client.Account") as mock_account_class:
+            mock_account_class.from_key.return_value.address = "0x1234567890123456789012345678901234567890"
+
+            client = CascadeSplitsClient(
+                rpc_url="https://sepolia.base.org",
+                private_key="0x" + "ab" * 32,
+                chain_id=84532,
+            )
+
+        split = "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"
+        with patch(
+            "cascade_splits_evm.client._read_split_views", side_effect=[[True, 0, False, ()], [0, False, ()]]
+        ) as mock_read:
+            client.execute_split(split)
+            result = client.execute_split(split)
+
+        assert result.reason == "no_pending_funds"
+        assert [len(call.args[2]) for call in mock_read.call_args_list] == [4, 3]
+
+
+class TestSyncClientSplitSnapshot:
+    """Tests for sync client snapshots and the split cache."""
+
+    def test_failed_split_check_is_not_cached(self) -> None:
+        """A snapshot whose split check failed should leave the split cache untouched."""
+        with patch("cascade_splits_evm.client.Account") as mock_account_class:
+            mock_account_class.from_key.return_value.address = ALICE
+            client = CascadeSplitsClient(
+                rpc_url="https://sepolia.base.org", private_key="0x" + "ab" * 32, chain_id=84532
+            )
+
+        with patch("cascade_splits_evm.client._get_split_snapshot", return_value=SplitSnapshot(is_split=None)):
+            snapshot = client.get_split_snapshot(EXISTING_SPLIT)
+
+        assert snapshot.is_split is None
+        assert client._splits.get(EXISTING_SPLIT) is None
+
+
+class TestSyncClientPredictSplitAddress:
+    """Tests for sync client split address prediction."""
+
+    def _client(self, factory_address: str | None = None) -> CascadeSplitsClient:
+        with patch("cascade_splits_evm.client.Account") as mock_account_class:
+            mock_account_class.from_key.return_value.address = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+            return CascadeSplitsClient(
+                rpc_url="https://sepolia.base.org",
+                private_key="0x" + "ab" * 32,
+                chain_id=84532,
+                factory_address=factory_address,
+            )
+
+    def test_implementation_is_read_once_then_computed_locally(self) -> None:
+        """Every factory's implementation is read on the first prediction only."""
+        recipients = [Recipient(address="0x70997970C51812dc3A010C7d01b50e0d17dc79C8", share=100)]
+        implementation = IMPLEMENTATION
+
+        for factory_address in (None, "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"):
+            client = self._client(factory_address)
+            client.w3.eth.call = MagicMock(return_value=encode(["address"], [implementation]))
+
+            predicted = client.predict_split_address(b"test-id", recipients)
+
+            assert predicted == client.predict_split_address(b"test-id", recipients)
+            assert predicted == compute_split_address(
+                client.factory_address,
+                implementation,
+                client.account.address,
+                client.default_token,
+                b"test-id".ljust(32, b"\x00"),
+                to_evm_recipients(recipients),
+            )
+            client.w3.eth.call.assert_called_once()
+
+    def test_upgraded_implementation_changes_prediction(self) -> None:
+        """After a factory upgrade, predictions use the new currentImplementation, not the constant."""
+        recipients = [Recipient(address="0x70997970C51812dc3A010C7d01b50e0d17dc79C8", share=100)]
+        upgraded = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+        client = self._client()
+        client.w3.eth.call = MagicMock(return_value=encode(["address"], [upgraded]))
+
+        predicted = client.predict_split_address(b"test-id", recipients)
+
+        expected = [
+            compute_split_address(
+                client.factory_address,
+                implementation,
+                client.account.address,
+                client.default_token,
+                b"test-id".ljust(32, b"\x00"),
+                to_evm_recipients(recipients),
+            )
+            for implementation in (upgraded, IMPLEMENTATION)
+        ]
+        assert predicted == expected[0]
+        assert predicted != expected[1]
+
+    def test_oversize_unique_id_is_rejected(self) -> None:
+        """A unique_id over 32 bytes should raise instead of being truncated."""
+        with patch("cascade_splits_evm.client.Account") as mock_account_class:
+            mock_account_class.from_key.return_value.address = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+
+            client = CascadeSplitsClient(
+                rpc_url="https://sepolia.base.org",
+                private_key="0x" + "ab" * 32,
+                chain_id=84532,
+            )
+
+        with pytest.raises(ValueError, match="32 bytes"):
+            client.predict_split_address(b"x" * 33, [Recipient(address="0xAlice", share=100)])
+
+
+class TestSyncClientEnsureSplits:
+    """Tests for the sync client's pipelined bulk ensure."""
+
+    GAS = GasOptions(max_fee_per_gas=2_000_000_000, max_priority_fee_per_gas=1_000_000)
+
+    def _params(self, unique_id: bytes) -> EnsureParams:
+        return EnsureParams(unique_id=unique_id, recipients=[Recipient(address=ALICE, share=100)], gas=self.GAS)
+
+    def test_simulates_in_a_batch_then_sends_and_waits(self) -> None:
+        """Simulations should go out as one batch, then sends with consecutive nonces."""
+        client = _create_bulk_client(
+            [
+                {"jsonrpc": "2.0", "id": 0, "result": "0x" + "11" * 32},
+                {"jsonrpc": "2.0", "id": 1, "result": "0x" + "22" * 32},
+            ]
+        )
+
+        results = client.ensure_splits([self._params(b"a"), self._params(b"exists"), self._params(b"b")])
+
+        assert [r.status for r in results] == ["CREATED", "NO_CHANGE", "CREATED"]
+        assert results[0].split == ALICE
+        assert results[1].split == EXISTING_SPLIT
+        assert results[2].signature == "22" * 32
+        (simulations,), _ = client.w3.provider.make_batch_request.call_args
+        assert [method for method, _ in simulations] == ["eth_call"] * 3
+        assert _sent_nonces(client) == [5, 6]
+        client.w3.eth.get_transaction_count.assert_called_once()
+        assert client.w3.eth.wait_for_transaction_receipt.call_count == 2
+
+    def test_known_split_needs_no_rpc(self) -> None:
+        """A split the client has already seen deployed should be NO_CHANGE without any further RPC."""
+        client = _create_bulk_client([{"jsonrpc": "2.0", "id": 0, "result": "0x" + "11" * 32}])
+        params = self._params(b"a")
+
+        client.w3.eth.call.return_value = encode(["address"], [IMPLEMENTATION])
+
+        first = client.ensure_splits([params])
+        client._splits.set(client.predict_split_address(params.unique_id, params.recipients), True)
+        client.w3.reset_mock()
+        second = client.ensure_split(params.unique_id, params.recipients, gas=params.gas)
+
+        assert first[0].status == "CREATED"
+        assert client._splits.get(first[0].split) is True
+        assert second.status == "NO_CHANGE"
+        assert second.split == client.predict_split_address(params.unique_id, params.recipients)
+        client.w3.provider.make_batch_request.assert_not_called()
+        client.w3.eth.call.assert_not_called()
+
+    def test_batches_respect_batch_size(self) -> None:
+        """No JSON-RPC batch should exceed the client's batch_size."""
+        client = _create_bulk_client(
+            [
+                {"jsonrpc": "2.0", "id": 0, "result": "0x" + "11" * 32},
+                {"jsonrpc": "2.0", "id": 1, "result": "0x" + "22" * 32},
+            ]
+        )
+        client._batch_size = 2
+
+        results = client.ensure_splits([self._params(bytes([i])) for i in range(5)])
+
+        assert [r.status for r in results] == ["CREATED"] * 5
+        sizes = [len(call.args[0]) for call in client.w3.provider.make_batch_request.call_args_list]
+        assert sizes == [2, 2, 1]
+
+    def test_rejected_send_fails_item_and_resyncs_nonce(self) -> None:
+        """A rejected send should fail only that item and reset the local nonce."""
+        client = _create_bulk_client(
+            [
+                {"jsonrpc": "2.0", "id": 0, "error": {"code": -32000, "message": "insufficient funds for gas"}},
+                {"jsonrpc": "2.0", "id": 1, "result": "0x" + "22" * 32},
+            ]
+        )
+
+        results = client.ensure_splits([self._params(b"a"), self._params(b"b")])
+
+        assert results[0].status == "FAILED"
+        assert results[0].reason == "insufficient_gas"
+        assert results[1].status == "CREATED"
+        assert client._nonces._nonce == 6
+
+    def test_rejection_mid_batch_resigns_later_items(self) -> None:
+        """Items after a rejected send are signed with the resynced nonce, leaving no nonce gap."""
+        client = _create_bulk_client(
+            [
+                {"jsonrpc": "2.0", "id": 0, "result": "0x" + "11" * 32},
+                {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "insufficient funds for gas"}},
+                {"jsonrpc": "2.0", "id": 2, "result": "0x" + "33" * 32},
+            ]
+        )
+        # Pending nonce before the sends, then after the rejection resync
+        client.w3.eth.get_transaction_count.side_effect = [5, 6]
+
+        results = client.ensure_splits([self._params(b"a"), self._params(b"b"), self._params(b"c")])
+
+        assert [r.status for r in results] == ["CREATED", "FAILED", "CREATED"]
+        assert results[2].signature == "33" * 32
+        assert _sent_nonces(client) == [5, 6, 6]
+        assert client.w3.eth.wait_for_transaction_receipt.call_count == 2
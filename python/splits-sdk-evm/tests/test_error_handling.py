@@ -7,11 +7,18 @@ so clients can implement appropriate retry logic.
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from web3.exceptions import ContractLogicError, Web3Exception
+from conftest import aggregate3_result
+from eth_abi import encode
+from web3 import Web3
+from web3.exceptions import ContractCustomError, ContractLogicError, Web3Exception, Web3RPCError
 
-from cascade_splits_evm import EnsureParams, Recipient
+from cascade_splits_evm import EnsureParams, EnsureResult, ExecuteOptions, ExecuteResult, Recipient
 from cascade_splits_evm.ensure import ensure_split
 from cascade_splits_evm.execute import execute_split
+from cascade_splits_evm.helpers import _failure_result, classify_web3_error
+
+SPLIT_ADDRESS = "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"
+FACTORY_ADDRESS = "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"
 
 
 class _AsyncChainId:
@@ -27,12 +34,17 @@ class _AsyncChainId:
         return _coro().__await__()
 
 
+# isCascadeSplitConfig, getBalance, hasPendingFunds for a split ready to execute
+PRECHECKS_PASS = aggregate3_result(encode(["bool"], [True]), encode(["uint256"], [1]), encode(["bool"], [True]), b"")
+
+
 def _create_mock_w3(chain_id: int = 8453):
     """Create a mock AsyncWeb3 instance with proper async chain_id."""
     mock_w3 = MagicMock()
     # Create a mock eth that has chain_id as an awaitable
     mock_eth = MagicMock()
     mock_eth.chain_id = _AsyncChainId(chain_id)
+    mock_eth.get_transaction_count = AsyncMock(return_value=0)
     mock_w3.eth = mock_eth
     return mock_w3
 
@@ -49,19 +61,19 @@ class TestEnsureSplitErrorHandling:
 
         # Mock factory contract to raise ContractLogicError
         mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.return_value.call = AsyncMock(
+        mock_factory.functions.createSplitConfig.return_value.call = AsyncMock(
             side_effect=ContractLogicError("execution reverted: InvalidRecipientCount")
         )
-        mock_w3.eth.contract.return_value = mock_factory
+        mock_w3.eth.contract.return_value.return_value = mock_factory
 
         with patch(
-            "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+            "cascade_splits_evm.ensure._to_checksum_address",
             side_effect=lambda x: x,
         ):
             result = await ensure_split(
                 mock_w3,
                 mock_account,
-                "0xFactory",
+                FACTORY_ADDRESS,
                 EnsureParams(
                     unique_id=b"test-id".ljust(32, b"\x00"),
                     recipients=[
@@ -76,6 +88,44 @@ class TestEnsureSplitErrorHandling:
         assert result.message is not None
         assert "InvalidRecipientCount" in result.message
 
+    @pytest.mark.asyncio
+    async def test_split_already_exists_revert_returns_no_change(self) -> None:
+        """SplitAlreadyExists(split) from the create simulation should map to NO_CHANGE."""
+        mock_w3 = _create_mock_w3()
+        mock_account = MagicMock()
+        mock_account.address = "0x1234567890123456789012345678901234567890"
+
+        existing = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+        selector = Web3.keccak(text="SplitAlreadyExists(address)")[:4]
+        revert_data = "0x" + (selector + encode(["address"], [existing])).hex()
+
+        mock_factory = MagicMock()
+        mock_factory.functions.createSplitConfig.return_value.call = AsyncMock(
+            side_effect=ContractCustomError(revert_data, data=revert_data)
+        )
+        mock_w3.eth.contract.return_value.return_value = mock_factory
+
+        with patch(
+            "cascade_splits_evm.ensure._to_checksum_address",
+            side_effect=lambda x: x,
+        ):
+            result = await ensure_split(
+                mock_w3,
+                mock_account,
+                FACTORY_ADDRESS,
+                EnsureParams(
+                    unique_id=b"test-id".ljust(32, b"\x00"),
+                    recipients=[
+                        Recipient(address="0xAlice", share=60),
+                        Recipient(address="0xBob", share=40),
+                    ],
+                ),
+            )
+
+        assert result.status == "NO_CHANGE"
+        assert result.split == existing
+        mock_factory.functions.createSplitConfig.return_value.build_transaction.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_web3_rejected_error_returns_wallet_rejected(self) -> None:
         """Web3Exception with 'rejected' should map to reason='wallet_rejected'."""
@@ -84,19 +134,19 @@ class TestEnsureSplitErrorHandling:
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
         mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.return_value.call = AsyncMock(
+        mock_factory.functions.createSplitConfig.return_value.call = AsyncMock(
             side_effect=Web3Exception("Transaction rejected by user")
         )
-        mock_w3.eth.contract.return_value = mock_factory
+        mock_w3.eth.contract.return_value.return_value = mock_factory
 
         with patch(
-            "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+            "cascade_splits_evm.ensure._to_checksum_address",
             side_effect=lambda x: x,
         ):
             result = await ensure_split(
                 mock_w3,
                 mock_account,
-                "0xFactory",
+                FACTORY_ADDRESS,
                 EnsureParams(
                     unique_id=b"test-id".ljust(32, b"\x00"),
                     recipients=[
@@ -117,19 +167,19 @@ class TestEnsureSplitErrorHandling:
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
         mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.return_value.call = AsyncMock(
+        mock_factory.functions.createSplitConfig.return_value.call = AsyncMock(
             side_effect=Web3Exception("User denied transaction signature")
         )
-        mock_w3.eth.contract.return_value = mock_factory
+        mock_w3.eth.contract.return_value.return_value = mock_factory
 
         with patch(
-            "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+            "cascade_splits_evm.ensure._to_checksum_address",
             side_effect=lambda x: x,
         ):
             result = await ensure_split(
                 mock_w3,
                 mock_account,
-                "0xFactory",
+                FACTORY_ADDRESS,
                 EnsureParams(
                     unique_id=b"test-id".ljust(32, b"\x00"),
                     recipients=[
@@ -150,19 +200,19 @@ class TestEnsureSplitErrorHandling:
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
         mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.return_value.call = AsyncMock(
+        mock_factory.functions.createSplitConfig.return_value.call = AsyncMock(
             side_effect=Web3Exception("insufficient gas for transaction")
         )
-        mock_w3.eth.contract.return_value = mock_factory
+        mock_w3.eth.contract.return_value.return_value = mock_factory
 
         with patch(
-            "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+            "cascade_splits_evm.ensure._to_checksum_address",
             side_effect=lambda x: x,
         ):
             result = await ensure_split(
                 mock_w3,
                 mock_account,
-                "0xFactory",
+                FACTORY_ADDRESS,
                 EnsureParams(
                     unique_id=b"test-id".ljust(32, b"\x00"),
                     recipients=[
@@ -183,19 +233,19 @@ class TestEnsureSplitErrorHandling:
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
         mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.return_value.call = AsyncMock(
+        mock_factory.functions.createSplitConfig.return_value.call = AsyncMock(
             side_effect=Web3Exception("insufficient funds for transfer")
         )
-        mock_w3.eth.contract.return_value = mock_factory
+        mock_w3.eth.contract.return_value.return_value = mock_factory
 
         with patch(
-            "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+            "cascade_splits_evm.ensure._to_checksum_address",
             side_effect=lambda x: x,
         ):
             result = await ensure_split(
                 mock_w3,
                 mock_account,
-                "0xFactory",
+                FACTORY_ADDRESS,
                 EnsureParams(
                     unique_id=b"test-id".ljust(32, b"\x00"),
                     recipients=[
@@ -216,19 +266,19 @@ class TestEnsureSplitErrorHandling:
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
         mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.return_value.call = AsyncMock(
+        mock_factory.functions.createSplitConfig.return_value.call = AsyncMock(
             side_effect=Web3Exception("Unknown network error")
         )
-        mock_w3.eth.contract.return_value = mock_factory
+        mock_w3.eth.contract.return_value.return_value = mock_factory
 
         with patch(
-            "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+            "cascade_splits_evm.ensure._to_checksum_address",
             side_effect=lambda x: x,
         ):
             result = await ensure_split(
                 mock_w3,
                 mock_account,
-                "0xFactory",
+                FACTORY_ADDRESS,
                 EnsureParams(
                     unique_id=b"test-id".ljust(32, b"\x00"),
                     recipients=[
@@ -249,19 +299,19 @@ class TestEnsureSplitErrorHandling:
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
         mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.return_value.call = AsyncMock(
+        mock_factory.functions.createSplitConfig.return_value.call = AsyncMock(
             side_effect=RuntimeError("Unexpected error")
         )
-        mock_w3.eth.contract.return_value = mock_factory
+        mock_w3.eth.contract.return_value.return_value = mock_factory
 
         with patch(
-            "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+            "cascade_splits_evm.ensure._to_checksum_address",
             side_effect=lambda x: x,
         ):
             result = await ensure_split(
                 mock_w3,
                 mock_account,
-                "0xFactory",
+                FACTORY_ADDRESS,
                 EnsureParams(
                     unique_id=b"test-id".ljust(32, b"\x00"),
                     recipients=[
@@ -288,29 +338,28 @@ class TestExecuteSplitErrorHandling:
         mock_account = MagicMock()
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
-        # Mock is_cascade_split to return True
+        # Prechecks are one Multicall3 read: a split with a balance and pending funds
+        mock_w3.eth.call = AsyncMock(return_value=PRECHECKS_PASS)
         mock_contract = MagicMock()
-        mock_contract.functions.isCascadeSplitConfig.return_value.call = AsyncMock(return_value=True)
-        mock_contract.functions.hasPendingFunds.return_value.call = AsyncMock(return_value=True)
         mock_contract.functions.executeSplit.return_value.build_transaction = AsyncMock(
             side_effect=ContractLogicError("execution reverted: NoPendingFunds")
         )
-        mock_w3.eth.contract.return_value = mock_contract
+        mock_w3.eth.contract.return_value.return_value = mock_contract
 
         with (
             patch(
-                "cascade_splits_evm.execute.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.execute._to_checksum_address",
                 side_effect=lambda x: x,
             ),
             patch(
-                "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.async_helpers._to_checksum_address",
                 side_effect=lambda x: x,
             ),
         ):
             result = await execute_split(
                 mock_w3,
                 mock_account,
-                "0xSplit",
+                SPLIT_ADDRESS,
             )
 
         assert result.status == "FAILED"
@@ -324,28 +373,28 @@ class TestExecuteSplitErrorHandling:
         mock_account = MagicMock()
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
+        # Prechecks are one Multicall3 read: a split with a balance and pending funds
+        mock_w3.eth.call = AsyncMock(return_value=PRECHECKS_PASS)
         mock_contract = MagicMock()
-        mock_contract.functions.isCascadeSplitConfig.return_value.call = AsyncMock(return_value=True)
-        mock_contract.functions.hasPendingFunds.return_value.call = AsyncMock(return_value=True)
         mock_contract.functions.executeSplit.return_value.build_transaction = AsyncMock(
             side_effect=Web3Exception("Transaction rejected")
         )
-        mock_w3.eth.contract.return_value = mock_contract
+        mock_w3.eth.contract.return_value.return_value = mock_contract
 
         with (
             patch(
-                "cascade_splits_evm.execute.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.execute._to_checksum_address",
                 side_effect=lambda x: x,
             ),
             patch(
-                "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.async_helpers._to_checksum_address",
                 side_effect=lambda x: x,
             ),
         ):
             result = await execute_split(
                 mock_w3,
                 mock_account,
-                "0xSplit",
+                SPLIT_ADDRESS,
             )
 
         assert result.status == "FAILED"
@@ -359,28 +408,28 @@ class TestExecuteSplitErrorHandling:
         mock_account = MagicMock()
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
+        # Prechecks are one Multicall3 read: a split with a balance and pending funds
+        mock_w3.eth.call = AsyncMock(return_value=PRECHECKS_PASS)
         mock_contract = MagicMock()
-        mock_contract.functions.isCascadeSplitConfig.return_value.call = AsyncMock(return_value=True)
-        mock_contract.functions.hasPendingFunds.return_value.call = AsyncMock(return_value=True)
         mock_contract.functions.executeSplit.return_value.build_transaction = AsyncMock(
             side_effect=Web3Exception("out of gas")
         )
-        mock_w3.eth.contract.return_value = mock_contract
+        mock_w3.eth.contract.return_value.return_value = mock_contract
 
         with (
             patch(
-                "cascade_splits_evm.execute.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.execute._to_checksum_address",
                 side_effect=lambda x: x,
             ),
             patch(
-                "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.async_helpers._to_checksum_address",
                 side_effect=lambda x: x,
             ),
         ):
             result = await execute_split(
                 mock_w3,
                 mock_account,
-                "0xSplit",
+                SPLIT_ADDRESS,
             )
 
         assert result.status == "FAILED"
@@ -394,31 +443,149 @@ class TestExecuteSplitErrorHandling:
         mock_account = MagicMock()
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
+        # Prechecks are one Multicall3 read: a split with a balance and pending funds
+        mock_w3.eth.call = AsyncMock(return_value=PRECHECKS_PASS)
         mock_contract = MagicMock()
-        mock_contract.functions.isCascadeSplitConfig.return_value.call = AsyncMock(return_value=True)
-        mock_contract.functions.hasPendingFunds.return_value.call = AsyncMock(return_value=True)
         mock_contract.functions.executeSplit.return_value.build_transaction = AsyncMock(
             side_effect=RuntimeError("Connection lost")
         )
-        mock_w3.eth.contract.return_value = mock_contract
+        mock_w3.eth.contract.return_value.return_value = mock_contract
 
         with (
             patch(
-                "cascade_splits_evm.execute.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.execute._to_checksum_address",
                 side_effect=lambda x: x,
             ),
             patch(
-                "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.async_helpers._to_checksum_address",
                 side_effect=lambda x: x,
             ),
         ):
             result = await execute_split(
                 mock_w3,
                 mock_account,
-                "0xSplit",
+                SPLIT_ADDRESS,
             )
 
         assert result.status == "FAILED"
         assert result.reason == "transaction_failed"
         assert result.message is not None
         assert "Connection lost" in result.message
+
+    @pytest.mark.asyncio
+    async def test_precheck_reads_failing_on_non_split_returns_not_a_split(self) -> None:
+        """Precheck reads that revert on a non-split should still map to not_a_split."""
+        mock_w3 = _create_mock_w3()
+        mock_account = MagicMock()
+        mock_w3.eth.call = AsyncMock(return_value=aggregate3_result(encode(["bool"], [False]), None, None, None))
+
+        result = await execute_split(mock_w3, mock_account, SPLIT_ADDRESS, ExecuteOptions(min_balance=1))
+
+        assert result.status == "SKIPPED"
+        assert result.reason == "not_a_split"
+        mock_w3.eth.call.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_simulated_revert_fails_without_sending(self) -> None:
+        """An executeSplit that reverts in the precheck simulation should not be sent."""
+        mock_w3 = _create_mock_w3()
+        mock_account = MagicMock()
+        mock_w3.eth.call = AsyncMock(
+            return_value=aggregate3_result(
+                encode(["bool"], [True]), encode(["uint256"], [1]), encode(["bool"], [True]), None
+            )
+        )
+        mock_w3.eth.send_raw_transaction = AsyncMock()
+
+        result = await execute_split(mock_w3, mock_account, SPLIT_ADDRESS)
+
+        assert result.status == "FAILED"
+        assert result.reason == "transaction_reverted"
+        mock_w3.eth.send_raw_transaction.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("failed", ["balance", "pending"])
+    async def test_failed_balance_or_pending_read_fails_instead_of_skipping(self, failed: str) -> None:
+        """A balance or pending-funds sub-call that fails should be FAILED, not a below_threshold/no_pending skip."""
+        mock_w3 = _create_mock_w3()
+        mock_account = MagicMock()
+        balance = None if failed == "balance" else encode(["uint256"], [1])
+        pending = None if failed == "pending" else encode(["bool"], [True])
+        mock_w3.eth.call = AsyncMock(
+            return_value=aggregate3_result(encode(["bool"], [True]), balance, pending, encode(["bool"], [True]))
+        )
+        mock_w3.eth.send_raw_transaction = AsyncMock()
+
+        result = await execute_split(mock_w3, mock_account, SPLIT_ADDRESS, ExecuteOptions(min_balance=1))
+
+        assert result.status == "FAILED"
+        assert result.reason == "transaction_failed"
+        mock_w3.eth.send_raw_transaction.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_precheck_read_error_is_classified(self) -> None:
+        """A failed precheck read should surface as FAILED."""
+        mock_w3 = _create_mock_w3()
+        mock_account = MagicMock()
+
+        mock_w3.eth.call = AsyncMock(side_effect=RuntimeError("Connection lost"))
+
+        result = await execute_split(mock_w3, mock_account, SPLIT_ADDRESS)
+
+        assert result.status == "FAILED"
+        assert result.reason == "transaction_failed"
+
+
+class TestClassifyWeb3Error:
+    """Tests for mapping Web3Exception messages to failure reasons."""
+
+    @pytest.mark.parametrize(
+        ("message", "reason"),
+        [
+            ("User denied transaction signature", "wallet_rejected"),
+            ("execution reverted: SplitAlreadyExists", "transaction_reverted"),
+            ("INSUFFICIENT funds for gas * price + value", "insufficient_gas"),
+            ("connection reset by peer", "transaction_failed"),
+        ],
+    )
+    def test_reason_from_message(self, message: str, reason: str) -> None:
+        """Keywords are matched case-insensitively in a single scan."""
+        result = classify_web3_error(Web3Exception(message), ExecuteResult)
+
+        assert result.status == "FAILED"
+        assert result.reason == reason
+
+    def test_reason_from_rpc_error_code(self) -> None:
+        """Known JSON-RPC error codes decide the reason, whatever the message says."""
+        rejected = Web3RPCError("gas too low", rpc_response={"error": {"code": 4001, "message": "gas too low"}})
+        reverted = Web3RPCError("insufficient", rpc_response={"error": {"code": 3, "message": "insufficient"}})
+        other = Web3RPCError("gas too low", rpc_response={"error": {"code": -32000, "message": "gas too low"}})
+
+        assert classify_web3_error(rejected, EnsureResult).reason == "wallet_rejected"
+        assert classify_web3_error(reverted, EnsureResult).reason == "transaction_reverted"
+        assert classify_web3_error(other, EnsureResult).reason == "insufficient_gas"
+
+    def test_rejected_message_is_normalized(self) -> None:
+        """Wallet rejections use a fixed message; other failures keep the original."""
+        rejected = classify_web3_error(Web3Exception("request rejected by wallet"), EnsureResult)
+        failed = classify_web3_error(Web3Exception("connection reset by peer"), EnsureResult)
+
+        assert rejected.message == "Transaction rejected"
+        assert failed.message == "connection reset by peer"
+
+    @pytest.mark.parametrize(
+        ("error", "reason"),
+        [
+            (ContractLogicError("execution reverted"), "transaction_reverted"),
+            (Web3Exception("insufficient funds for gas"), "insufficient_gas"),
+            (RuntimeError("Connection lost"), "transaction_failed"),
+        ],
+    )
+    def test_failure_result_for_any_error(self, error: Exception, reason: str) -> None:
+        """Reverts, Web3 errors and unexpected errors share one mapping for both result types."""
+        for result_class in (EnsureResult, ExecuteResult):
+            result = _failure_result(error, result_class)
+
+            assert isinstance(result, result_class)
+            assert result.status == "FAILED"
+            assert result.reason == reason
@@ -0,0 +1,106 @@
+"""Tests for cached EIP-1559 fee estimates.
+
+These tests verify that fees are derived from one eth_feeHistory call,
+reused until the cache expires, and used when building transactions.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from cascade_splits_evm import AsyncFeeCache, FeeCache, GasOptions
+from cascade_splits_evm.async_helpers import build_tx_params as async_build_tx_params
+from cascade_splits_evm.fees import fees_from_history
+from cascade_splits_evm.helpers import build_tx_params
+
+SENDER = "0x1234567890123456789012345678901234567890"
+
+FEE_HISTORY = {
+    "oldestBlock": 100,
+    "baseFeePerGas": [10, 11, 12, 13, 14, 15],
+    "gasUsedRatio": [0.5] * 5,
+    "reward": [[1], [3], [2], [5], [4]],
+}
+
+
+class TestFeesFromHistory:
+    """Tests for deriving fees from eth_feeHistory."""
+
+    def test_uses_next_base_fee_and_median_tip(self) -> None:
+        """Max fee should cover a doubled next base fee plus the median tip."""
+        assert fees_from_history(FEE_HISTORY) == (2 * 15 + 3, 3)
+
+    def test_even_median_stays_exact(self) -> None:
+        """Averaging the middle tips should use integer math, without float rounding."""
+        tip = 10**18 + 1
+        history = {**FEE_HISTORY, "reward": [[tip], [tip + 2]]}
+
+        assert fees_from_history(history) == (30 + tip + 1, tip + 1)
+
+    def test_missing_rewards_means_zero_tip(self) -> None:
+        """Nodes may omit rewards; the tip then falls back to zero."""
+        history = {**FEE_HISTORY, "reward": []}
+
+        assert fees_from_history(history) == (30, 0)
+
+
+class TestFeeCache:
+    """Tests for the sync FeeCache."""
+
+    def test_fee_history_fetched_once_within_ttl(self) -> None:
+        """Repeated lookups inside the TTL should reuse the first result."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.fee_history.return_value = FEE_HISTORY
+
+        fees = FeeCache(mock_w3)
+
+        assert fees.fees() == fees.fees() == (33, 3)
+        mock_w3.eth.fee_history.assert_called_once_with(5, "latest", [50])
+
+    def test_refreshes_after_ttl(self) -> None:
+        """Stale estimates should be refetched."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.fee_history.return_value = FEE_HISTORY
+
+        fees = FeeCache(mock_w3)
+        with patch("cascade_splits_evm.fees.time.monotonic", side_effect=[100.0, 200.0, 200.0]):
+            fees.fees()
+            fees.fees()
+
+        assert mock_w3.eth.fee_history.call_count == 2
+
+    def test_build_tx_params_uses_cached_fees(self) -> None:
+        """Without explicit fees, transactions should be type 2 with cached fees."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.fee_history.return_value = FEE_HISTORY
+
+        tx = build_tx_params(mock_w3, SENDER, 8453, 300_000, nonce=0, fees=FeeCache(mock_w3))
+
+        assert tx["type"] == "0x2"
+        assert tx["maxFeePerGas"] == 33
+        assert tx["maxPriorityFeePerGas"] == 3
+
+    def test_explicit_fees_skip_the_cache(self) -> None:
+        """GasOptions fees should take precedence without a fee_history call."""
+        mock_w3 = MagicMock()
+        gas = GasOptions(max_fee_per_gas=100, max_priority_fee_per_gas=7)
+
+        tx = build_tx_params(mock_w3, SENDER, 8453, 300_000, gas_options=gas, nonce=0, fees=FeeCache(mock_w3))
+
+        assert tx["maxFeePerGas"] == 100
+        assert tx["maxPriorityFeePerGas"] == 7
+        mock_w3.eth.fee_history.assert_not_called()
+
+
+class TestAsyncFeeCache:
+    """Tests for the AsyncFeeCache."""
+
+    async def test_build_tx_params_uses_cached_fees(self) -> None:
+        """Async builds should share one fee_history call."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.fee_history = AsyncMock(return_value=FEE_HISTORY)
+        fees = AsyncFeeCache(mock_w3)
+
+        first = await async_build_tx_params(mock_w3, SENDER, 8453, 300_000, nonce=0, fees=fees)
+        second = await async_build_tx_params(mock_w3, SENDER, 8453, 300_000, nonce=1, fees=fees)
+
+        assert first["maxFeePerGas"] == second["maxFeePerGas"] == 33
+        mock_w3.eth.fee_history.assert_awaited_once()
@@ -4,6 +4,7 @@ These tests verify that gas configuration is handled correctly to prevent
 stuck/failed transactions or overpaying on mainnet.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -14,6 +15,8 @@ from cascade_splits_evm.async_helpers import (
     DEFAULT_PRIORITY_FEE,
     build_tx_params,
 )
+from cascade_splits_evm.constants import MAX_RECIPIENTS
+from cascade_splits_evm.helpers import compute_optimistic_gas
 from cascade_splits_evm.types import GasOptions
 
 
@@ -165,7 +168,7 @@ class TestGasEstimation:
             contract_call=mock_contract_call,
         )
 
-        # 100_000 * 1.2 = 120_000
+        # 100_000 * 120 // 100 = 120_000
         assert params["gas"] == 120_000
         mock_contract_call.estimate_gas.assert_called_once_with({"from": "0xSender"})
 
@@ -187,10 +190,30 @@ class TestGasEstimation:
             contract_call=mock_contract_call,
         )
 
-        # 123_456 * 1.2 = 148147.2, should be int
+        # 123_456 * 120 // 100 = 148_147 (integer math, rounded down)
         assert params["gas"] == 148147
         assert isinstance(params["gas"], int)
 
+    @pytest.mark.asyncio
+    async def test_gas_buffer_is_exact_for_large_estimates(self) -> None:
+        """The buffer should not lose precision beyond float range (2**53)."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count = AsyncMock(return_value=0)
+
+        mock_contract_call = MagicMock()
+        mock_contract_call.estimate_gas = AsyncMock(return_value=2**60 + 5)
+
+        params = await build_tx_params(
+            mock_w3,
+            "0xSender",
+            8453,
+            DEFAULT_GAS_CREATE,
+            gas_options=GasOptions(estimate_gas=True),
+            contract_call=mock_contract_call,
+        )
+
+        assert params["gas"] == (2**60 + 5) * 6 // 5
+
     @pytest.mark.asyncio
     async def test_estimation_requires_contract_call(self) -> None:
         """Should use default gas if estimate_gas=True but no contract_call."""
@@ -209,6 +232,105 @@ class TestGasEstimation:
         # Falls back to default
         assert params["gas"] == DEFAULT_GAS_CREATE
 
+    @pytest.mark.asyncio
+    async def test_known_calls_skip_estimation(self) -> None:
+        """createSplitConfig / executeSplit gas should be precomputed, without an RPC."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count = AsyncMock(return_value=0)
+
+        create_call = MagicMock(fn_name="createSplitConfig", args=("0xA", "0xT", b"", [("0xR", 9900)] * 2))
+        execute_call = MagicMock(fn_name="executeSplit", args=())
+        for call in (create_call, execute_call):
+            call.estimate_gas = AsyncMock()
+
+        create = await build_tx_params(
+            mock_w3,
+            "0xSender",
+            8453,
+            DEFAULT_GAS_CREATE,
+            gas_options=GasOptions(estimate_gas=True),
+            contract_call=create_call,
+        )
+        execute = await build_tx_params(
+            mock_w3,
+            "0xSender",
+            8453,
+            DEFAULT_GAS_EXECUTE,
+            gas_options=GasOptions(estimate_gas=True, gas_buffer_percent=0),
+            contract_call=execute_call,
+        )
+
+        assert create["gas"] == compute_optimistic_gas("createSplitConfig", 2) * 6 // 5
+        # The split's recipient count is unknown, so executeSplit is bounded by the maximum
+        assert execute["gas"] == compute_optimistic_gas("executeSplit", MAX_RECIPIENTS)
+        create_call.estimate_gas.assert_not_called()
+        execute_call.estimate_gas.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_force_estimate_gas(self) -> None:
+        """force_estimate_gas should simulate even known calls."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count = AsyncMock(return_value=0)
+
+        mock_contract_call = MagicMock(fn_name="executeSplit", args=())
+        mock_contract_call.estimate_gas = AsyncMock(return_value=100_000)
+
+        params = await build_tx_params(
+            mock_w3,
+            "0xSender",
+            8453,
+            DEFAULT_GAS_EXECUTE,
+            gas_options=GasOptions(estimate_gas=True, force_estimate_gas=True, gas_buffer_percent=50),
+            contract_call=mock_contract_call,
+        )
+
+        assert params["gas"] == 150_000
+        mock_contract_call.estimate_gas.assert_called_once_with({"from": "0xSender"})
+
+    def test_optimistic_gas_covers_measured_costs(self) -> None:
+        """Precomputed gas should not undercut the measured costs in the spec."""
+        measured = {2: (93_000, 91_000), 5: (117_000, 170_000), 10: (163_000, 303_000), 20: (276_000, 567_000)}
+        for count, (create, execute) in measured.items():
+            assert compute_optimistic_gas("createSplitConfig", count) >= create
+            assert compute_optimistic_gas("executeSplit", count) >= execute
+        assert compute_optimistic_gas("transfer", 2) is None
+
+    @pytest.mark.asyncio
+    async def test_reads_run_concurrently(self) -> None:
+        """Nonce, gas estimate and cached fees should be fetched in parallel."""
+        started = 0
+        all_started = asyncio.Event()
+
+        async def read(value: object) -> object:
+            nonlocal started
+            started += 1
+            if started == 3:
+                all_started.set()
+            # Deadlocks (and times out) if the reads are awaited one by one
+            await all_started.wait()
+            return value
+
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count = lambda _: read(7)
+        mock_contract_call = MagicMock()
+        mock_contract_call.estimate_gas = lambda _: read(100_000)
+        fees = MagicMock()
+        fees.fees = lambda: read((3, 1))
+
+        async with asyncio.timeout(1):
+            params = await build_tx_params(
+                mock_w3,
+                "0xSender",
+                8453,
+                DEFAULT_GAS_EXECUTE,
+                gas_options=GasOptions(estimate_gas=True),
+                contract_call=mock_contract_call,
+                fees=fees,
+            )
+
+        assert (params["nonce"], params["gas"]) == (7, 120_000)
+        assert (params["maxFeePerGas"], params["maxPriorityFeePerGas"]) == (3, 1)
+
 
 class TestEIP1559Params:
     """Tests for EIP-1559 transaction parameters."""
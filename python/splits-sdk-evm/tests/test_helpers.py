@@ -1,19 +1,57 @@
 """Unit tests for Cascade Splits EVM SDK."""
 
+import gc
+import importlib
+import json
+import subprocess
+import sys
+import weakref
+from unittest.mock import patch
+
 import pytest
+from conftest import SNAPSHOT_AUTHORITY, SNAPSHOT_RECIPIENT, SNAPSHOT_SPLIT, aggregate3_result, snapshot_responses
+from eth_abi import encode
+from eth_utils import is_checksum_address
+from eth_utils.abi import event_abi_to_log_topic
+from hexbytes import HexBytes
 from pydantic import ValidationError
+from web3 import Web3
+from web3._utils.encoding import to_json
+from web3.datastructures import AttributeDict
 
 from cascade_splits_evm import (
+    SPLIT_CONFIG_IMPL_ABI,
+    SPLIT_FACTORY_ADDRESSES,
     SUPPORTED_CHAIN_IDS,
+    USDC_ADDRESSES,
     ChainNotSupportedError,
     EvmRecipient,
     Recipient,
+    SplitCache,
+    SplitConfig,
+    SplitSnapshot,
+    _codec,
+    compute_split_address,
+    get_split_balance,
+    get_split_config,
     get_split_factory_address,
+    get_split_snapshot,
     get_usdc_address,
+    is_cascade_split,
     is_supported_chain,
     to_evm_recipient,
     to_evm_recipients,
 )
+from cascade_splits_evm.abi import EVENT_TOPICS, SPLIT_FACTORY_ABI
+from cascade_splits_evm.constants import MULTICALL3_ADDRESS
+from cascade_splits_evm.helpers import (
+    _contract,
+    _created_split_address,
+    _encoded_transaction,
+    _recipient_tuples,
+    multicall,
+    normalize_unique_id,
+)
 
 
 class TestConstants:
@@ -57,6 +95,23 @@ class TestConstants:
         assert 84532 in SUPPORTED_CHAIN_IDS
         assert len(SUPPORTED_CHAIN_IDS) == 2
 
+    def test_address_maps_are_read_only(self) -> None:
+        """Address maps reject writes, so a stray assignment can't redirect transactions."""
+        for addresses in (SPLIT_FACTORY_ADDRESSES, USDC_ADDRESSES):
+            with pytest.raises(TypeError):
+                addresses[1] = addresses[8453]  # type: ignore[index]
+        assert set(SPLIT_FACTORY_ADDRESSES) == SUPPORTED_CHAIN_IDS
+
+    def test_addresses_are_stored_checksummed(self) -> None:
+        """Lookups return addresses as-is, so every constant must already be EIP-55 checksummed."""
+        addresses = [
+            *SPLIT_FACTORY_ADDRESSES.values(),
+            *USDC_ADDRESSES.values(),
+            MULTICALL3_ADDRESS,
+        ]
+
+        assert all(is_checksum_address(address) for address in addresses)
+
 
 class TestRecipientConversion:
     """Tests for recipient conversion utilities."""
@@ -123,6 +178,24 @@ class TestRecipientConversion:
         assert total == 9900
 
 
+class TestNormalizeUniqueId:
+    """Tests for unique_id padding."""
+
+    def test_pads_short_ids(self) -> None:
+        """Short ids should be right-padded with zero bytes."""
+        assert normalize_unique_id(b"abc") == b"abc" + b"\x00" * 29
+
+    def test_full_ids_are_not_copied(self) -> None:
+        """A 32-byte id should be returned as-is, without a new allocation."""
+        unique_id = bytes(range(32))
+        assert normalize_unique_id(unique_id) is unique_id
+
+    def test_rejects_long_ids(self) -> None:
+        """Ids over 32 bytes should be rejected rather than truncated."""
+        with pytest.raises(ValueError, match="32 bytes"):
+            normalize_unique_id(b"x" * 33)
+
+
 class TestTypes:
     """Tests for Pydantic models."""
 
@@ -153,5 +226,430 @@ class TestTypes:
             Recipient(address="0xTest", share=101)  # Too high
 
 
+class TestMulticall:
+    """Tests for Multicall3 read batching."""
+
+    SPLIT = "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"
+
+    def test_multicall_decodes_results_in_one_call(self) -> None:
+        """Sub-call results are decoded per function, failures become None."""
+        w3 = Web3()
+        contract = w3.eth.contract(address=self.SPLIT, abi=SPLIT_CONFIG_IMPL_ABI)
+        alice = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+        response = encode(
+            ["(bool,bytes)[]"],
+            [
+                [
+                    (True, encode(["bool"], [True])),
+                    (True, encode(["(address,uint16)[]"], [[(alice, 9900)]])),
+                    (False, b""),
+                ]
+            ],
+        )
+
+        with patch.object(w3.eth, "call", return_value=response) as mock_call:
+            is_valid, recipients, balance = multicall(
+                w3,
+                [
+                    contract.functions.isCascadeSplitConfig(),
+                    contract.functions.getRecipients(),
+                    contract.functions.getBalance(),
+                ],
+            )
+
+        mock_call.assert_called_once()
+        assert is_valid is True
+        assert recipients == ((alice.lower(), 9900),)
+        assert balance is None
+
+    def test_multicall_empty_return_data_is_none(self) -> None:
+        """Calls to addresses without code return empty data and decode to None."""
+        w3 = Web3()
+        contract = w3.eth.contract(address=self.SPLIT, abi=SPLIT_CONFIG_IMPL_ABI)
+        response = encode(["(bool,bytes)[]"], [[(True, b"")]])
+
+        with patch.object(w3.eth, "call", return_value=response):
+            assert multicall(w3, [contract.functions.isCascadeSplitConfig()]) == [None]
+
+
+class TestPreEncodedViews:
+    """Tests for zero-argument view calls sent with pre-encoded selectors."""
+
+    SPLIT = "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"
+
+    def test_view_call_sends_constant_selector(self) -> None:
+        """Calldata should be the 4-byte selector, decoded with the ABI output type."""
+        w3 = Web3()
+
+        with patch.object(w3.eth, "call", return_value=encode(["uint256"], [1_000_000])) as mock_call:
+            balance = get_split_balance(w3, self.SPLIT)
+
+        assert balance == 1_000_000
+        mock_call.assert_called_once_with({"to": self.SPLIT, "data": Web3.keccak(text="getBalance()")[:4]})
+
+    def test_is_cascade_split_false_for_empty_code(self) -> None:
+        """An address without code returns empty data, which is not a split."""
+        w3 = Web3()
+
+        with patch.object(w3.eth, "call", return_value=b""):
+            assert is_cascade_split(w3, self.SPLIT) is False
+
+    def test_config_falls_back_to_batch_without_multicall3(self) -> None:
+        """Empty Multicall3 return data (no contract) should fall back to a batch of direct eth_calls."""
+        w3 = Web3()
+
+        with (
+            patch.object(w3.eth, "call", return_value=b""),
+            patch.object(w3.provider, "make_batch_request", return_value=snapshot_responses()[:5]) as mock_batch,
+        ):
+            config = get_split_config(w3, SNAPSHOT_SPLIT)
+
+        (requests,), _ = mock_batch.call_args
+        assert [params[0]["to"] for _, params in requests] == [SNAPSHOT_SPLIT] * 5
+        assert config is not None
+        assert config.authority == SNAPSHOT_AUTHORITY
+
+    def test_config_with_failed_sub_read_is_none(self) -> None:
+        """A valid split whose field reads failed should give None, not raise."""
+        w3 = Web3()
+
+        with patch.object(
+            w3.eth, "call", return_value=aggregate3_result(encode(["bool"], [True]), None, None, None, None)
+        ):
+            assert get_split_config(w3, SNAPSHOT_SPLIT) is None
+
+    def test_failed_split_check_is_not_cached_as_non_split(self) -> None:
+        """A failed isCascadeSplitConfig read is unknown: nothing should be cached."""
+        w3 = Web3()
+        cache = SplitCache()
+
+        with patch.object(w3.eth, "call", return_value=aggregate3_result(None, None, None, None, None)):
+            assert get_split_config(w3, SNAPSHOT_SPLIT, cache) is None
+        with patch.object(w3.eth, "call", side_effect=ConnectionError("rate limited")):
+            assert is_cascade_split(w3, SNAPSHOT_SPLIT, cache) is False
+
+        assert len(cache) == 0
+
+    def test_event_topics_match_abi(self) -> None:
+        """Precomputed topic0 hashes should match the event ABIs."""
+        events = [e for e in SPLIT_FACTORY_ABI + SPLIT_CONFIG_IMPL_ABI if e["type"] == "event"]
+
+        assert {e["name"]: event_abi_to_log_topic(e) for e in events} == EVENT_TOPICS
+
+    def test_created_split_address_from_receipt_log(self) -> None:
+        """The indexed split address is read from the SplitConfigCreated log."""
+        other = {"topics": [HexBytes(EVENT_TOPICS["SplitExecuted"])]}
+        created = {
+            "topics": [
+                HexBytes(EVENT_TOPICS["SplitConfigCreated"]),
+                HexBytes(b"\x00" * 12 + bytes.fromhex(self.SPLIT[2:])),
+            ]
+        }
+
+        assert _created_split_address({"logs": [other, created]}, "0xPredicted") == self.SPLIT
+        assert _created_split_address({"logs": [other]}, "0xPredicted") == "0xPredicted"
+
+
+class TestSplitCache:
+    """Tests for memoized split metadata."""
+
+    SPLIT = "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"
+
+    def test_positive_result_is_reused(self) -> None:
+        """A confirmed split should not be checked again."""
+        w3 = Web3()
+        cache = SplitCache()
+
+        with patch.object(w3.eth, "call", return_value=encode(["bool"], [True])) as mock_call:
+            assert is_cascade_split(w3, self.SPLIT, cache=cache) is True
+            assert is_cascade_split(w3, self.SPLIT.lower(), cache=cache) is True
+
+        mock_call.assert_called_once()
+
+    def test_negative_result_expires(self) -> None:
+        """Non-splits are only remembered for the negative TTL."""
+        cache = SplitCache(negative_ttl=60)
+
+        with patch("cascade_splits_evm.split_cache.time.monotonic", side_effect=[0.0, 30.0, 61.0]):
+            cache.set(self.SPLIT, False)
+            assert cache.get(self.SPLIT) is False
+            assert cache.get(self.SPLIT) is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """The cache should stay within max_size, dropping the oldest entry."""
+        cache = SplitCache(max_size=2)
+        cache.set("0xa", True)
+        cache.set("0xb", True)
+        cache.get("0xa")
+        cache.set("0xc", True)
+
+        assert cache.get("0xb") is None
+        assert cache.get("0xa") is True
+        assert cache.get("0xc") is True
+
+    def test_config_marks_split_and_is_kept(self) -> None:
+        """A cached config should answer is_split and survive later positive checks."""
+        cache = SplitCache()
+        config = SplitConfig(
+            authority=self.SPLIT,
+            token=self.SPLIT,
+            unique_id=b"\x00" * 32,
+            recipients=[EvmRecipient(addr=self.SPLIT, percentage_bps=9900)],
+        )
+
+        cache.set_config(self.SPLIT, config)
+        cache.set(self.SPLIT.lower(), True)
+
+        assert cache.get(self.SPLIT) is True
+        assert cache.get_config(self.SPLIT) == config
+
+
+class TestSplitSnapshot:
+    """Tests for batched split snapshots."""
+
+    def test_snapshot_reads_everything_in_one_batch(self) -> None:
+        """All views should go out as one batch of eth_calls and decode into a SplitSnapshot."""
+        w3 = Web3()
+
+        with patch.object(w3.provider, "make_batch_request", return_value=snapshot_responses()) as mock_batch:
+            snapshot = get_split_snapshot(w3, SNAPSHOT_SPLIT)
+
+        (requests,), _ = mock_batch.call_args
+        assert [method for method, _ in requests] == ["eth_call"] * 10
+        assert requests[5][1][0] == {"to": SNAPSHOT_SPLIT, "data": "0x" + Web3.keccak(text="getBalance()")[:4].hex()}
+        assert snapshot.is_split is True
+        assert snapshot.config is not None
+        assert snapshot.config.recipients == [EvmRecipient(addr=SNAPSHOT_RECIPIENT, percentage_bps=9900)]
+        assert snapshot.balance == 5_000_000
+        assert snapshot.has_pending_funds is True
+        assert snapshot.preview is not None
+        assert snapshot.preview.protocol_fee == 50_000
+
+    def test_failed_reads_are_none(self) -> None:
+        """A reverted sub-call should only blank its own field."""
+        w3 = Web3()
+        responses = snapshot_responses()
+        responses[9] = {"jsonrpc": "2.0", "id": 9, "error": {"code": 3, "message": "execution reverted"}}
+
+        with patch.object(w3.provider, "make_batch_request", return_value=responses):
+            snapshot = get_split_snapshot(w3, SNAPSHOT_SPLIT)
+
+        assert snapshot.preview is None
+        assert snapshot.balance == 5_000_000
+
+    def test_non_split_has_no_details(self) -> None:
+        """Addresses that are not splits should only report is_split=False."""
+        w3 = Web3()
+
+        with patch.object(w3.provider, "make_batch_request", return_value=snapshot_responses(is_split=False)):
+            snapshot = get_split_snapshot(w3, SNAPSHOT_SPLIT)
+
+        assert snapshot == SplitSnapshot(is_split=False)
+
+    def test_failed_split_check_is_unknown(self) -> None:
+        """A failed isCascadeSplitConfig read should give is_split=None, not False."""
+        w3 = Web3()
+        responses = snapshot_responses()
+        responses[0] = {"jsonrpc": "2.0", "id": 0, "error": {"code": -32005, "message": "rate limited"}}
+
+        with patch.object(w3.provider, "make_batch_request", return_value=responses):
+            snapshot = get_split_snapshot(w3, SNAPSHOT_SPLIT)
+
+        assert snapshot == SplitSnapshot(is_split=None)
+
+
+class TestComputeSplitAddress:
+    """Tests for local CREATE2 split address computation."""
+
+    FACTORY = "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"
+    IMPLEMENTATION = "0xF9ad695ecc76c4b8E13655365b318d54E4131EA6"
+    AUTHORITY = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+    TOKEN = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+    UNIQUE_ID = b"test-id".ljust(32, b"\x00")
+
+    def _compute(self, recipients: list[EvmRecipient]) -> str:
+        return compute_split_address(
+            self.FACTORY,
+            self.IMPLEMENTATION,
+            self.AUTHORITY,
+            self.TOKEN,
+            self.UNIQUE_ID,
+            recipients,
+        )
+
+    def test_address_matches_create2_of_clone_init_code(self) -> None:
+        """Address is keccak256(0xff ++ factory ++ salt ++ keccak256(init_code))[12:]."""
+        alice = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+        args = (
+            bytes.fromhex(self.FACTORY[2:] + self.AUTHORITY[2:] + self.TOKEN[2:])
+            + self.UNIQUE_ID
+            + bytes.fromhex(alice[2:])
+            + (9900).to_bytes(2, "big")
+        )
+        init_code = (
+            bytes.fromhex(f"61{len(args) + 0x2D:04x}3d81600a3d39f3363d3d373d3d3d363d73")
+            + bytes.fromhex(self.IMPLEMENTATION[2:])
+            + bytes.fromhex("5af43d82803e903d91602b57fd5bf3")
+            + args
+        )
+        salt = Web3.keccak(encode(["address", "address", "bytes32"], [self.AUTHORITY, self.TOKEN, self.UNIQUE_ID]))
+        expected = Web3.keccak(b"\xff" + bytes.fromhex(self.FACTORY[2:]) + salt + Web3.keccak(init_code))[12:]
+
+        address = self._compute([EvmRecipient(addr=alice, percentage_bps=9900)])
+
+        assert address == Web3.to_checksum_address(expected)
+
+    def test_address_depends_on_recipients(self) -> None:
+        """Recipients are part of the clone bytecode, so they change the address."""
+        alice = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+        bob = "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC"
+
+        one = self._compute([EvmRecipient(addr=alice, percentage_bps=9900)])
+        two = self._compute(
+            [EvmRecipient(addr=alice, percentage_bps=4950), EvmRecipient(addr=bob, percentage_bps=4950)]
+        )
+
+        assert one != two
+
+
+class TestContractCache:
+    """Tests for memoized contract instances."""
+
+    def test_contract_instance_is_reused(self) -> None:
+        """Same (w3, address) should return the same contract instance."""
+        w3 = Web3()
+        split = "0x946cd053514b1ab7829dd8fec85e0ade5550dcf7"
+
+        contract = _contract(w3, split)
+
+        assert _contract(w3, split) is contract
+        assert contract.address == "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"
+        assert _contract(Web3(), split) is not contract
+
+    def test_cache_does_not_keep_web3_alive(self) -> None:
+        """Cached contracts should be released with their Web3 instance."""
+        w3 = Web3()
+        _contract(w3, "0x946cd053514b1ab7829dd8fec85e0ade5550dcf7")
+        ref = weakref.ref(w3)
+
+        del w3
+        gc.collect()
+
+        assert ref() is None
+
+    def test_encoded_transaction_matches_build_transaction(self) -> None:
+        """Direct calldata encoding should produce the same transaction as web3's build_transaction."""
+        w3 = Web3()
+        recipients = _recipient_tuples([Recipient(address=SNAPSHOT_RECIPIENT, share=100)])
+        call = _contract(w3, SNAPSHOT_SPLIT, "factory").functions.createSplitConfig(
+            SNAPSHOT_AUTHORITY, SNAPSHOT_AUTHORITY, b"\x01" * 32, recipients
+        )
+        tx_params = {
+            "from": SNAPSHOT_AUTHORITY,
+            "chainId": 8453,
+            "nonce": 7,
+            "gas": 300_000,
+            "maxFeePerGas": 2 * 10**9,
+            "maxPriorityFeePerGas": 10**8,
+        }
+
+        assert _encoded_transaction(call, tx_params) == call.build_transaction(tx_params)
+        assert _encoded_transaction(call, {"from": SNAPSHOT_AUTHORITY, "gas": 300_000}) is None
+
+
+class TestFastCodec:
+    """Tests for the optional compiled codec switch."""
+
+    def test_fast_codec_is_opt_in(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without the env var, eth-abi / eth-utils are used."""
+        monkeypatch.delenv(_codec.FAST_CODEC_ENV, raising=False)
+
+        codec = importlib.reload(_codec)
+
+        assert codec.FAST_CODEC is False
+        assert codec.abi_decode.__module__.startswith("eth_abi")
+
+    def test_fast_codec_falls_back_when_not_installed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Enabling the switch without the extra installed keeps the pure-Python codec."""
+        monkeypatch.setenv(_codec.FAST_CODEC_ENV, "1")
+        monkeypatch.setitem(sys.modules, "faster_eth_abi", None)
+
+        codec = importlib.reload(_codec)
+
+        assert codec.FAST_CODEC is False
+        assert codec.abi_encode(["uint256"], [1]) == (1).to_bytes(32, "big")
+
+        monkeypatch.delenv(_codec.FAST_CODEC_ENV)
+        importlib.reload(_codec)
+
+    def test_json_decode_matches_stdlib_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """RPC responses decode the same with or without orjson installed."""
+        raw = b'{"jsonrpc":"2.0","id":1,"result":["0xabc",{"big":12345678901234567890}]}'
+        fast = _codec.json_decode(raw)
+
+        with monkeypatch.context() as m:
+            m.setitem(sys.modules, "orjson", None)
+            codec = importlib.reload(_codec)
+
+            assert codec.FAST_JSON is False
+            assert codec.json_decode(raw) == fast
+
+        importlib.reload(_codec)
+
+    def test_json_decode_keeps_integers_beyond_64_bits(self) -> None:
+        """Integers orjson would round to a float should decode exactly, as with the stdlib."""
+        raw = '{"jsonrpc":"2.0","id":1,"error":{"code":3,"data":123456789012345678901234567890}}'
+
+        assert _codec.json_decode(raw)["error"]["data"] == 123456789012345678901234567890
+        assert _codec.json_decode(raw.encode()) == json.loads(raw)
+
+    def test_json_encode_matches_web3_encoder(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Requests encode to the same JSON as web3's encoder, with or without orjson."""
+        params = [AttributeDict({"to": SNAPSHOT_SPLIT, "data": HexBytes("0x1234"), "value": 2**200}), "latest"]
+        expected = json.loads(to_json({"params": params}))
+
+        assert json.loads(_codec.json_encode({"params": params})) == expected
+
+        with monkeypatch.context() as m:
+            m.setitem(sys.modules, "orjson", None)
+            codec = importlib.reload(_codec)
+
+            assert json.loads(codec.json_encode({"params": params})) == expected
+
+        importlib.reload(_codec)
+
+
+class TestPackageImport:
+    """Tests for package import side effects."""
+
+    def test_import_is_quiet_without_global_warning_filter(self) -> None:
+        """web3's websockets deprecation warning is silenced only while web3 is imported."""
+        code = (
+            "import warnings, cascade_splits_evm; cascade_splits_evm.CascadeSplitsClient; "
+            "assert not any(f[1] and 'websockets' in f[1].pattern for f in warnings.filters)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-W", "error::DeprecationWarning", "-c", code],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_web3_is_imported_on_first_use(self) -> None:
+        """Constants and types load without web3; clients and helpers import it lazily."""
+        code = (
+            "import sys, cascade_splits_evm as c; "
+            "assert 'web3' not in sys.modules; "
+            "assert c.get_usdc_address(8453) and c.Recipient; "
+            "assert 'web3' not in sys.modules; "
+            "assert c.CascadeSplitsClient is sys.modules['cascade_splits_evm.client'].CascadeSplitsClient; "
+            "assert c.async_helpers is sys.modules['cascade_splits_evm.async_helpers']"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,185 @@
+"""Tests for local nonce tracking.
+
+These tests verify that nonces are fetched once, handed out sequentially,
+and resynced with the chain when a send reports a stale nonce.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from conftest import aggregate3_result
+from eth_abi import encode
+from web3.exceptions import Web3RPCError
+
+from cascade_splits_evm import AsyncNonceManager, EnsureParams, NonceManager, Recipient
+from cascade_splits_evm.async_helpers import send_transaction as async_send_transaction
+from cascade_splits_evm.ensure import ensure_split
+from cascade_splits_evm.execute import execute_split
+from cascade_splits_evm.helpers import send_transaction
+
+SENDER = "0x1234567890123456789012345678901234567890"
+FACTORY = "0x946Cd053514b1Ab7829dD8fEc85E0ade5550dcf7"
+SPLIT = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+
+def _create_mock_account() -> MagicMock:
+    mock_account = MagicMock()
+    mock_account.address = SENDER
+    return mock_account
+
+
+class TestNonceManager:
+    """Tests for the sync NonceManager."""
+
+    def test_nonce_fetched_once_then_incremented(self) -> None:
+        """Only the first reservation should hit the RPC (pending block)."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count.return_value = 7
+
+        nonces = NonceManager(mock_w3, SENDER)
+
+        assert [nonces.next_nonce() for _ in range(3)] == [7, 8, 9]
+        mock_w3.eth.get_transaction_count.assert_called_once_with(SENDER, "pending")
+
+    def test_reset_refetches_from_chain(self) -> None:
+        """After reset, the next reservation should resync with the node."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count.side_effect = [7, 12]
+
+        nonces = NonceManager(mock_w3, SENDER)
+        nonces.next_nonce()
+        nonces.reset()
+
+        assert nonces.next_nonce() == 12
+
+    def test_send_retries_once_on_nonce_too_low(self) -> None:
+        """A stale nonce error should resync and resend with the fresh nonce."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count.side_effect = [7, 9]
+        mock_w3.eth.send_raw_transaction.side_effect = [Web3RPCError("nonce too low"), b"\x01" * 32]
+        mock_call = MagicMock()
+        mock_call.build_transaction.side_effect = lambda params: params
+
+        nonces = NonceManager(mock_w3, SENDER)
+        send_transaction(mock_w3, _create_mock_account(), 8453, mock_call, 300_000, nonces=nonces)
+
+        sent_nonces = [c.args[0]["nonce"] for c in mock_call.build_transaction.call_args_list]
+        assert sent_nonces == [7, 9]
+        assert nonces.next_nonce() == 10
+
+    def test_send_does_not_retry_other_errors(self) -> None:
+        """Non-nonce failures should propagate and release the reserved nonce."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count.side_effect = [7, 7]
+        mock_w3.eth.send_raw_transaction.side_effect = Web3RPCError("insufficient funds")
+        mock_call = MagicMock()
+
+        nonces = NonceManager(mock_w3, SENDER)
+        with pytest.raises(Web3RPCError):
+            send_transaction(mock_w3, _create_mock_account(), 8453, mock_call, 300_000, nonces=nonces)
+
+        assert mock_w3.eth.send_raw_transaction.call_count == 1
+        assert nonces.next_nonce() == 7
+
+
+class TestAsyncNonceManager:
+    """Tests for the AsyncNonceManager."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reservations_are_distinct(self) -> None:
+        """Concurrent tasks should never receive the same nonce."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count = AsyncMock(return_value=3)
+
+        nonces = AsyncNonceManager(mock_w3, SENDER)
+        reserved = await asyncio.gather(*(nonces.next_nonce() for _ in range(5)))
+
+        assert sorted(reserved) == [3, 4, 5, 6, 7]
+        mock_w3.eth.get_transaction_count.assert_called_once_with(SENDER, "pending")
+
+    @pytest.mark.asyncio
+    async def test_send_retries_once_on_already_known(self) -> None:
+        """An 'already known' error should resync and resend once."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count = AsyncMock(side_effect=[3, 4])
+        mock_w3.eth.send_raw_transaction = AsyncMock(side_effect=[Web3RPCError("already known"), b"\x01" * 32])
+        mock_call = MagicMock()
+        mock_call.build_transaction = AsyncMock(side_effect=lambda params: params)
+
+        nonces = AsyncNonceManager(mock_w3, SENDER)
+        await async_send_transaction(mock_w3, _create_mock_account(), 8453, mock_call, 300_000, nonces=nonces)
+
+        sent_nonces = [c.args[0]["nonce"] for c in mock_call.build_transaction.call_args_list]
+        assert sent_nonces == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_standalone_ensure_reads_nonce_alongside_simulation(self) -> None:
+        """Without a nonce manager, ensure_split should fetch the nonce concurrently with the simulation."""
+        both_started = asyncio.Event()
+        started = 0
+
+        async def read(value: object) -> object:
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            # Deadlocks (and times out) if the reads are awaited one by one
+            await both_started.wait()
+            return value
+
+        mock_w3 = MagicMock()
+        mock_w3.eth.get_transaction_count = lambda address: read(9)
+        mock_w3.eth.send_raw_transaction = AsyncMock(return_value=b"\x01" * 32)
+        mock_call = MagicMock()
+        mock_call.call = lambda tx: read(SPLIT)
+        mock_call.build_transaction = AsyncMock(side_effect=lambda params: params)
+        mock_w3.eth.contract.return_value.return_value.functions.createSplitConfig.return_value = mock_call
+        account = _create_mock_account()
+        account.sign_transaction.return_value = MagicMock(raw_transaction=b"signed")
+
+        with patch("cascade_splits_evm.ensure.wait_for_receipt", AsyncMock(return_value={"status": 1, "logs": []})):
+            async with asyncio.timeout(1):
+                result = await ensure_split(
+                    mock_w3,
+                    account,
+                    FACTORY,
+                    EnsureParams(unique_id=b"id", recipients=[Recipient(address=SENDER, share=100)]),
+                    chain_id=8453,
+                )
+
+        assert (result.status, result.split) == ("CREATED", SPLIT)
+        assert mock_call.build_transaction.call_args.args[0]["nonce"] == 9
+
+    @pytest.mark.asyncio
+    async def test_standalone_execute_reads_chain_id_and_nonce_together(self) -> None:
+        """Once the pre-checks pass, the chain ID and nonce should be fetched concurrently."""
+        both_started = asyncio.Event()
+        started = 0
+
+        async def read(value: object) -> object:
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            await both_started.wait()
+            return value
+
+        checks = aggregate3_result(encode(["bool"], [True]), encode(["uint256"], [1]), encode(["bool"], [True]), b"")
+        mock_w3 = MagicMock()
+        mock_w3.eth.call = AsyncMock(return_value=checks)
+        type(mock_w3.eth).chain_id = property(lambda _: read(8453))
+        mock_w3.eth.get_transaction_count = lambda address: read(4)
+        mock_w3.eth.send_raw_transaction = AsyncMock(return_value=b"\x01" * 32)
+        mock_call = mock_w3.eth.contract.return_value.return_value.functions.executeSplit.return_value
+        mock_call.build_transaction = AsyncMock(side_effect=lambda params: params)
+        account = _create_mock_account()
+        account.sign_transaction.return_value = MagicMock(raw_transaction=b"signed")
+
+        with patch("cascade_splits_evm.execute.wait_for_receipt", AsyncMock()):
+            async with asyncio.timeout(1):
+                result = await execute_split(mock_w3, account, SPLIT)
+
+        assert result.status == "EXECUTED"
+        tx_params = mock_call.build_transaction.call_args.args[0]
+        assert (tx_params["chainId"], tx_params["nonce"]) == (8453, 4)
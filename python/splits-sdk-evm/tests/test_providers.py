@@ -0,0 +1,104 @@
+"""Tests for multi-endpoint failover providers."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import requests
+
+from cascade_splits_evm import AsyncFailoverHTTPProvider, FailoverHTTPProvider
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(response=response)
+
+
+def _endpoints(count: int) -> list[MagicMock]:
+    endpoints = []
+    for i in range(count):
+        endpoint = MagicMock()
+        endpoint.make_request.return_value = {"result": i}
+        endpoints.append(endpoint)
+    return endpoints
+
+
+class TestFailoverHTTPProvider:
+    """Tests for the sync failover provider."""
+
+    def test_requires_an_endpoint(self) -> None:
+        """An empty endpoint list should be rejected."""
+        with pytest.raises(ValueError):
+            FailoverHTTPProvider([])
+
+    def test_reads_round_robin(self) -> None:
+        """Read calls should rotate across endpoints."""
+        provider = FailoverHTTPProvider(_endpoints(2))
+
+        results = [provider.make_request("eth_call", [])["result"] for _ in range(4)]
+
+        assert results == [0, 1, 0, 1]
+
+    def test_sends_prefer_primary(self) -> None:
+        """Sends and nonce lookups should always start at the primary endpoint."""
+        provider = FailoverHTTPProvider(_endpoints(2))
+        provider.make_request("eth_call", [])
+
+        assert provider.make_request("eth_sendRawTransaction", ["0x"])["result"] == 0
+        assert provider.make_request("eth_getTransactionCount", ["0x", "pending"])["result"] == 0
+
+    def test_fails_over_on_endpoint_errors(self) -> None:
+        """Connection errors and 5xx responses should move to the next endpoint."""
+        endpoints = _endpoints(3)
+        endpoints[0].make_request.side_effect = requests.ConnectionError()
+        endpoints[1].make_request.side_effect = _http_error(503)
+        provider = FailoverHTTPProvider(endpoints)
+
+        assert provider.make_request("eth_sendRawTransaction", ["0x"])["result"] == 2
+
+    def test_bad_request_is_not_retried(self) -> None:
+        """A 400 response is the request's fault and should surface immediately."""
+        endpoints = _endpoints(2)
+        endpoints[0].make_request.side_effect = _http_error(400)
+        provider = FailoverHTTPProvider(endpoints)
+
+        with pytest.raises(requests.HTTPError):
+            provider.make_request("eth_sendRawTransaction", ["0x"])
+        endpoints[1].make_request.assert_not_called()
+
+    def test_raises_last_error_when_all_fail(self) -> None:
+        """When every endpoint fails the last error should be raised."""
+        endpoints = _endpoints(2)
+        for endpoint in endpoints:
+            endpoint.make_request.side_effect = requests.Timeout()
+        provider = FailoverHTTPProvider(endpoints)
+
+        with pytest.raises(requests.Timeout):
+            provider.make_request("eth_call", [])
+
+
+class TestAsyncFailoverHTTPProvider:
+    """Tests for the async failover provider."""
+
+    async def test_fails_over_and_rotates(self) -> None:
+        """Async reads should rotate and skip endpoints that can't be reached."""
+        endpoints = [MagicMock(), MagicMock()]
+        endpoints[0].make_request = AsyncMock(side_effect=requests.ConnectionError())
+        endpoints[1].make_request = AsyncMock(return_value={"result": 1})
+        provider = AsyncFailoverHTTPProvider(endpoints)
+
+        assert (await provider.make_request("eth_call", []))["result"] == 1
+        assert (await provider.make_request("eth_call", []))["result"] == 1
+        assert endpoints[0].make_request.await_count == 1
+
+    async def test_disconnect_closes_all_endpoints(self) -> None:
+        """disconnect() should close every endpoint's session."""
+        endpoints = [MagicMock(), MagicMock()]
+        for endpoint in endpoints:
+            endpoint.disconnect = AsyncMock()
+        provider = AsyncFailoverHTTPProvider(endpoints)
+
+        await provider.disconnect()
+
+        for endpoint in endpoints:
+            endpoint.disconnect.assert_awaited_once()
@@ -45,7 +45,7 @@ class TestRecipientCountValidation:
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
         with patch(
-            "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+            "cascade_splits_evm.ensure._to_checksum_address",
             side_effect=lambda x: x,
         ):
             result = await ensure_split(
@@ -79,7 +79,7 @@ class TestRecipientCountValidation:
         recipients[-1] = Recipient(address=f"0x{20:040x}", share=20)  # 20 * 4 + 20 = 100
 
         with patch(
-            "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+            "cascade_splits_evm.ensure._to_checksum_address",
             side_effect=lambda x: x,
         ):
             result = await ensure_split(
@@ -101,7 +101,6 @@ class TestRecipientCountValidation:
     async def test_ensure_accepts_single_recipient(self) -> None:
         """Single recipient with 100% share should work."""
         mock_w3 = _create_mock_w3()
-        mock_w3.eth.get_code = AsyncMock(return_value=b"")  # Not deployed yet
         mock_w3.eth.get_transaction_count = AsyncMock(return_value=0)
         mock_w3.eth.send_raw_transaction = AsyncMock(return_value=b"0x" + b"ab" * 32)
         mock_w3.eth.wait_for_transaction_receipt = AsyncMock(return_value={"status": 1})
@@ -111,19 +110,19 @@ class TestRecipientCountValidation:
         mock_account.sign_transaction.return_value = MagicMock(raw_transaction=b"signed")
 
         mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.return_value.call = AsyncMock(return_value="0xPredictedSplit")
+        mock_factory.functions.createSplitConfig.return_value.call = AsyncMock(return_value="0xPredictedSplit")
         mock_factory.functions.createSplitConfig.return_value.build_transaction = AsyncMock(
             return_value={"gas": 300000}
         )
-        mock_w3.eth.contract.return_value = mock_factory
+        mock_w3.eth.contract.return_value.return_value = mock_factory
 
         with (
             patch(
-                "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.ensure._to_checksum_address",
                 side_effect=lambda x: x,
             ),
             patch(
-                "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.async_helpers._to_checksum_address",
                 side_effect=lambda x: x,
             ),
         ):
@@ -146,7 +145,6 @@ class TestRecipientCountValidation:
     async def test_ensure_accepts_max_recipients(self) -> None:
         """Exactly 20 recipients should work."""
         mock_w3 = _create_mock_w3()
-        mock_w3.eth.get_code = AsyncMock(return_value=b"")
         mock_w3.eth.get_transaction_count = AsyncMock(return_value=0)
         mock_w3.eth.send_raw_transaction = AsyncMock(return_value=b"0x" + b"ab" * 32)
         mock_w3.eth.wait_for_transaction_receipt = AsyncMock(return_value={"status": 1})
@@ -156,22 +154,22 @@ class TestRecipientCountValidation:
         mock_account.sign_transaction.return_value = MagicMock(raw_transaction=b"signed")
 
         mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.return_value.call = AsyncMock(return_value="0xPredictedSplit")
+        mock_factory.functions.createSplitConfig.return_value.call = AsyncMock(return_value="0xPredictedSplit")
         mock_factory.functions.createSplitConfig.return_value.build_transaction = AsyncMock(
             return_value={"gas": 300000}
         )
-        mock_w3.eth.contract.return_value = mock_factory
+        mock_w3.eth.contract.return_value.return_value = mock_factory
 
         # Create exactly 20 recipients: 19 with 5% each + 1 with 5% = 100%
         recipients = [Recipient(address=f"0x{i:040x}", share=5) for i in range(20)]
 
         with (
             patch(
-                "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.ensure._to_checksum_address",
                 side_effect=lambda x: x,
             ),
             patch(
-                "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.async_helpers._to_checksum_address",
                 side_effect=lambda x: x,
             ),
         ):
@@ -199,7 +197,7 @@ class TestShareValidation:
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
         with patch(
-            "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+            "cascade_splits_evm.ensure._to_checksum_address",
             side_effect=lambda x: x,
         ):
             result = await ensure_split(
@@ -228,7 +226,7 @@ class TestShareValidation:
         mock_account.address = "0x1234567890123456789012345678901234567890"
 
         with patch(
-            "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+            "cascade_splits_evm.ensure._to_checksum_address",
             side_effect=lambda x: x,
         ):
             result = await ensure_split(
@@ -249,13 +247,12 @@ class TestShareValidation:
 
 
 class TestUniqueIdHandling:
-    """Tests for unique_id padding and truncation."""
+    """Tests for unique_id padding and length validation."""
 
     @pytest.mark.asyncio
     async def test_short_unique_id_is_padded(self) -> None:
         """Short unique_id should be padded to 32 bytes."""
         mock_w3 = _create_mock_w3()
-        mock_w3.eth.get_code = AsyncMock(return_value=b"")
         mock_w3.eth.get_transaction_count = AsyncMock(return_value=0)
         mock_w3.eth.send_raw_transaction = AsyncMock(return_value=b"0x" + b"ab" * 32)
         mock_w3.eth.wait_for_transaction_receipt = AsyncMock(return_value={"status": 1})
@@ -266,28 +263,26 @@ class TestUniqueIdHandling:
 
         captured_unique_id = None
 
-        def capture_predict_call(*args):
+        def capture_create_call(*args):
             nonlocal captured_unique_id
-            # args[2] is uniqueId in predictSplitAddress(authority, token, uniqueId, recipients)
+            # args[2] is uniqueId in createSplitConfig(authority, token, uniqueId, recipients)
             captured_unique_id = args[2]
             mock_result = MagicMock()
             mock_result.call = AsyncMock(return_value="0xPredictedSplit")
+            mock_result.build_transaction = AsyncMock(return_value={"gas": 300000})
             return mock_result
 
         mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.side_effect = capture_predict_call
-        mock_factory.functions.createSplitConfig.return_value.build_transaction = AsyncMock(
-            return_value={"gas": 300000}
-        )
-        mock_w3.eth.contract.return_value = mock_factory
+        mock_factory.functions.createSplitConfig.side_effect = capture_create_call
+        mock_w3.eth.contract.return_value.return_value = mock_factory
 
         with (
             patch(
-                "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.ensure._to_checksum_address",
                 side_effect=lambda x: x,
             ),
             patch(
-                "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.async_helpers._to_checksum_address",
                 side_effect=lambda x: x,
             ),
         ):
@@ -312,46 +307,18 @@ class TestUniqueIdHandling:
         assert captured_unique_id == b"short" + b"\x00" * 27
 
     @pytest.mark.asyncio
-    async def test_long_unique_id_is_truncated(self) -> None:
-        """Long unique_id should be truncated to 32 bytes."""
+    async def test_long_unique_id_is_rejected(self) -> None:
+        """Unique_id longer than 32 bytes should fail instead of being truncated."""
         mock_w3 = _create_mock_w3()
-        mock_w3.eth.get_code = AsyncMock(return_value=b"")
-        mock_w3.eth.get_transaction_count = AsyncMock(return_value=0)
-        mock_w3.eth.send_raw_transaction = AsyncMock(return_value=b"0x" + b"ab" * 32)
-        mock_w3.eth.wait_for_transaction_receipt = AsyncMock(return_value={"status": 1})
-
         mock_account = MagicMock()
         mock_account.address = "0x1234567890123456789012345678901234567890"
-        mock_account.sign_transaction.return_value = MagicMock(raw_transaction=b"signed")
-
-        captured_unique_id = None
-
-        def capture_predict_call(*args):
-            nonlocal captured_unique_id
-            captured_unique_id = args[2]
-            mock_result = MagicMock()
-            mock_result.call = AsyncMock(return_value="0xPredictedSplit")
-            return mock_result
-
-        mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.side_effect = capture_predict_call
-        mock_factory.functions.createSplitConfig.return_value.build_transaction = AsyncMock(
-            return_value={"gas": 300000}
-        )
-        mock_w3.eth.contract.return_value = mock_factory
 
         long_id = b"this-is-a-very-long-unique-id-that-exceeds-32-bytes"
         assert len(long_id) > 32
 
-        with (
-            patch(
-                "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
-                side_effect=lambda x: x,
-            ),
-            patch(
-                "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
-                side_effect=lambda x: x,
-            ),
+        with patch(
+            "cascade_splits_evm.ensure._to_checksum_address",
+            side_effect=lambda x: x,
         ):
             result = await ensure_split(
                 mock_w3,
@@ -366,17 +333,15 @@ class TestUniqueIdHandling:
                 ),
             )
 
-        assert result.status == "CREATED"
-        # Verify the unique_id was truncated to 32 bytes
-        assert captured_unique_id is not None
-        assert len(captured_unique_id) == 32
-        assert captured_unique_id == long_id[:32]
+        assert result.status == "FAILED"
+        assert result.message is not None
+        assert "32 bytes" in result.message
+        mock_w3.eth.contract.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_exact_32_byte_unique_id_unchanged(self) -> None:
         """Exactly 32-byte unique_id should be used as-is."""
         mock_w3 = _create_mock_w3()
-        mock_w3.eth.get_code = AsyncMock(return_value=b"")
         mock_w3.eth.get_transaction_count = AsyncMock(return_value=0)
         mock_w3.eth.send_raw_transaction = AsyncMock(return_value=b"0x" + b"ab" * 32)
         mock_w3.eth.wait_for_transaction_receipt = AsyncMock(return_value={"status": 1})
@@ -387,30 +352,28 @@ class TestUniqueIdHandling:
 
         captured_unique_id = None
 
-        def capture_predict_call(*args):
+        def capture_create_call(*args):
             nonlocal captured_unique_id
             captured_unique_id = args[2]
             mock_result = MagicMock()
             mock_result.call = AsyncMock(return_value="0xPredictedSplit")
+            mock_result.build_transaction = AsyncMock(return_value={"gas": 300000})
             return mock_result
 
         mock_factory = MagicMock()
-        mock_factory.functions.predictSplitAddress.side_effect = capture_predict_call
-        mock_factory.functions.createSplitConfig.return_value.build_transaction = AsyncMock(
-            return_value={"gas": 300000}
-        )
-        mock_w3.eth.contract.return_value = mock_factory
+        mock_factory.functions.createSplitConfig.side_effect = capture_create_call
+        mock_w3.eth.contract.return_value.return_value = mock_factory
 
         exact_32 = b"exactly-32-bytes-long-id-here!!!"  # 32 bytes
         assert len(exact_32) == 32
 
         with (
             patch(
-                "cascade_splits_evm.ensure.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.ensure._to_checksum_address",
                 side_effect=lambda x: x,
             ),
             patch(
-                "cascade_splits_evm.async_helpers.AsyncWeb3.to_checksum_address",
+                "cascade_splits_evm.async_helpers._to_checksum_address",
                 side_effect=lambda x: x,
             ),
         ):